@@ -0,0 +1,490 @@
+"""
+Async Service - asyncio Facade for the Contact Book and To-Do List
+This module lets an asyncio application use ContactManager and TodoManager
+without blocking its event loop. Writes are queued to one writer task,
+which applies them in batches on a worker thread (one task-file save per
+batch) and builds a new immutable snapshot there; the event loop only
+swaps it in. Reads never wait for writes: they are answered from the
+latest published snapshot.
+
+Usage:
+    async with AsyncService("data") as service:
+        ok, message = await service.add_contact("Ram Sharma", "9841000000",
+                                                "ram@example.com", "Kathmandu")
+        task = await service.add_task("Call Ram")
+        matches = await service.search_contacts("ram")
+"""
+
+import asyncio
+import bisect
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Any, Callable, List, Mapping, NamedTuple, Optional
+
+# The projects are flat script folders; make their modules importable
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for project in ('contact_book', 'to_do_list'):
+    project_path = os.path.join(ROOT, project)
+    if project_path not in sys.path:
+        sys.path.insert(0, project_path)
+
+from contact_manager import ContactManager
+from todo_core import TodoManager
+
+# Most writes applied (and task saves shared) by one writer batch
+MAX_BATCH = 512
+
+# Contacts are published as read-only mappings, so existing code that
+# reads contact['name'] works on them unchanged
+ContactRecord = Mapping[str, str]
+
+
+class TaskRecord(NamedTuple):
+    """Immutable copy of a Task"""
+    id: int
+    title: str
+    completed: bool
+    created_at: str
+    updated_at: str
+
+
+class SearchText(NamedTuple):
+    """Search texts of all contacts joined into one string, one line per contact"""
+    text: str
+    offsets: tuple   # start of each contact's line, plus the end of the text
+    contacts: tuple  # contact records, in line order
+
+
+class Snapshot(NamedTuple):
+    """Consistent read-only view of both data sets after some write batch"""
+    version: int
+    contacts: Mapping[int, ContactRecord]  # record number -> contact, in list order
+    phones: Mapping[str, int]              # normalized phone -> record number
+    emails: Mapping[str, int]              # normalized email -> record number
+    search: SearchText
+    tasks: Mapping[int, TaskRecord]        # task ID -> task, in insertion order
+    completed: int                         # number of completed tasks
+
+
+class WriteRequest(NamedTuple):
+    """One queued write: apply runs on the writer thread"""
+    apply: Callable
+    args: tuple
+    failed: Any               # result reported if the task save fails
+    future: asyncio.Future
+
+
+def contact_record(contact: dict) -> ContactRecord:
+    """Freeze a contact dict"""
+    return MappingProxyType(dict(contact))
+
+
+def build_search_text(contacts: Mapping[int, ContactRecord]) -> SearchText:
+    """Join the lowercase names and phone digits of contacts for substring search"""
+    lines = ["%s\x00%s\n" % ContactManager.search_texts(contact) for contact in contacts.values()]
+    offsets = [0]
+    for line in lines:
+        offsets.append(offsets[-1] + len(line))
+    return SearchText(''.join(lines), tuple(offsets), tuple(contacts.values()))
+
+
+def task_record(task) -> TaskRecord:
+    """Freeze a Task"""
+    return TaskRecord(task.id, task.title, task.completed, task.created_at, task.updated_at)
+
+
+class AsyncService:
+    """
+    asyncio facade over one address book and one task list
+
+    All writes go through a single writer task, so the managers are only
+    ever touched by one thread. Each batch of writes is applied inside a
+    TodoManager.batch() transaction; the address book uses write-behind
+    saves. Read coroutines return data from the current Snapshot.
+    """
+
+    def __init__(self, directory: str, contacts_file: str = "contacts.json",
+                 tasks_file: str = "tasks.json", max_batch: int = MAX_BATCH):
+        """
+        directory: folder holding the data files (created if missing)
+        contacts_file / tasks_file: file names inside directory
+        max_batch: most queued writes applied together
+        """
+        self.contacts_path = os.path.join(directory, contacts_file)
+        self.tasks_path = os.path.join(directory, tasks_file)
+        self.directory = directory
+        self.max_batch = max_batch
+
+        self.contacts: Optional[ContactManager] = None
+        self.todo: Optional[TodoManager] = None
+        self.snapshot: Optional[Snapshot] = None
+
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="service-writer")
+        self.queue: Optional[asyncio.Queue] = None
+        self.writer_task: Optional[asyncio.Task] = None
+        self.batches = 0
+
+    async def start(self) -> 'AsyncService':
+        """Load both data sets on the writer thread and start the writer task"""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self.executor, self.load)
+        self.snapshot = await loop.run_in_executor(self.executor, self.build_snapshot)
+        self.queue = asyncio.Queue()
+        self.writer_task = asyncio.create_task(self.run_writer())
+        return self
+
+    async def close(self) -> bool:
+        """
+        Finish queued writes, flush both data sets and stop the writer
+        Returns: False if the address book could not be saved
+        """
+        if self.writer_task is None:
+            return True
+        await self.queue.put(None)
+        await self.writer_task
+        self.writer_task = None
+
+        loop = asyncio.get_running_loop()
+        saved = await loop.run_in_executor(self.executor, self.release)
+        self.executor.shutdown()
+        return saved
+
+    async def __aenter__(self) -> 'AsyncService':
+        return await self.start()
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    # ----- Writer thread -----
+
+    def load(self):
+        """Open the managers (blocking file I/O)"""
+        os.makedirs(self.directory, exist_ok=True)
+        self.contacts = ContactManager(self.contacts_path, write_behind=True, verbose=False)
+        self.todo = TodoManager(self.tasks_path, verbose=False)
+
+    def release(self) -> bool:
+        """Flush and close the managers"""
+        saved = self.contacts.close()
+        self.todo.close()
+        return saved
+
+    def build_snapshot(self, version: int = 0) -> Snapshot:
+        """Build a snapshot of everything in the managers"""
+        contacts = {record: contact_record(contact)
+                    for record, contact in self.contacts.records.items()}
+        tasks = {task.id: task_record(task) for task in self.todo.get_all_tasks()}
+        completed = sum(task.completed for task in tasks.values())
+        return Snapshot(version, MappingProxyType(contacts),
+                        MappingProxyType(dict(self.contacts.phone_index)),
+                        MappingProxyType(dict(self.contacts.email_index)),
+                        build_search_text(contacts), MappingProxyType(tasks), completed)
+
+    def apply_batch(self, batch: List[WriteRequest]) -> tuple:
+        """
+        Apply queued writes in one task transaction
+        Returns: (outcomes, changes) - one (ok, result or exception) per request,
+                 and the record changes to publish
+        """
+        outcomes = []
+        with self.todo.batch() as result:
+            for request in batch:
+                try:
+                    value, changes = request.apply(*request.args)
+                except Exception as e:
+                    outcomes.append((False, e, []))
+                    continue
+                outcomes.append((True, value, changes))
+
+        changes = []
+        for position, (ok, value, request_changes) in enumerate(outcomes):
+            if ok and not result.success and any(change[0] == 'task' for change in request_changes):
+                # The task save failed and was rolled back
+                outcomes[position] = (True, batch[position].failed, [])
+                continue
+            changes.extend(request_changes)
+        return [(ok, value) for ok, value, _ in outcomes], changes
+
+    def run_batch(self, batch: List[WriteRequest], snapshot: Snapshot) -> tuple:
+        """
+        Apply a batch and build the snapshot that follows it, so the copying
+        never runs on the event loop
+        Returns: (outcomes, new snapshot)
+        """
+        outcomes, changes = self.apply_batch(batch)
+        return outcomes, self.next_snapshot(snapshot, changes)
+
+    def next_snapshot(self, snapshot: Snapshot, changes: List[tuple]) -> Snapshot:
+        """
+        Copy the changed mappings of snapshot and apply the changes to them
+        changes: ('task', task ID, new record or None) and
+                 ('contact', record number, new record or None) tuples
+        Returns: snapshot itself if nothing changed
+        """
+        if not changes:
+            return snapshot
+        contacts = tasks = None
+        keys = set()  # phone and email keys whose holder may have changed
+        completed = snapshot.completed
+
+        for kind, subject, new in changes:
+            if kind == 'task':
+                if tasks is None:
+                    tasks = dict(snapshot.tasks)
+                old = tasks.pop(subject, None) if new is None else tasks.get(subject)
+                completed -= bool(old and old.completed)
+                if new is not None:
+                    tasks[subject] = new
+                    completed += new.completed
+            else:
+                if contacts is None:
+                    contacts = dict(snapshot.contacts)
+                for contact in (contacts.get(subject), new):
+                    if contact is not None:
+                        keys.add(('phone', ContactManager.normalize_phone(contact['phone'])))
+                        keys.add(('email', ContactManager.normalize_email(contact['email'])))
+                if new is None:
+                    contacts.pop(subject, None)
+                else:
+                    contacts[subject] = new
+
+        if contacts is None:
+            contacts, phones, emails = snapshot.contacts, snapshot.phones, snapshot.emails
+            search = snapshot.search
+        else:
+            # Copy the final holders from the manager: with duplicate keys in
+            # the file, a removed key passes to the next contact that has it
+            phones, emails = dict(snapshot.phones), dict(snapshot.emails)
+            for field, key in keys:
+                lookup, index = ((phones, self.contacts.phone_index) if field == 'phone'
+                                 else (emails, self.contacts.email_index))
+                record = index.get(key)
+                if record is None:
+                    lookup.pop(key, None)
+                else:
+                    lookup[key] = record
+            search = build_search_text(contacts)
+            contacts = MappingProxyType(contacts)
+            phones, emails = MappingProxyType(phones), MappingProxyType(emails)
+        return Snapshot(
+            snapshot.version + 1, contacts, phones, emails, search,
+            snapshot.tasks if tasks is None else MappingProxyType(tasks),
+            completed)
+
+    def do_add_contact(self, name: str, phone: str, email: str, address: str) -> tuple:
+        """Add a contact; returns ((success, message), changes)"""
+        success, message = self.contacts.add_contact(name, phone, email, address)
+        if not success:
+            return (success, message), []
+        record = self.contacts.phone_index[ContactManager.normalize_phone(phone)]
+        return (success, message), [('contact', record, contact_record(self.contacts.records[record]))]
+
+    def do_update_contact(self, identifier: str, fields: dict) -> tuple:
+        """Update a contact; returns ((success, message), changes)"""
+        record = self.contacts.find_record(identifier)
+        success, message = self.contacts.update_contact(identifier, **fields)
+        if not success:
+            return (success, message), []
+        return (success, message), [('contact', record, contact_record(self.contacts.records[record]))]
+
+    def do_delete_contact(self, identifier: str) -> tuple:
+        """Delete a contact; returns ((success, message), changes)"""
+        record = self.contacts.find_record(identifier)
+        success, message, _ = self.contacts.delete_contact(identifier)
+        if not success:
+            return (success, message), []
+        return (success, message), [('contact', record, None)]
+
+    def do_add_task(self, title: str) -> tuple:
+        """Add a task; returns (record or None, changes)"""
+        task = self.todo.add_task(title)
+        if task is None:
+            return None, []
+        record = task_record(task)
+        return record, [('task', task.id, record)]
+
+    def do_change_task(self, change: Callable, task_id: int, *args) -> tuple:
+        """Run a TodoManager method that edits one task; returns (success, changes)"""
+        if not change(task_id, *args):
+            return False, []
+        return True, [('task', task_id, task_record(self.todo.get_task_by_id(task_id)))]
+
+    def do_delete_task(self, task_id: int) -> tuple:
+        """Delete a task; returns (success, changes)"""
+        if not self.todo.delete_task(task_id):
+            return False, []
+        return True, [('task', task_id, None)]
+
+    def do_clear_completed(self) -> tuple:
+        """Delete completed tasks; returns (count, changes)"""
+        removed = [task.id for task in self.todo.get_completed_tasks()]
+        if not self.todo.clear_completed_tasks():
+            return 0, []
+        return len(removed), [('task', task_id, None) for task_id in removed]
+
+    # ----- Event loop -----
+
+    async def run_writer(self):
+        """Drain the write queue in batches until close() queues None"""
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            request = await self.queue.get()
+            if request is None:
+                break
+            batch = [request]
+            while len(batch) < self.max_batch and not self.queue.empty():
+                request = self.queue.get_nowait()
+                if request is None:
+                    stopping = True
+                    break
+                batch.append(request)
+
+            # Only this task replaces the snapshot, so the one passed in is current
+            self.batches += 1
+            try:
+                outcomes, self.snapshot = await loop.run_in_executor(
+                    self.executor, self.run_batch, batch, self.snapshot)
+            except Exception as e:
+                # Fail this batch's writes but keep serving later ones
+                await self.resync()
+                for request in batch:
+                    if not request.future.done():
+                        request.future.set_exception(e)
+                continue
+
+            for request, (ok, value) in zip(batch, outcomes):
+                if request.future.done():
+                    continue  # The caller was cancelled
+                if ok:
+                    request.future.set_result(value)
+                else:
+                    request.future.set_exception(value)
+
+    async def resync(self):
+        """Rebuild the snapshot from the managers after a batch failed part way"""
+        loop = asyncio.get_running_loop()
+        try:
+            self.snapshot = await loop.run_in_executor(
+                self.executor, self.build_snapshot, self.snapshot.version + 1)
+        except Exception:
+            pass  # Keep the last good snapshot
+
+    async def write(self, apply: Callable, *args, failed: Any = None):
+        """Queue a write and wait for its result"""
+        if self.writer_task is None:
+            raise RuntimeError("AsyncService is not running; call start() first")
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put(WriteRequest(apply, args, failed, future))
+        return await future
+
+    # ----- Contacts -----
+
+    async def add_contact(self, name: str, phone: str, email: str, address: str) -> tuple:
+        """
+        Add a new contact
+        Returns: (success: bool, message: str)
+        """
+        return await self.write(self.do_add_contact, name, phone, email, address)
+
+    async def update_contact(self, identifier: str, name: str = None, phone: str = None,
+                             email: str = None, address: str = None) -> tuple:
+        """
+        Update the contact with this phone or email
+        Returns: (success: bool, message: str)
+        """
+        fields = {'name': name, 'phone': phone, 'email': email, 'address': address}
+        return await self.write(self.do_update_contact, identifier, fields)
+
+    async def delete_contact(self, identifier: str) -> tuple:
+        """
+        Delete the contact with this phone or email
+        Returns: (success: bool, message: str)
+        """
+        return await self.write(self.do_delete_contact, identifier)
+
+    async def get_contact(self, identifier: str) -> Optional[ContactRecord]:
+        """Find a contact by phone or email in the current snapshot"""
+        snapshot = self.snapshot
+        record = snapshot.phones.get(ContactManager.normalize_phone(identifier))
+        if record is None:
+            record = snapshot.emails.get(ContactManager.normalize_email(identifier))
+        return None if record is None else snapshot.contacts[record]
+
+    async def list_contacts(self) -> List[ContactRecord]:
+        """Return every contact in the current snapshot"""
+        return list(self.snapshot.contacts.values())
+
+    async def search_contacts(self, query: str) -> List[ContactRecord]:
+        """Search the current snapshot by name or phone (same rules as ContactManager)"""
+        search = self.snapshot.search
+        query = query.strip().lower()
+        if not query:
+            return list(search.contacts)
+
+        rows = self.search_rows(search, query)
+        digits = ContactManager.query_digits(query)
+        if digits and digits != query:
+            rows |= self.search_rows(search, digits)
+        return [search.contacts[row] for row in sorted(rows)]
+
+    @staticmethod
+    def search_rows(search: SearchText, needle: str) -> set:
+        """Find the lines of the search text that contain needle"""
+        rows = set()
+        position = search.text.find(needle)
+        while position != -1:
+            row = bisect.bisect_right(search.offsets, position) - 1
+            rows.add(row)
+            # Continue after this contact's line
+            position = search.text.find(needle, search.offsets[row + 1])
+        return rows
+
+    # ----- Tasks -----
+
+    async def add_task(self, title: str) -> Optional[TaskRecord]:
+        """Add a task; returns the new task, or None if the title is empty or saving failed"""
+        return await self.write(self.do_add_task, title, failed=None)
+
+    async def update_task(self, task_id: int, title: str) -> bool:
+        """Change a task's title"""
+        return await self.write(self.do_change_task, self.todo.update_task, task_id, title,
+                                failed=False)
+
+    async def set_task_status(self, task_id: int, completed: bool) -> bool:
+        """Mark a task as completed or pending"""
+        return await self.write(self.do_change_task, self.todo.set_task_status, task_id,
+                                completed, failed=False)
+
+    async def toggle_task(self, task_id: int) -> bool:
+        """Toggle a task between completed and pending"""
+        return await self.write(self.do_change_task, self.todo.toggle_task_status, task_id,
+                                failed=False)
+
+    async def delete_task(self, task_id: int) -> bool:
+        """Delete a task"""
+        return await self.write(self.do_delete_task, task_id, failed=False)
+
+    async def clear_completed_tasks(self) -> int:
+        """Delete all completed tasks; returns how many were removed"""
+        return await self.write(self.do_clear_completed, failed=0)
+
+    async def get_task(self, task_id: int) -> Optional[TaskRecord]:
+        """Find a task by ID in the current snapshot"""
+        return self.snapshot.tasks.get(task_id)
+
+    async def list_tasks(self, completed: Optional[bool] = None) -> List[TaskRecord]:
+        """Return all tasks, or only completed (True) / pending (False) ones"""
+        tasks = self.snapshot.tasks.values()
+        if completed is None:
+            return list(tasks)
+        return [task for task in tasks if task.completed == completed]
+
+    async def task_counts(self) -> dict:
+        """Return total, completed and pending task counts"""
+        snapshot = self.snapshot
+        total = len(snapshot.tasks)
+        return {'total': total, 'completed': snapshot.completed,
+                'pending': total - snapshot.completed}
@@ -0,0 +1,137 @@
+"""
+Async Service - Load Test
+Runs many concurrent simulated clients against an AsyncService backed by a
+temporary data directory. Every client adds a contact and a task, reads
+them back, searches, toggles its task and finally deletes every other
+contact. The test reports throughput and latency percentiles, then reopens
+the data files to check that every write reached disk.
+
+Usage:
+    python load_test.py [clients]
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+from async_facade import AsyncService, ContactManager, TodoManager
+
+
+class Timings:
+    """Collects call latencies per operation kind"""
+
+    def __init__(self):
+        self.samples = {'read': [], 'write': []}
+
+    async def measure(self, kind: str, call):
+        start = time.perf_counter()
+        result = await call
+        self.samples[kind].append(time.perf_counter() - start)
+        return result
+
+    def summary(self, kind: str) -> tuple:
+        """Return (count, p50 ms, p99 ms) for one kind"""
+        samples = sorted(self.samples[kind])
+        return (len(samples), samples[len(samples) // 2] * 1000,
+                samples[int(len(samples) * 0.99)] * 1000)
+
+
+def client_name(number: int) -> str:
+    """Spell a client number in letters (contact names cannot contain digits)"""
+    return ''.join(chr(ord('a') + int(digit)) for digit in str(number)).title()
+
+
+async def client(service: AsyncService, timings: Timings, number: int) -> int:
+    """
+    One simulated client session
+    Returns: number of failed checks
+    """
+    phone = f"98{number:08d}"
+    failures = 0
+
+    success, _ = await timings.measure('write', service.add_contact(
+        f"Load Client {client_name(number)}", phone, f"client.{number}@example.com", "Kathmandu"))
+    failures += not success
+
+    contact = await timings.measure('read', service.get_contact(phone))
+    failures += contact is None or contact['phone'] != phone
+    await timings.measure('read', service.search_contacts(phone[-6:]))
+
+    task = await timings.measure('write', service.add_task(f"Follow up with client {number}"))
+    failures += task is None
+    if task is not None:
+        failures += not await timings.measure('write', service.toggle_task(task.id))
+        stored = await timings.measure('read', service.get_task(task.id))
+        failures += stored is None or not stored.completed
+    await timings.measure('read', service.task_counts())
+
+    if number % 2:
+        success, _ = await timings.measure('write', service.delete_contact(phone))
+        failures += not success
+    return failures
+
+
+def verify(directory: str, clients: int) -> bool:
+    """Reopen the data files and check the final counts"""
+    contacts = ContactManager(os.path.join(directory, "contacts.json"), verbose=False)
+    todo = TodoManager(os.path.join(directory, "tasks.json"), verbose=False)
+    counts = todo.get_task_count()
+    return (contacts.get_contact_count() == clients - clients // 2 and
+            counts['total'] == clients and counts['completed'] == clients)
+
+
+async def run(directory: str, clients: int) -> dict:
+    """Start the service, run every client concurrently and shut down"""
+    timings = Timings()
+    service = await AsyncService(directory).start()
+
+    start = time.perf_counter()
+    failures = await asyncio.gather(*(client(service, timings, i) for i in range(clients)))
+    elapsed = time.perf_counter() - start
+
+    closed = await service.close()
+    return {'timings': timings, 'elapsed': elapsed, 'failures': sum(failures),
+            'batches': service.batches, 'closed': closed}
+
+
+def main():
+    """Run the load test and print a summary"""
+    try:
+        clients = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+        if clients < 1:
+            raise ValueError
+    except ValueError:
+        print("Usage: python load_test.py [clients]  (clients: positive integer)")
+        sys.exit(1)
+
+    print("=" * 70)
+    print(" " * 20 + "ASYNC SERVICE LOAD TEST")
+    print("=" * 70)
+    print(f"Concurrent clients: {clients:,}\n")
+
+    with tempfile.TemporaryDirectory() as directory:
+        result = asyncio.run(run(directory, clients))
+        on_disk = verify(directory, clients)
+
+    timings = result['timings']
+    operations = sum(len(samples) for samples in timings.samples.values())
+    print(f"{'Operation':<12} {'Calls':>10} {'p50 (ms)':>12} {'p99 (ms)':>12}")
+    print("-" * 70)
+    for kind in ('read', 'write'):
+        count, p50, p99 = timings.summary(kind)
+        print(f"{kind:<12} {count:>10,} {p50:>12.2f} {p99:>12.2f}")
+    print("-" * 70)
+    print(f"Total: {operations:,} calls in {result['elapsed']:.2f}s "
+          f"({operations / result['elapsed']:,.0f} calls/s), {result['batches']:,} write batches")
+    print(f"Failed checks: {result['failures']}")
+    print(f"Data on disk: {'✓ consistent' if on_disk and result['closed'] else '✗ MISMATCH'}")
+    print("=" * 70)
+
+    if result['failures'] or not on_disk or not result['closed']:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
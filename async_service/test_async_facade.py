@@ -0,0 +1,85 @@
+"""
+Async Service - Facade Tests
+Covers snapshot lookups after updates and deletes, duplicate phones in the
+contacts file and writes that fail inside the writer thread.
+
+Run with: python -m pytest -q
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from async_facade import AsyncService
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+def names(contacts) -> list:
+    return [contact['name'] for contact in contacts]
+
+
+def test_lookups_follow_updates_and_deletes(tmp_path):
+    async def scenario():
+        async with AsyncService(str(tmp_path)) as service:
+            assert (await service.add_contact("Ram Sharma", "9841000001",
+                                              "ram@example.com", "Kathmandu"))[0]
+            assert (await service.add_contact("Sita Rai", "9841000002",
+                                              "sita@example.com", "Pokhara"))[0]
+            assert (await service.update_contact("9841000001", phone="9841999999"))[0]
+
+            assert await service.get_contact("9841000001") is None
+            assert (await service.get_contact("984-199-9999"))['name'] == "Ram Sharma"
+            assert (await service.get_contact("RAM@example.com"))['phone'] == "9841999999"
+            assert names(await service.search_contacts("999")) == ["Ram Sharma"]
+
+            assert (await service.delete_contact("sita@example.com"))[0]
+            assert await service.get_contact("9841000002") is None
+            assert names(await service.list_contacts()) == ["Ram Sharma"]
+    run(scenario())
+
+
+def test_duplicate_phones_in_file(tmp_path):
+    contacts = [
+        {'name': "Ram Sharma", 'phone': "9841000001", 'email': "ram@example.com", 'address': "A"},
+        {'name': "Ram Copy", 'phone': "984-100-0001", 'email': "copy@example.com", 'address': "B"},
+    ]
+    (tmp_path / "contacts.json").write_text(json.dumps(contacts))
+
+    async def scenario():
+        async with AsyncService(str(tmp_path)) as service:
+            # Both are listed; lookups resolve to the first, like ContactManager
+            assert names(await service.list_contacts()) == ["Ram Sharma", "Ram Copy"]
+            assert (await service.get_contact("9841000001"))['name'] == "Ram Sharma"
+
+            # Deleting the first hands the phone to the duplicate
+            assert (await service.delete_contact("ram@example.com"))[0]
+            assert names(await service.list_contacts()) == ["Ram Copy"]
+            assert (await service.get_contact("9841000001"))['name'] == "Ram Copy"
+            assert (await service.delete_contact("9841000001"))[0]
+            assert await service.list_contacts() == []
+    run(scenario())
+
+
+def test_failed_batch_fails_its_writes_and_keeps_the_writer(tmp_path):
+    async def scenario():
+        async with AsyncService(str(tmp_path)) as service:
+            next_snapshot = service.next_snapshot
+
+            def broken(snapshot, changes):
+                service.next_snapshot = next_snapshot  # Fail only once
+                raise RuntimeError("snapshot failed")
+            service.next_snapshot = broken
+
+            with pytest.raises(RuntimeError, match="snapshot failed"):
+                await service.add_task("Write report")
+            # The write itself was applied; the snapshot is rebuilt from the managers
+            assert [task.title for task in await service.list_tasks()] == ["Write report"]
+
+            task = await asyncio.wait_for(service.add_task("Call Ram"), timeout=5)
+            assert task.title == "Call Ram"
+            assert (await service.task_counts())['total'] == 2
+    run(scenario())
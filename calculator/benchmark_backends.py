@@ -0,0 +1,92 @@
+"""
+Numeric backend benchmark.
+
+Evaluates the same compiled random expressions with binary floats,
+decimal.Decimal (28 and 50 digits) and exact fractions, and reports
+expressions per second and the slowdown relative to float. A short
+rounding-drift demo shows what the slower backends buy.
+
+Usage:
+    python benchmark_backends.py [expression_count]
+"""
+
+import random
+import sys
+import time
+
+from benchmark_engine import random_expression
+from calc_engine import compile_expression, get_backend
+
+BACKENDS = [("float", get_backend('float')),
+            ("decimal (28 digits)", get_backend('decimal', 28)),
+            ("decimal (50 digits)", get_backend('decimal', 50)),
+            ("fraction", get_backend('fraction'))]
+
+
+def measure(programs, backend):
+    """
+    Evaluate every program once with a backend.
+
+    Parameters:
+        programs (list): Compiled programs
+        backend (Backend): Numeric backend
+
+    Returns:
+        float: Seconds taken
+    """
+    start = time.perf_counter()
+    for program in programs:
+        try:
+            program.evaluate(None, backend)
+        except ZeroDivisionError:
+            pass
+    return time.perf_counter() - start
+
+
+def drift(backend, steps=1000):
+    """
+    Add 0.1 to itself steps times.
+
+    Parameters:
+        backend (Backend): Numeric backend
+        steps (int): Number of additions
+
+    Returns:
+        str: The formatted total
+    """
+    program = compile_expression("total + step")
+    total = backend.parse("0")
+    step = backend.parse("0.1")
+    for _ in range(steps):
+        total = program.evaluate({'total': total, 'step': step}, backend)
+    return backend.format(total)
+
+
+def main():
+    """Run the benchmark and print a summary table."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    rng = random.Random(42)
+    programs = [compile_expression(random_expression(rng)) for _ in range(count)]
+
+    print("=" * 70)
+    print(" " * 20 + "NUMERIC BACKEND BENCHMARK")
+    print("=" * 70)
+    print(f"Expressions: {count:,} (compiled once, evaluated per backend)\n")
+    print(f"{'Backend':<30} {'Seconds':>10} {'Expr/s':>15} {'vs float':>10}")
+    print("-" * 70)
+
+    baseline = None
+    for label, backend in BACKENDS:
+        seconds = measure(programs, backend)
+        baseline = baseline or seconds
+        print(f"{label:<30} {seconds:>10.2f} {count / seconds:>15,.0f} {seconds / baseline:>9.1f}x")
+
+    print("-" * 70)
+    print("0.1 added 1,000 times:")
+    for label, backend in BACKENDS:
+        print(f"  {label:<28} {drift(backend)}")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
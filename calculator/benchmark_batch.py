@@ -0,0 +1,83 @@
+"""
+Calculator batch mode benchmark.
+
+Writes a file of random expressions and measures batch throughput (lines
+per second) in-process and with increasing numbers of worker processes.
+
+Usage:
+    python benchmark_batch.py [line_count]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+from benchmark_engine import random_expression
+from calc_batch import run_batch
+
+
+def write_input(path, count):
+    """
+    Write count random expressions, one per line.
+
+    Parameters:
+        path (str): File to write
+        count (int): Number of lines
+    """
+    rng = random.Random(7)
+    with open(path, 'w', encoding='utf-8') as file:
+        for _ in range(count):
+            file.write(random_expression(rng) + "\n")
+
+
+def measure(path, workers, chunk_size=10000):
+    """
+    Run batch mode over a file, discarding the output.
+
+    Parameters:
+        path (str): Input file
+        workers (int): Worker processes
+        chunk_size (int): Lines per chunk
+
+    Returns:
+        tuple: (lines evaluated, seconds taken)
+    """
+    start = time.perf_counter()
+    with open(path, encoding='utf-8') as source, open(os.devnull, 'w') as output:
+        count, _ = run_batch(source, output, chunk_size, workers)
+    return count, time.perf_counter() - start
+
+
+def main():
+    """Run the benchmark and print a summary table."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    cores = os.cpu_count() or 1
+    worker_counts = [0] + [n for n in (2, 4, 8) if n <= max(cores, 2)]
+
+    print("=" * 70)
+    print(" " * 20 + "CALCULATOR BATCH BENCHMARK")
+    print("=" * 70)
+    print(f"Lines: {count:,}   CPU cores: {cores}\n")
+    print(f"{'Mode':<30} {'Seconds':>10} {'Lines/s':>15} {'Speedup':>10}")
+    print("-" * 70)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "expressions.txt")
+        write_input(path, count)
+
+        baseline = None
+        for workers in worker_counts:
+            lines, seconds = measure(path, workers)
+            baseline = baseline or seconds
+            label = "in-process" if workers == 0 else f"{workers} worker processes"
+            print(f"{label:<30} {seconds:>10.2f} {lines / seconds:>15,.0f} {baseline / seconds:>9.1f}x")
+
+    print("-" * 70)
+    print("Worker processes only help on machines with more than one core.")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Expression cache benchmark.
+
+Builds a batch-like workload where a pool of distinct expressions
+recurs with a skewed (Zipf-like) frequency, then evaluates it with the
+expression cache disabled and at several sizes. Reports expressions per
+second, the hit rate and the speedup over evaluating without the cache.
+
+Usage:
+    python benchmark_cache.py [expression_count] [distinct_expressions]
+"""
+
+import random
+import sys
+import time
+
+from benchmark_engine import random_expression
+from calc_engine import ExpressionCache
+
+CACHE_SIZES = [0, 100, 1000, 10000]
+
+
+def build_workload(count, distinct):
+    """
+    Draw count expressions from a pool of distinct ones, popular ones more often.
+
+    Parameters:
+        count (int): Expressions in the workload
+        distinct (int): Size of the expression pool
+
+    Returns:
+        list: Expression texts
+    """
+    rng = random.Random(11)
+    pool = [random_expression(rng) for _ in range(distinct)]
+    weights = [1 / rank for rank in range(1, distinct + 1)]
+    return rng.choices(pool, weights, k=count)
+
+
+def measure(expressions, cache_size):
+    """
+    Evaluate every expression through a fresh cache.
+
+    Parameters:
+        expressions (list): Expression texts
+        cache_size (int): Cache entries (0 disables the cache)
+
+    Returns:
+        tuple: (seconds taken, CacheInfo)
+    """
+    cache = ExpressionCache(cache_size)
+    evaluate = cache.evaluate
+    start = time.perf_counter()
+    for expression in expressions:
+        try:
+            evaluate(expression)
+        except ZeroDivisionError:
+            pass
+    return time.perf_counter() - start, cache.info()
+
+
+def main():
+    """Run the benchmark and print a summary table."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    distinct = int(sys.argv[2]) if len(sys.argv) > 2 else 20_000
+    expressions = build_workload(count, distinct)
+
+    print("=" * 70)
+    print(" " * 20 + "EXPRESSION CACHE BENCHMARK")
+    print("=" * 70)
+    print(f"Expressions: {count:,}   distinct: {distinct:,} (Zipf-like repeats)\n")
+    print(f"{'Cache size':<15} {'Seconds':>10} {'Expr/s':>15} {'Hit rate':>12} {'Speedup':>10}")
+    print("-" * 70)
+
+    baseline = None
+    for cache_size in CACHE_SIZES:
+        seconds, info = measure(expressions, cache_size)
+        baseline = baseline or seconds
+        label = "disabled" if cache_size == 0 else f"{cache_size:,}"
+        hit_rate = info.hits / max(info.hits + info.misses, 1)
+        print(f"{label:<15} {seconds:>10.2f} {count / seconds:>15,.0f} {hit_rate:>11.1%} "
+              f"{baseline / seconds:>9.1f}x")
+
+    print("-" * 70)
+    print("Each cached expression may take two entries: the text as typed and")
+    print("its normalized form.")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
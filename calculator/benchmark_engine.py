@@ -0,0 +1,97 @@
+"""
+Calculator engine throughput benchmark.
+
+Generates random arithmetic expressions and reports expressions per
+second for compiling, for evaluating already compiled programs, and for
+both together. A compiled program re-evaluated with new variable values
+(the way perform_calculation uses the engine) is measured too.
+
+Usage:
+    python benchmark_engine.py [expression_count]
+"""
+
+import random
+import sys
+import time
+
+from calc_engine import compile_expression
+
+OPERATORS = ['+', '-', '*', '/', '×', '÷', '−']
+
+
+def random_expression(rng, depth=3):
+    """
+    Build a random expression with nested parentheses.
+
+    Parameters:
+        rng (random.Random): Random number generator
+        depth (int): Maximum nesting depth
+
+    Returns:
+        str: Expression text
+    """
+    if depth == 0 or rng.random() < 0.3:
+        return f"{rng.uniform(1, 1000):.2f}"
+    left = random_expression(rng, depth - 1)
+    right = random_expression(rng, depth - 1)
+    text = f"{left} {rng.choice(OPERATORS)} {right}"
+    return f"({text})" if rng.random() < 0.4 else text
+
+
+def timed(function, items):
+    """
+    Call function on every item and return the elapsed seconds.
+
+    Parameters:
+        function (callable): Function to call
+        items (list): Arguments, one call each
+
+    Returns:
+        float: Seconds taken
+    """
+    start = time.perf_counter()
+    for item in items:
+        try:
+            function(item)
+        except ZeroDivisionError:
+            pass
+    return time.perf_counter() - start
+
+
+def main():
+    """Run the benchmark and print a summary table."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    rng = random.Random(42)
+    expressions = [random_expression(rng) for _ in range(count)]
+    average_length = sum(map(len, expressions)) / count
+
+    print("=" * 70)
+    print(" " * 20 + "CALCULATOR ENGINE BENCHMARK")
+    print("=" * 70)
+    print(f"Expressions: {count:,}   average length: {average_length:.0f} characters\n")
+    print(f"{'Stage':<40} {'Seconds':>10} {'Expr/s':>15}")
+    print("-" * 70)
+
+    compile_seconds = timed(compile_expression, expressions)
+    programs = [compile_expression(expression) for expression in expressions]
+    evaluate_seconds = timed(lambda program: program.evaluate(), programs)
+    both_seconds = timed(lambda expression: compile_expression(expression).evaluate(), expressions)
+
+    template = compile_expression("a * b + a / b")
+    values = [{'a': rng.uniform(1, 100), 'b': rng.uniform(1, 100)} for _ in range(count)]
+    reuse_seconds = timed(template.evaluate, values)
+
+    for label, seconds in (("tokenize + parse + compile", compile_seconds),
+                           ("evaluate compiled program", evaluate_seconds),
+                           ("compile and evaluate", both_seconds),
+                           ("re-evaluate one program with variables", reuse_seconds)):
+        print(f"{label:<40} {seconds:>10.2f} {count / seconds:>15,.0f}")
+
+    print("-" * 70)
+    print(f"Compiling once and evaluating many times is "
+          f"{both_seconds / evaluate_seconds:.1f}x faster than compiling every time.")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
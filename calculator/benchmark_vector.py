@@ -0,0 +1,84 @@
+"""
+Vectorized arithmetic benchmark.
+
+Compares the scalar calculator functions called in a Python loop with
+vector_ops at 10M elements (by default): the pure-Python fallback, and
+NumPy when it is installed. One divisor in a thousand is zero, so the
+division runs exercise the zero-divisor handling.
+
+Usage:
+    python benchmark_vector.py [element_count]
+"""
+
+import random
+import sys
+import time
+
+import vector_ops
+from calculator_cli import add, divide, multiply, subtract
+
+
+def scalar_divide(x, y):
+    """Scalar division with the error handling perform_calculation uses."""
+    try:
+        return divide(x, y)
+    except ZeroDivisionError:
+        return None
+
+
+def timed(function, *args):
+    """
+    Call function once and return the elapsed seconds.
+
+    Parameters:
+        function (callable): Function to call
+        args: Arguments for the call
+
+    Returns:
+        float: Seconds taken
+    """
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    """Run the benchmark and print a summary table."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+    rng = random.Random(3)
+    a = [rng.uniform(-1000, 1000) for _ in range(count)]
+    b = [0.0 if i % 1000 == 0 else rng.uniform(-1000, 1000) for i in range(count)]
+
+    backends = [("pure Python", False)]
+    if vector_ops.HAVE_NUMPY:
+        backends.append(("NumPy", True))
+        a_array = vector_ops.np.asarray(a)
+        b_array = vector_ops.np.asarray(b)
+
+    print("=" * 70)
+    print(" " * 20 + "VECTOR ARITHMETIC BENCHMARK")
+    print("=" * 70)
+    print(f"Elements: {count:,}   NumPy installed: {'yes' if vector_ops.HAVE_NUMPY else 'no'}\n")
+    print(f"{'Operation':<12} {'Scalar loop (s)':>16}" +
+          "".join(f" {label + ' (s)':>16}" for label, _ in backends) + f" {'Best speedup':>13}")
+    print("-" * 70)
+
+    scalar_functions = {'add': add, 'subtract': subtract, 'multiply': multiply,
+                        'divide': scalar_divide}
+    for name, scalar in scalar_functions.items():
+        scalar_seconds = timed(lambda: [scalar(x, y) for x, y in zip(a, b)])
+        vector = getattr(vector_ops, name)
+        seconds = []
+        for _, use_numpy in backends:
+            left, right = (a_array, b_array) if use_numpy else (a, b)
+            seconds.append(timed(vector, left, right, use_numpy))
+        print(f"{name:<12} {scalar_seconds:>16.2f}" + "".join(f" {s:>16.2f}" for s in seconds) +
+              f" {scalar_seconds / min(seconds):>12.1f}x")
+
+    print("-" * 70)
+    print("NumPy timings exclude converting the input lists to arrays.")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""
+Batch evaluation for the calculator.
+
+Streams one expression per line from a file or stdin, evaluates the
+lines in chunks (optionally in worker processes) and writes one result
+per line, in input order. Used by `calculator_cli.py --batch`.
+
+Lines go through the engine's expression cache, so repeated expressions
+are evaluated once per process.
+"""
+
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from calc_engine import (DEFAULT_CACHE_SIZE, DEFAULT_PRECISION, ExpressionError,
+                         expression_cache, get_backend)
+
+ERROR_PREFIX = "ERROR: "
+
+
+def evaluate_chunk(lines, mode='float', precision=DEFAULT_PRECISION,
+                   cache_size=DEFAULT_CACHE_SIZE):
+    """
+    Evaluate a chunk of expression lines.
+
+    Runs in worker processes, so it must stay a top-level function (and
+    takes the backend by name, which pickles cheaply).
+
+    Parameters:
+        lines (list): Expression lines (newlines are ignored)
+        mode (str): Numeric backend name
+        precision (int): Significant digits in decimal mode
+        cache_size (int): Entries kept by the expression cache (0 disables it)
+
+    Returns:
+        tuple: (output text with one line per input line, number of errors)
+    """
+    backend = get_backend(mode, precision)
+    expression_cache.resize(cache_size)
+    evaluate = expression_cache.evaluate
+    results = []
+    errors = 0
+    for line in lines:
+        expression = line.strip()
+        if not expression:
+            results.append("")
+            continue
+        try:
+            results.append(backend.format(evaluate(expression, None, backend)))
+        except (ExpressionError, ZeroDivisionError, OverflowError) as e:
+            results.append(ERROR_PREFIX + str(e))
+            errors += 1
+    results.append("")
+    return "\n".join(results), errors
+
+
+def evaluated_chunks(lines, chunk_size, workers, mode='float', precision=DEFAULT_PRECISION,
+                     cache_size=DEFAULT_CACHE_SIZE):
+    """
+    Yield evaluated chunks in input order.
+
+    Parameters:
+        lines (iterable): Expression lines
+        chunk_size (int): Lines per chunk
+        workers (int): Worker processes (0 or 1 evaluates in this process)
+        mode (str): Numeric backend name
+        precision (int): Significant digits in decimal mode
+        cache_size (int): Expression cache entries per process
+
+    Yields:
+        tuple: (output text, number of errors) per chunk
+    """
+    chunks = iter(lambda: list(islice(lines, chunk_size)), [])
+
+    if workers <= 1:
+        for chunk in chunks:
+            yield evaluate_chunk(chunk, mode, precision, cache_size)
+        return
+
+    # Keep a few chunks in flight so memory stays bounded on huge inputs
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(evaluate_chunk, chunk, mode, precision, cache_size))
+            if len(pending) >= workers * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def run_batch(source, output, chunk_size=10000, workers=0, mode='float',
+              precision=DEFAULT_PRECISION, cache_size=DEFAULT_CACHE_SIZE):
+    """
+    Evaluate every line of source and write the results to output.
+
+    Parameters:
+        source (iterable): Expression lines (e.g. an open file or sys.stdin)
+        output (file): Stream the results are written to
+        chunk_size (int): Lines per chunk
+        workers (int): Worker processes
+        mode (str): Numeric backend name
+        precision (int): Significant digits in decimal mode
+        cache_size (int): Expression cache entries per process
+
+    Returns:
+        tuple: (number of lines, number of errors)
+    """
+    count = 0
+    errors = 0
+    chunks = evaluated_chunks(iter(source), chunk_size, workers, mode, precision, cache_size)
+    for text, chunk_errors in chunks:
+        output.write(text)
+        count += text.count("\n")
+        errors += chunk_errors
+    return count, errors
+
+
+def main_batch(path, output_path=None, chunk_size=10000, workers=0, mode='float',
+               precision=DEFAULT_PRECISION, cache_size=DEFAULT_CACHE_SIZE):
+    """
+    Run batch mode from the command line.
+
+    Parameters:
+        path (str): Input file, or '-' for stdin
+        output_path (str): Output file (default: stdout)
+        chunk_size (int): Lines per chunk
+        workers (int): Worker processes
+        mode (str): Numeric backend name
+        precision (int): Significant digits in decimal mode
+        cache_size (int): Expression cache entries per process
+
+    Returns:
+        int: Exit status (0 if every line was evaluated, 1 otherwise)
+    """
+    start = time.perf_counter()
+    try:
+        source = sys.stdin if path == '-' else open(path, encoding='utf-8')
+    except OSError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+    try:
+        output = sys.stdout if output_path is None else open(output_path, 'w', encoding='utf-8')
+    except OSError as e:
+        if source is not sys.stdin:
+            source.close()
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+
+    try:
+        count, errors = run_batch(source, output, chunk_size, workers, mode, precision,
+                                  cache_size)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if output is not sys.stdout:
+            output.close()
+        else:
+            output.flush()
+
+    elapsed = time.perf_counter() - start
+    # The summary goes to stderr so stdout holds only results
+    print(f"✓ Evaluated {count:,} line(s) in {elapsed:.2f}s "
+          f"({count / max(elapsed, 1e-9):,.0f} lines/s), {errors:,} error(s)", file=sys.stderr)
+    return 1 if errors else 0
@@ -0,0 +1,604 @@
+"""
+Calculator engine shared by the CLI and GUI calculators.
+
+Expressions are tokenized, parsed with a Pratt (precedence climbing)
+parser and compiled once into a small stack-machine program that can be
+evaluated many times, optionally with different variable values.
+
+Supported syntax:
+    numbers        12, 3.5, .5, 1e-3
+    operators      + - * / ^ (also ** and the GUI symbols − × ÷)
+    unary signs    -x, +x
+    parentheses    (2 + 3) × 4
+    variables      a + b (values are passed to Program.evaluate)
+
+Programs can be evaluated with different numeric backends: binary
+floats (the default), decimal.Decimal with a configurable precision, or
+exact fractions.Fraction arithmetic.
+
+ExpressionCache memoizes results for repeated expressions; both
+calculators evaluate through the shared expression_cache instance.
+"""
+
+import decimal
+import re
+from collections import OrderedDict
+from fractions import Fraction
+from functools import lru_cache
+from typing import NamedTuple
+
+
+class ExpressionError(ValueError):
+    """Raised when an expression cannot be tokenized or parsed."""
+
+    def __init__(self, message, position=None):
+        if position is not None:
+            message = f"{message} (at position {position + 1})"
+        super().__init__(message)
+        self.position = position
+
+
+class Token(NamedTuple):
+    kind: str       # 'number', 'name', 'operator', '(', ')' or 'end'
+    text: str
+    position: int
+
+
+# Order matters: numbers before names, ** before *; any other
+# non-space character is an error
+TOKEN_PATTERN = re.compile(r"""
+    \s*(?:
+        (?P<number>(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)
+      | (?P<name>[A-Za-z_]\w*)
+      | (?P<operator>\*\*|[-+*/^−×÷])
+      | (?P<paren>[()])
+      | (?P<error>\S)
+    )
+""", re.VERBOSE)
+
+# GUI and typographic symbols mapped to the canonical operators
+OPERATOR_ALIASES = {'−': '-', '×': '*', '÷': '/', '**': '^'}
+
+# Opcodes of the stack machine
+PUSH, LOAD, NEG, ADD, SUB, MUL, DIV, POW = range(8)
+
+BINARY_OPCODES = {'+': ADD, '-': SUB, '*': MUL, '/': DIV, '^': POW}
+
+# Binding powers: higher binds tighter. ^ is right-associative and binds
+# tighter than a unary sign, so -2^2 is -(2^2).
+BINARY_POWER = {'+': 10, '-': 10, '*': 20, '/': 20, '^': 40}
+PREFIX_POWER = 30
+
+DIVIDE_BY_ZERO_MESSAGE = "Cannot divide by zero!"
+
+DEFAULT_PRECISION = 28   # Significant digits in decimal mode
+MAX_EXACT_EXPONENT = 10000  # Larger whole-number powers of fractions are refused
+DEFAULT_CACHE_SIZE = 1024   # Entries kept by the shared expression cache
+
+
+class Backend:
+    """
+    A numeric type expressions are evaluated with.
+
+    number converts a literal's text; context is the decimal context
+    arithmetic runs in (None for float and fraction).
+    """
+
+    def __init__(self, name, number, context=None):
+        self.name = name
+        self.number = number
+        self.context = context
+        self.key = (name, context.prec if context else None)
+
+    def parse(self, text):
+        """
+        Convert user input to this backend's number type.
+
+        Parameters:
+            text (str): Number as typed
+
+        Returns:
+            Number of this backend's type
+
+        Raises:
+            ValueError: If the text is not a finite number (floats also accept inf/nan)
+        """
+        try:
+            value = self.number(text.strip())
+        except (ValueError, ArithmeticError):
+            raise ValueError(f"Invalid number: {text!r}") from None
+        if isinstance(value, decimal.Decimal) and not value.is_finite():
+            raise ValueError(f"Invalid number: {text!r}")
+        return value
+
+    def convert(self, value):
+        """Convert a variable's value (a number or text) to this backend's type."""
+        if isinstance(value, str):
+            return self.parse(value)
+        if self.number is float or isinstance(value, (int, self.number)):
+            return self.number(value)
+        if isinstance(value, float):
+            # repr gives the shortest text that round-trips, so 0.1 stays 0.1
+            return self.number(repr(value))
+        if isinstance(value, Fraction):
+            # Decimal cannot take a Fraction directly; divide in the context
+            return self.number(value.numerator) / value.denominator
+        return self.number(value)
+
+    def format(self, value):
+        """Return a result as text that parses back to the same value."""
+        if isinstance(value, float):
+            return repr(value)
+        return str(value)
+
+    def __repr__(self):
+        return f"Backend({self.name!r})" if self.context is None else \
+            f"Backend({self.name!r}, precision={self.context.prec})"
+
+
+FLOAT = Backend('float', float)
+FRACTION = Backend('fraction', Fraction)
+
+BACKEND_NAMES = ('float', 'decimal', 'fraction')
+
+
+@lru_cache(maxsize=None)
+def decimal_backend(precision=DEFAULT_PRECISION):
+    """
+    Return the decimal backend for a precision.
+
+    Parameters:
+        precision (int): Significant digits (at least 1)
+
+    Returns:
+        Backend: Decimal backend (one shared instance per precision)
+    """
+    if precision < 1:
+        raise ValueError("Precision must be at least 1")
+    return Backend('decimal', decimal.Decimal, decimal.Context(prec=precision))
+
+
+def get_backend(name='float', precision=DEFAULT_PRECISION):
+    """
+    Look up a backend by name.
+
+    Parameters:
+        name (str): 'float', 'decimal' or 'fraction'
+        precision (int): Significant digits for the decimal backend
+
+    Returns:
+        Backend: The backend
+    """
+    if name == 'float':
+        return FLOAT
+    if name == 'decimal':
+        return decimal_backend(precision)
+    if name == 'fraction':
+        return FRACTION
+    raise ValueError(f"Unknown backend '{name}' (choose from {', '.join(BACKEND_NAMES)})")
+
+
+def tokenize(text):
+    """
+    Split an expression into tokens.
+
+    Parameters:
+        text (str): Expression to tokenize
+
+    Returns:
+        list: Token tuples, ending with an 'end' token
+
+    Raises:
+        ExpressionError: If the text contains an unexpected character
+    """
+    tokens = []
+    append = tokens.append
+    for match in TOKEN_PATTERN.finditer(text):
+        kind = match.lastgroup
+        value = match.group(kind)
+        position = match.start(kind)
+        if kind == 'operator':
+            value = OPERATOR_ALIASES.get(value, value)
+        elif kind == 'paren':
+            kind = value
+        elif kind == 'error':
+            raise ExpressionError(f"Unexpected character '{value}'", position)
+        append(Token(kind, value, position))
+    append(Token('end', '', len(text)))
+    return tokens
+
+
+class Program:
+    """
+    A compiled expression.
+
+    code is a flat tuple of (opcode, argument) pairs in postfix order;
+    literals holds the number texts referenced by PUSH instructions. The
+    literals are converted once per backend and kept in constants.
+    """
+
+    __slots__ = ('source', 'code', 'literals', 'names', 'constants')
+
+    def __init__(self, source, code, literals, names):
+        self.source = source
+        self.code = tuple(code)
+        self.literals = tuple(literals)
+        self.names = tuple(names)
+        self.constants = {FLOAT.key: tuple(map(float, self.literals))}
+
+    def evaluate(self, variables=None, backend=FLOAT):
+        """
+        Run the program.
+
+        Parameters:
+            variables (dict): Values for the names used in the expression
+            backend (Backend): Numeric backend (default: float)
+
+        Returns:
+            float/Decimal/Fraction: Result of the expression
+
+        Raises:
+            ZeroDivisionError: If the expression divides by zero
+            OverflowError: If a decimal result exceeds the exponent range
+            ExpressionError: If a variable has no value or a power has no result
+        """
+        if backend.context is None:
+            return self.run(variables, backend)
+        try:
+            with decimal.localcontext(backend.context):
+                return self.run(variables, backend)
+        except decimal.Overflow:
+            raise OverflowError("Result is too large") from None
+        except decimal.InvalidOperation:
+            raise ExpressionError("Invalid operation") from None
+
+    def run(self, variables, backend):
+        """Execute the code on a stack (see evaluate)."""
+        constants = self.constants.get(backend.key)
+        if constants is None:
+            constants = self.constants[backend.key] = tuple(map(backend.number, self.literals))
+        convert = backend.convert
+        stack = []
+        push = stack.append
+        pop = stack.pop
+
+        for opcode, argument in self.code:
+            if opcode == PUSH:
+                push(constants[argument])
+            elif opcode == LOAD:
+                try:
+                    push(convert(variables[argument]))
+                except (KeyError, TypeError):
+                    raise ExpressionError(f"No value for variable '{argument}'") from None
+            elif opcode == NEG:
+                stack[-1] = -stack[-1]
+            else:
+                right = pop()
+                left = stack[-1]
+                if opcode == ADD:
+                    stack[-1] = left + right
+                elif opcode == SUB:
+                    stack[-1] = left - right
+                elif opcode == MUL:
+                    stack[-1] = left * right
+                elif opcode == DIV:
+                    if right == 0:
+                        raise ZeroDivisionError(DIVIDE_BY_ZERO_MESSAGE)
+                    stack[-1] = left / right
+                else:
+                    stack[-1] = power(left, right)
+        return stack[0]
+
+    def __repr__(self):
+        return f"Program({self.source!r})"
+
+
+def power(base, exponent):
+    """Raise base to exponent, rejecting results that are not real numbers."""
+    if base == 0 and exponent < 0:
+        raise ZeroDivisionError(DIVIDE_BY_ZERO_MESSAGE)
+    if isinstance(exponent, Fraction):
+        # Keep fraction results exact (and bounded in size)
+        if exponent.denominator != 1:
+            raise ExpressionError("Fraction mode only supports whole-number powers")
+        if abs(exponent) > MAX_EXACT_EXPONENT:
+            raise ExpressionError("Power is too large for fraction mode")
+        exponent = exponent.numerator
+    result = base ** exponent
+    if isinstance(result, complex):
+        raise ExpressionError("Power has no real result")
+    return result
+
+
+class Parser:
+    """Pratt parser that emits stack-machine code while it parses."""
+
+    def __init__(self, text, tokens=None):
+        self.text = text
+        self.tokens = tokenize(text) if tokens is None else tokens
+        self.index = 0
+        self.code = []
+        self.literals = []
+        self.names = []
+
+    def peek(self):
+        return self.tokens[self.index]
+
+    def advance(self):
+        token = self.tokens[self.index]
+        self.index += 1
+        return token
+
+    def parse(self):
+        """Parse the whole text and return the compiled Program."""
+        if self.peek().kind == 'end':
+            raise ExpressionError("Empty expression")
+        self.expression(0)
+        token = self.peek()
+        if token.kind != 'end':
+            raise ExpressionError(f"Unexpected '{token.text}'", token.position)
+        return Program(self.text, self.code, self.literals, self.names)
+
+    def expression(self, min_power):
+        """Parse an operand followed by operators binding tighter than min_power."""
+        self.prefix()
+        while True:
+            token = self.peek()
+            if token.kind != 'operator':
+                break
+            left_power = BINARY_POWER[token.text]
+            if left_power <= min_power:
+                break
+            self.advance()
+            # Right-associative operators parse their right side at a lower power
+            self.expression(left_power - 1 if token.text == '^' else left_power)
+            self.code.append((BINARY_OPCODES[token.text], None))
+
+    def prefix(self):
+        """Parse a number, variable, unary sign or parenthesized expression."""
+        token = self.advance()
+        if token.kind == 'number':
+            self.code.append((PUSH, len(self.literals)))
+            self.literals.append(token.text)
+        elif token.kind == 'name':
+            self.code.append((LOAD, token.text))
+            if token.text not in self.names:
+                self.names.append(token.text)
+        elif token.kind == 'operator' and token.text in '+-':
+            self.expression(PREFIX_POWER)
+            if token.text == '-':
+                self.code.append((NEG, None))
+        elif token.kind == '(':
+            self.expression(0)
+            closing = self.advance()
+            if closing.kind != ')':
+                raise ExpressionError("Missing ')'", closing.position)
+        elif token.kind == 'end':
+            raise ExpressionError("Expression ends too early", token.position)
+        else:
+            raise ExpressionError(f"Unexpected '{token.text}'", token.position)
+
+
+def compile_expression(text, tokens=None):
+    """
+    Compile an expression into a reusable Program.
+
+    Parameters:
+        text (str): Expression such as "(2 + 3) × 4"
+        tokens (list): tokenize(text), if the caller already has it
+
+    Returns:
+        Program: Compiled expression
+
+    Raises:
+        ExpressionError: If the expression is invalid
+    """
+    try:
+        return Parser(text, tokens).parse()
+    except RecursionError:
+        raise ExpressionError("Expression is nested too deeply") from None
+
+
+def evaluate(text, variables=None, backend=FLOAT):
+    """
+    Compile and evaluate an expression in one step.
+
+    Parameters:
+        text (str): Expression to evaluate
+        variables (dict): Values for names used in the expression
+        backend (Backend): Numeric backend (default: float)
+
+    Returns:
+        float: Result of the expression
+
+    Raises:
+        ExpressionError: If the expression is invalid
+        ZeroDivisionError: If the expression divides by zero
+    """
+    return compile_expression(text).evaluate(variables, backend)
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+def normalize(tokens):
+    """
+    Return the canonical form of a tokenized expression.
+
+    Spacing and the GUI operator symbols are dropped, so "2 × 3" and
+    "2*3" normalize to the same text.
+
+    Parameters:
+        tokens (list): Tokens from tokenize()
+
+    Returns:
+        str: Token texts joined by single spaces
+    """
+    return " ".join(token.text for token in tokens[:-1])
+
+
+class ExpressionCache:
+    """
+    Bounded LRU cache of expression results.
+
+    Entries are keyed on the normalized expression, the backend (name and
+    precision) and any variable values. Errors are cached as well and
+    raised again on a hit. The text as typed is stored as an alias next
+    to its normalized form, so a repeat of the exact same text skips
+    normalizing; both entries count toward maxsize.
+
+    Compiled programs are kept apart from the results, keyed only on the
+    normalized expression, so a miss for new variable values or another
+    backend reuses the program instead of parsing the text again. The
+    program cache is bounded by maxsize as well.
+    """
+
+    def __init__(self, maxsize=DEFAULT_CACHE_SIZE):
+        self.entries = OrderedDict()
+        self.programs = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.maxsize = 0
+        self.resize(maxsize)
+
+    def resize(self, maxsize):
+        """
+        Change how many entries the cache keeps (0 disables caching).
+
+        Parameters:
+            maxsize (int): Maximum number of entries
+        """
+        if maxsize < 0:
+            raise ValueError("Cache size cannot be negative")
+        self.maxsize = maxsize
+        while len(self.entries) > maxsize:
+            self.entries.popitem(last=False)
+        while len(self.programs) > maxsize:
+            self.programs.popitem(last=False)
+
+    def clear(self):
+        """Remove every entry and reset the hit/miss counters."""
+        self.entries.clear()
+        self.programs.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def info(self):
+        """
+        Return the cache statistics.
+
+        Returns:
+            CacheInfo: (hits, misses, maxsize, currsize)
+        """
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self.entries))
+
+    def evaluate(self, text, variables=None, backend=FLOAT):
+        """
+        Evaluate an expression, reusing the result of an earlier call.
+
+        Parameters:
+            text (str): Expression to evaluate
+            variables (dict): Values for names used in the expression
+            backend (Backend): Numeric backend (default: float)
+
+        Returns:
+            float/Decimal/Fraction: Result of the expression
+
+        Raises:
+            ExpressionError: If the expression is invalid
+            ZeroDivisionError: If the expression divides by zero
+            OverflowError: If the result is too large
+        """
+        if not self.maxsize:
+            # Disabled: skip normalizing, nothing would be stored
+            self.misses += 1
+            return compile_expression(text).evaluate(variables, backend)
+
+        tokens = None
+        frozen = tuple(sorted(variables.items())) if variables else ()
+        keys = [(text, backend.key, frozen)]
+        outcome = self.get(keys[0])
+        if outcome is None:
+            try:
+                tokens = tokenize(text)
+            except ExpressionError:
+                pass  # Not normalizable; compute() reports the error
+            else:
+                normalized = normalize(tokens)
+                if normalized != text:
+                    keys.append((normalized, backend.key, frozen))
+                    outcome = self.get(keys[1])
+            if outcome is None:
+                self.misses += 1
+                outcome = self.compute(text, variables, backend, tokens)
+            else:
+                self.hits += 1
+            for key in keys:
+                self.put(key, outcome)
+        else:
+            self.hits += 1
+
+        value, error, source = outcome
+        if error is not None:
+            if source != text and isinstance(error, ExpressionError):
+                # Error positions refer to the text as typed
+                error = self.compute(text, variables, backend)[1]
+            raise error.with_traceback(None)
+        return value
+
+    def compute(self, text, variables, backend, tokens=None):
+        """Evaluate an expression and return (value, error, text)."""
+        try:
+            return self.compile(text, tokens).evaluate(variables, backend), None, text
+        except (ExpressionError, ZeroDivisionError, OverflowError) as e:
+            return None, e, text
+
+    def compile(self, text, tokens=None):
+        """
+        Return the compiled program for an expression, reusing a cached one.
+
+        Parameters:
+            text (str): Expression as typed
+            tokens (list): tokenize(text); without it nothing is cached
+
+        Returns:
+            Program: Compiled expression
+
+        Raises:
+            ExpressionError: If the expression is invalid
+        """
+        if tokens is None or not self.maxsize:
+            return compile_expression(text, tokens)
+        key = normalize(tokens)
+        program = self.programs.get(key)
+        if program is None:
+            program = self.programs[key] = compile_expression(text, tokens)
+            if len(self.programs) > self.maxsize:
+                self.programs.popitem(last=False)
+        else:
+            self.programs.move_to_end(key)
+        return program
+
+    def get(self, key):
+        """Return a cached outcome and mark it recently used (None if missing)."""
+        outcome = self.entries.get(key)
+        if outcome is not None:
+            self.entries.move_to_end(key)
+        return outcome
+
+    def put(self, key, outcome):
+        """Store an outcome, evicting the least recently used entries."""
+        if not self.maxsize:
+            return
+        self.entries[key] = outcome
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+
+# Shared by the CLI, GUI and batch mode
+expression_cache = ExpressionCache()
@@ -1,3 +1,19 @@
+import argparse
+import sys
+
+from calc_batch import main_batch
+from calc_engine import (BACKEND_NAMES, DEFAULT_CACHE_SIZE, DEFAULT_PRECISION, FLOAT,
+                         ExpressionError, expression_cache, get_backend)
+
+# The menu operations, evaluated through the shared expression cache:
+# choice -> (expression, symbol, name)
+OPERATIONS = {
+    '1': ('a + b', '+', 'Addition'),
+    '2': ('a - b', '−', 'Subtraction'),
+    '3': ('a * b', '×', 'Multiplication'),
+    '4': ('a / b', '÷', 'Division'),
+}
+
 
 def add(num1, num2):
     """
@@ -60,20 +76,22 @@ def divide(num1, num2):
     return num1 / num2
 
 
-def get_number_input(prompt):
+def get_number_input(prompt, backend=FLOAT):
     """
     Get a valid number input from the user.
     
     Parameters:
         prompt (str): Message to display to the user
+        backend (Backend): Numeric backend the number is read for
     
     Returns:
-        float: Valid number entered by user
+        float/Decimal/Fraction: Valid number entered by user
     """
     while True:
         try:
-            # Get input from user and convert to float
-            number = float(input(prompt))
+            # Convert the typed text directly, so decimal and fraction
+            # modes keep every digit the user entered
+            number = backend.parse(input(prompt))
             return number
         except ValueError:
             # If conversion fails, show error and ask again
@@ -108,7 +126,7 @@ def get_operation_choice():
             print("❌ Invalid choice! Please enter a number between 1 and 4.")
 
 
-def perform_calculation(num1, num2, operation):
+def perform_calculation(num1, num2, operation, backend=FLOAT):
     """
     Perform the selected calculation and return the result.
     
@@ -116,29 +134,58 @@ def perform_calculation(num1, num2, operation):
         num1 (float): First number
         num2 (float): Second number
         operation (str): Operation choice ('1', '2', '3', or '4')
+        backend (Backend): Numeric backend (float, decimal or fraction)
     
     Returns:
         tuple: (result, operation_symbol, operation_name)
     """
-    if operation == '1':
-        result = add(num1, num2)
-        return result, '+', 'Addition'
+    expression, symbol, name = OPERATIONS[operation]
+    try:
+        result = expression_cache.evaluate(expression, {'a': num1, 'b': num2}, backend)
+        return result, symbol, name
+    except (ZeroDivisionError, OverflowError) as e:
+        # Return error message instead of result
+        return str(e), symbol, name
+
+
+def evaluate_expression(expression, backend=FLOAT):
+    """
+    Evaluate a typed expression such as "(2 + 3) × 4".
     
-    elif operation == '2':
-        result = subtract(num1, num2)
-        return result, '−', 'Subtraction'
+    Parameters:
+        expression (str): Expression using + − × ÷ ^ and parentheses
+        backend (Backend): Numeric backend (float, decimal or fraction)
     
-    elif operation == '3':
-        result = multiply(num1, num2)
-        return result, '×', 'Multiplication'
+    Returns:
+        float/Decimal/Fraction/str: Result, or an error message if the expression is invalid
+    """
+    try:
+        return expression_cache.evaluate(expression, None, backend)
+    except ExpressionError as e:
+        return f"Invalid expression: {e}"
+    except (ZeroDivisionError, OverflowError) as e:
+        return str(e)
+
+
+def display_expression_result(expression, result):
+    """
+    Display the result of a typed expression.
     
-    elif operation == '4':
-        try:
-            result = divide(num1, num2)
-            return result, '÷', 'Division'
-        except ZeroDivisionError as e:
-            # Return error message instead of result
-            return str(e), '÷', 'Division'
+    Parameters:
+        expression (str): The expression as typed
+        result (float/str): Result or error message
+    """
+    print("\n" + "="*50)
+    print("CALCULATION RESULT")
+    print("="*50)
+    print(f"Expression: {expression}")
+    
+    if isinstance(result, str):
+        print(f"Result: ❌ {result}")
+    else:
+        print(f"Result: ✓ {result}")
+    
+    print("="*50)
 
 
 def display_result(num1, num2, result, symbol, operation_name):
@@ -167,39 +214,97 @@ def display_result(num1, num2, result, symbol, operation_name):
     print("="*50)
 
 
-def display_welcome():
-    """Display welcome banner."""
+def display_welcome(backend=FLOAT):
+    """
+    Display welcome banner.
+    
+    Parameters:
+        backend (Backend): Numeric backend in use
+    """
     print("\n" + "="*50)
     print("🧮  SIMPLE CALCULATOR")
     print("="*50)
     print("Welcome! This calculator performs basic arithmetic.")
+    print("Type a whole expression like (2 + 3) × 4, or press Enter")
+    print("to enter two numbers and pick an operation.")
+    if backend.name == 'decimal':
+        print(f"Mode: decimal ({backend.context.prec} significant digits)")
+    elif backend.name == 'fraction':
+        print("Mode: exact fractions")
     print("="*50)
 
 
 
-def main():
+def parse_arguments(argv=None):
+    """
+    Parse the command-line options.
+    
+    Parameters:
+        argv (list): Arguments (default: sys.argv[1:])
+    
+    Returns:
+        argparse.Namespace: Parsed options
+    """
+    parser = argparse.ArgumentParser(description="Simple calculator (interactive or batch).")
+    parser.add_argument('--batch', nargs='?', const='-', metavar='FILE',
+                        help="evaluate one expression per line from FILE (or stdin if omitted or '-')")
+    parser.add_argument('--output', metavar='FILE', help="write batch results to FILE (default: stdout)")
+    parser.add_argument('--chunk-size', type=int, default=10000, help="lines per batch chunk")
+    parser.add_argument('--workers', type=int, default=0, help="evaluate chunks in N worker processes")
+    parser.add_argument('--mode', choices=BACKEND_NAMES, default='float',
+                        help="number type: binary float (default), decimal or exact fraction")
+    parser.add_argument('--precision', type=int, default=DEFAULT_PRECISION,
+                        help=f"significant digits in decimal mode (default: {DEFAULT_PRECISION})")
+    parser.add_argument('--cache-size', type=int, default=DEFAULT_CACHE_SIZE,
+                        help=f"results kept for repeated expressions, 0 to disable (default: {DEFAULT_CACHE_SIZE})")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
     """
     Main function that runs the calculator program.
     Controls the flow of the entire application.
+    
+    Parameters:
+        argv (list): Command-line arguments (default: sys.argv[1:])
     """
+    args = parse_arguments(argv)
+    try:
+        backend = get_backend(args.mode, args.precision)
+        expression_cache.resize(args.cache_size)
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(2)
+    
+    if args.batch is not None:
+        # Non-interactive: no prompts, results only
+        sys.exit(main_batch(args.batch, args.output, max(args.chunk_size, 1), args.workers,
+                            args.mode, args.precision, args.cache_size))
+    
     # Display welcome message
-    display_welcome()
+    display_welcome(backend)
     
     while True:
-        # Step 1: Get the first number
-        num1 = get_number_input("\n📥 Enter the first number: ")
-        
-        # Step 2: Get the second number
-        num2 = get_number_input("📥 Enter the second number: ")
-        
-        # Step 3: Get operation choice
-        operation = get_operation_choice()
+        expression = input("\n📥 Enter an expression (or press Enter for step by step): ").strip()
         
-        # Step 4: Perform calculation
-        result, symbol, operation_name = perform_calculation(num1, num2, operation)
-        
-        # Step 5: Display result
-        display_result(num1, num2, result, symbol, operation_name)
+        if expression:
+            # Evaluate the whole expression at once
+            display_expression_result(expression, evaluate_expression(expression, backend))
+        else:
+            # Step 1: Get the first number
+            num1 = get_number_input("📥 Enter the first number: ", backend)
+            
+            # Step 2: Get the second number
+            num2 = get_number_input("📥 Enter the second number: ", backend)
+            
+            # Step 3: Get operation choice
+            operation = get_operation_choice()
+            
+            # Step 4: Perform calculation
+            result, symbol, operation_name = perform_calculation(num1, num2, operation, backend)
+            
+            # Step 5: Display result
+            display_result(num1, num2, result, symbol, operation_name)
         
         # Step 6: Ask if user wants to continue
         print("\n" + "-"*50)
@@ -3,22 +3,35 @@
 import tkinter as tk
 from tkinter import messagebox
 import math
+import decimal
+from fractions import Fraction
+
+from calc_engine import (DEFAULT_CACHE_SIZE, DEFAULT_PRECISION, ExpressionError,
+                         expression_cache, get_backend)
+
+OPERATORS = ['+', '−', '×', '÷']
+
+# Number types offered by the mode selector: (label, backend name)
+MODES = [('Float', 'float'), ('Decimal', 'decimal'), ('Fraction', 'fraction')]
+
+DISPLAY_WIDTH = 15
 
 class Calculator:
     """
     Main Calculator class that handles the GUI and calculation logic.
     """
     
-    def __init__(self, root):
+    def __init__(self, root, cache_size=DEFAULT_CACHE_SIZE):
         """
         Initialize the calculator GUI.
         
         Parameters:
             root: Tkinter root window
+            cache_size (int): Results kept for repeated expressions (0 disables the cache)
         """
         self.root = root
         self.root.title("🧮 Simple Calculator")
-        self.root.geometry("400x550")
+        self.root.geometry("400x600")
         self.root.resizable(False, False)
         
         # Set color scheme
@@ -33,11 +46,11 @@ class Calculator:
         # Configure root background
         self.root.configure(bg=self.bg_color)
         
-        # Variables to store calculation state
-        self.current_input = ""
-        self.first_number = None
-        self.operation = None
+        # Variables to store calculation state: the expression being typed,
+        # and whether the display holds a result (a digit starts over)
+        self.expression = ""
         self.new_number = True
+        expression_cache.resize(cache_size)
         
         # Create GUI elements
         self.create_widgets()
@@ -75,6 +88,46 @@ class Calculator:
         )
         self.operation_label.pack(fill=tk.X, padx=20)
         
+        # Mode selector: number type and decimal precision
+        mode_frame = tk.Frame(self.root, bg=self.bg_color)
+        mode_frame.pack(fill=tk.X, padx=20, pady=(0, 10))
+        
+        self.mode = tk.StringVar(value='float')
+        for label, name in MODES:
+            tk.Radiobutton(
+                mode_frame,
+                text=label,
+                value=name,
+                variable=self.mode,
+                command=self.on_mode_change,
+                font=("Arial", 11),
+                bg=self.bg_color,
+                fg=self.button_fg,
+                selectcolor=self.display_bg,
+                activebackground=self.bg_color,
+                activeforeground=self.button_fg
+            ).pack(side=tk.LEFT)
+        
+        self.precision = tk.IntVar(value=DEFAULT_PRECISION)
+        self.precision_box = tk.Spinbox(
+            mode_frame,
+            from_=1,
+            to=100,
+            width=4,
+            textvariable=self.precision,
+            command=self.on_mode_change,
+            font=("Arial", 11),
+            state=tk.DISABLED
+        )
+        self.precision_box.pack(side=tk.RIGHT)
+        tk.Label(
+            mode_frame,
+            text="digits",
+            font=("Arial", 11),
+            bg=self.bg_color,
+            fg="#888"
+        ).pack(side=tk.RIGHT, padx=(0, 5))
+        
       
         buttons_frame = tk.Frame(self.root, bg=self.bg_color)
         buttons_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=(0, 20))
@@ -82,8 +135,9 @@ class Calculator:
         # Button layout: [text, row, column, columnspan, color]
         buttons = [
             # Row 1
-            ('C', 0, 0, 2, self.clear_bg),
-            ('⌫', 0, 2, 1, self.button_bg),
+            ('C', 0, 0, 1, self.clear_bg),
+            ('(', 0, 1, 1, self.button_bg),
+            (')', 0, 2, 1, self.button_bg),
             ('÷', 0, 3, 1, self.operator_bg),
             
             # Row 2
@@ -105,7 +159,8 @@ class Calculator:
             ('+', 3, 3, 1, self.operator_bg),
             
             # Row 5
-            ('0', 4, 0, 2, self.button_bg),
+            ('⌫', 4, 0, 1, self.button_bg),
+            ('0', 4, 1, 1, self.button_bg),
             ('.', 4, 2, 1, self.button_bg),
             ('=', 4, 3, 1, self.equals_bg),
         ]
@@ -151,10 +206,14 @@ class Calculator:
             # Number or decimal point clicked
             self.on_number_click(button_text)
         
-        elif button_text in ['+', '−', '×', '÷']:
+        elif button_text in OPERATORS:
             # Operator clicked
             self.on_operator_click(button_text)
         
+        elif button_text in '()':
+            # Parenthesis clicked
+            self.on_parenthesis_click(button_text)
+        
         elif button_text == '=':
             # Equals clicked
             self.on_equals_click()
@@ -174,18 +233,21 @@ class Calculator:
         Parameters:
             number (str): The number or decimal point clicked
         """
-        # Start new number if flag is set
+        # Start a new expression if the display holds a result
         if self.new_number:
-            self.current_input = ""
+            self.expression = ""
             self.new_number = False
         
-        # Prevent multiple decimal points
-        if number == '.' and '.' in self.current_input:
+        # Prevent multiple decimal points in the current number
+        if number == '.' and '.' in self.current_number():
+            return
+        
+        # A number cannot directly follow a closing parenthesis
+        if self.expression.endswith(')'):
             return
         
-        # Add number to current input
-        self.current_input += number
-        self.update_display(self.current_input)
+        self.expression += number
+        self.update_expression_display()
     
     def on_operator_click(self, operator):
         """
@@ -194,92 +256,197 @@ class Calculator:
         Parameters:
             operator (str): The operator clicked (+, −, ×, ÷)
         """
-        if self.current_input:
-            # If there's a pending operation, calculate it first
-            if self.first_number is not None and self.operation is not None:
-                self.on_equals_click()
-            
-            # Store the first number and operation
-            try:
-                self.first_number = float(self.current_input)
-                self.operation = operator
-                self.new_number = True
-                self.update_operation_label(f"{self.first_number} {operator}")
-            except ValueError:
-                messagebox.showerror("Error", "Invalid number format!")
+        # An operator after a result continues the calculation from it
+        self.new_number = False
+        
+        last = self.expression[-1:]
+        if not last or last == '(':
+            # Only a minus sign can start a number
+            if operator != '−':
+                return
+        elif last in OPERATORS:
+            # Replace the previous operator
+            self.expression = self.expression[:-1]
+            if not self.expression:
+                return
+        
+        self.expression += operator
+        self.update_expression_display()
+    
+    def on_parenthesis_click(self, parenthesis):
+        """
+        Handle parenthesis button clicks.
+        
+        Parameters:
+            parenthesis (str): '(' or ')'
+        """
+        if self.new_number:
+            self.expression = ""
+            self.new_number = False
+        
+        last = self.expression[-1:]
+        if parenthesis == '(':
+            # An opening parenthesis follows an operator or another '('
+            if last and last not in OPERATORS and last != '(':
+                return
+        else:
+            # Close only an open group that holds something
+            if self.open_parentheses() == 0 or last in OPERATORS or last == '(':
+                return
+        
+        self.expression += parenthesis
+        self.update_expression_display()
     
     def on_equals_click(self):
-        """Handle equals button click - perform the calculation."""
-        if self.first_number is not None and self.operation is not None and self.current_input:
-            try:
-                second_number = float(self.current_input)
-                result = self.calculate(self.first_number, second_number, self.operation)
-                
-                # Update display with result
-                if result is not None:
-                    self.update_display(str(result))
-                    self.update_operation_label(
-                        f"{self.first_number} {self.operation} {second_number} ="
-                    )
-                    
-                    # Reset state
-                    self.current_input = str(result)
-                    self.first_number = None
-                    self.operation = None
-                    self.new_number = True
-                
-            except ValueError:
-                messagebox.showerror("Error", "Invalid number format!")
-            except ZeroDivisionError:
-                messagebox.showerror("Error", "Cannot divide by zero!")
-                self.on_clear_click()
+        """Handle equals button click - evaluate the whole expression."""
+        if not self.expression or self.new_number:
+            return
+        
+        # Close any groups the user left open
+        expression = self.expression + ')' * self.open_parentheses()
+        try:
+            result = self.calculate(expression)
+        except ExpressionError:
+            messagebox.showerror("Error", "Invalid expression!")
+            return
+        except ZeroDivisionError:
+            messagebox.showerror("Error", "Cannot divide by zero!")
+            self.on_clear_click()
+            return
+        except OverflowError:
+            messagebox.showerror("Error", "Result is too large!")
+            self.on_clear_click()
+            return
+        
+        if isinstance(result, float) and not math.isfinite(result):
+            messagebox.showerror("Error", "Result is too large!")
+            self.on_clear_click()
+            return
+        
+        # Show the result; the next operator continues from the exact
+        # value, even when the display can only fit an approximation
+        self.update_display(self.fit_result(result))
+        self.update_operation_label(f"{expression} =")
+        self.expression = self.result_expression(result)
+        self.new_number = True
     
     def on_clear_click(self):
         """Handle clear button click - reset calculator."""
-        self.current_input = ""
-        self.first_number = None
-        self.operation = None
+        self.expression = ""
         self.new_number = True
         self.update_display("0")
         self.update_operation_label("")
     
+    def on_mode_change(self):
+        """Handle mode selector changes - precision applies to decimal mode only."""
+        self.precision_box.config(state=tk.NORMAL if self.mode.get() == 'decimal' else tk.DISABLED)
+    
     def on_backspace_click(self):
         """Handle backspace button click - delete last character."""
-        if self.current_input and not self.new_number:
-            self.current_input = self.current_input[:-1]
-            self.update_display(self.current_input if self.current_input else "0")
+        if self.expression and not self.new_number:
+            self.expression = self.expression[:-1]
+            self.update_expression_display()
+    
+    def current_number(self):
+        """
+        Return the number being typed at the end of the expression.
+        
+        Returns:
+            str: Trailing digits and decimal point (may be empty)
+        """
+        number = ""
+        for char in reversed(self.expression):
+            if not (char.isdigit() or char == '.'):
+                break
+            number = char + number
+        return number
     
+    def open_parentheses(self):
+        """
+        Count the parentheses opened but not yet closed.
+        
+        Returns:
+            int: Number of unclosed '('
+        """
+        return self.expression.count('(') - self.expression.count(')')
+    
+    def backend(self):
+        """
+        Return the numeric backend picked in the mode selector.
+        
+        Returns:
+            Backend: Float, decimal (at the chosen precision) or fraction backend
+        """
+        try:
+            precision = self.precision.get()
+        except tk.TclError:
+            # The user is still typing in the precision box
+            precision = DEFAULT_PRECISION
+        return get_backend(self.mode.get(), max(precision, 1))
     
-    def calculate(self, num1, num2, operator):
+    def calculate(self, expression):
         """
-        Perform the calculation based on the operator.
+        Evaluate an expression through the shared expression cache.
         
         Parameters:
-            num1 (float): First number
-            num2 (float): Second number
-            operator (str): Operation to perform
+            expression (str): Expression using + − × ÷ and parentheses
         
         Returns:
-            float: Result of the calculation
+            float/Decimal/Fraction: Result of the calculation
         
         Raises:
+            ExpressionError: If the expression is invalid
             ZeroDivisionError: If division by zero is attempted
         """
-        if operator == '+':
-            return num1 + num2
+        return expression_cache.evaluate(expression, None, self.backend())
+    
+    def result_expression(self, result):
+        """
+        Return a result as expression text that keeps its exact value.
         
-        elif operator == '−':
-            return num1 - num2
+        Fractions and negative numbers are wrapped in parentheses so an
+        operator typed next applies to the whole value.
+        
+        Parameters:
+            result: Result of calculate()
         
-        elif operator == '×':
-            return num1 * num2
+        Returns:
+            str: Expression text
+        """
+        text = self.backend().format(result)
+        if '/' in text or text.startswith('-'):
+            text = f"({text})"
+        return text
+    
+    def fit_result(self, result):
+        """
+        Format a result for the display.
         
-        elif operator == '÷':
-            if num2 == 0:
-                raise ZeroDivisionError("Cannot divide by zero!")
-            return num1 / num2
+        Results too long for the display are shown rounded, marked with
+        "≈", instead of being cut off.
         
-        return None
+        Parameters:
+            result: Result of calculate()
+        
+        Returns:
+            str: At most DISPLAY_WIDTH characters
+        """
+        text = self.backend().format(result)
+        if len(text) <= DISPLAY_WIDTH:
+            return text
+        
+        if isinstance(result, Fraction):
+            # float() would overflow on huge fractions; Decimal does not
+            with decimal.localcontext() as context:
+                context.prec = DISPLAY_WIDTH
+                result = decimal.Decimal(result.numerator) / result.denominator
+        
+        # Fewer significant digits until it fits (exponent included)
+        for digits in range(DISPLAY_WIDTH - 2, 0, -1):
+            text = "≈" + format(result, f".{digits}g")
+            if len(text) <= DISPLAY_WIDTH:
+                return text
+        return text
     
    
     def update_display(self, value):
@@ -289,9 +456,13 @@ class Calculator:
         Parameters:
             value (str): Value to display
         """
-        # Limit display length
-        if len(value) > 15:
-            value = value[:15]
+        self.display.config(text=value if value else "0")
+    
+    def update_expression_display(self):
+        """Show the expression being typed, keeping its end visible."""
+        value = self.expression
+        if len(value) > DISPLAY_WIDTH:
+            value = "…" + value[-(DISPLAY_WIDTH - 1):]
         
         self.display.config(text=value if value else "0")
     
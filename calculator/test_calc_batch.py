@@ -0,0 +1,58 @@
+"""
+Calculator - Batch Mode Tests
+Checks that batch mode writes one result per input line in input order,
+reports errors in place, and gives the same output with small chunks,
+worker processes and every numeric backend.
+
+Run with: python -m pytest -q
+"""
+
+import io
+
+import pytest
+
+from calc_batch import main_batch, run_batch
+
+LINES = "1+2\n\n7/2\n1/0\n2*(3\n0.1+0.2\n   \n2 ^ 10\n"
+RESULTS = ("3.0\n\n3.5\nERROR: Cannot divide by zero!\nERROR: Missing ')' (at position 5)\n"
+           "0.30000000000000004\n\n1024.0\n")
+
+
+def run(text, **options):
+    output = io.StringIO()
+    counts = run_batch(io.StringIO(text), output, **options)
+    return output.getvalue(), counts
+
+
+def test_one_result_per_line_in_order():
+    assert run(LINES) == (RESULTS, (8, 2))
+
+
+@pytest.mark.parametrize('chunk_size, workers', [(1, 0), (3, 0), (2, 2)])
+def test_chunks_and_workers_keep_the_order(chunk_size, workers):
+    text = LINES * 5
+    assert run(text, chunk_size=chunk_size, workers=workers) == (RESULTS * 5, (40, 10))
+
+
+def test_exact_backends():
+    assert run("1/3\n0.1+0.2\n2^-2\n", mode='fraction') == ("1/3\n3/10\n1/4\n", (3, 0))
+    assert run("1/3\n0.1+0.2\n", mode='decimal', precision=5) == ("0.33333\n0.3\n", (2, 0))
+
+
+def test_last_line_without_newline():
+    assert run("1+1\n2+2") == ("2.0\n4.0\n", (2, 0))
+
+
+def test_main_batch_exit_status(tmp_path, capsys):
+    source = tmp_path / "input.txt"
+    output = tmp_path / "output.txt"
+
+    source.write_text("1+2\n2*3\n")
+    assert main_batch(str(source), str(output)) == 0
+    assert output.read_text() == "3.0\n6.0\n"
+    assert "Evaluated 2 line(s)" in capsys.readouterr().err
+
+    source.write_text("1+2\n1/0\n")
+    assert main_batch(str(source), str(output)) == 1
+    assert main_batch(str(tmp_path / "missing.txt"), str(output)) == 1
+    assert main_batch(str(source), str(tmp_path / "no" / "output.txt")) == 1
@@ -0,0 +1,78 @@
+"""
+Calculator - Expression Cache Tests
+Checks that cached results match uncached evaluation on every backend,
+that errors are cached per backend and that compiled programs are reused
+for new variable values.
+
+Run with: python -m pytest -q
+"""
+
+import pytest
+
+import calc_engine
+from calc_engine import FLOAT, FRACTION, ExpressionCache, ExpressionError, evaluate, get_backend
+
+BACKENDS = [FLOAT, get_backend('decimal'), FRACTION]
+EXPRESSIONS = ["1 + 2 * 3", "7 / 2", "2 ^ -2", "0.5 * 0.25", "3 − 1 × 2 ÷ 4"]
+
+
+@pytest.fixture
+def compiles(monkeypatch):
+    """Count calls to compile_expression made by the cache."""
+    calls = []
+    compile_expression = calc_engine.compile_expression
+
+    def counting(text, tokens=None):
+        calls.append(text)
+        return compile_expression(text, tokens)
+    monkeypatch.setattr(calc_engine, 'compile_expression', counting)
+    return calls
+
+
+def test_cache_matches_uncached_results_per_backend():
+    cache = ExpressionCache(maxsize=64)
+    for text in EXPRESSIONS:
+        for backend in BACKENDS:
+            expected = evaluate(text, backend=backend)
+            # First call computes, second is served from the cache
+            for _ in range(2):
+                result = cache.evaluate(text, backend=backend)
+                assert result == expected
+                assert type(result) is type(expected)
+    info = cache.info()
+    assert info.misses == len(EXPRESSIONS) * len(BACKENDS)
+    assert info.hits == len(EXPRESSIONS) * len(BACKENDS)
+
+
+def test_cache_keeps_errors_per_backend():
+    cache = ExpressionCache()
+    for backend in BACKENDS:
+        with pytest.raises(ZeroDivisionError):
+            cache.evaluate("1 / 0", backend=backend)
+    assert evaluate("4 ^ 0.5", backend=FLOAT) == cache.evaluate("4 ^ 0.5", backend=FLOAT)
+    with pytest.raises(ExpressionError):
+        cache.evaluate("4 ^ 0.5", backend=FRACTION)
+
+
+def test_new_variable_values_reuse_the_program(compiles):
+    cache = ExpressionCache()
+    for a in range(20):
+        assert cache.evaluate("a + b", {'a': a, 'b': 2}) == a + 2
+    # Same expression, other spelling and backend: still one compile
+    assert cache.evaluate("a+b", {'a': 1, 'b': 2}, FRACTION) == 3
+    assert compiles == ["a + b"]
+    assert cache.info().misses == 21
+
+
+def test_program_cache_is_bounded(compiles):
+    cache = ExpressionCache(maxsize=2)
+    for text in ["1 + 1", "2 + 2", "3 + 3", "1 + 1"]:
+        cache.evaluate(text)
+    assert len(cache.programs) == 2
+    assert compiles == ["1 + 1", "2 + 2", "3 + 3", "1 + 1"]
+
+    cache.resize(0)
+    assert not cache.programs
+    cache.clear()
+    assert cache.evaluate("a * 2", {'a': 3}) == 6
+    assert not cache.programs
@@ -0,0 +1,97 @@
+"""
+Calculator - Engine Tests
+Checks that the float, decimal and fraction backends agree: same values
+(exactly where the result is representable) and the same errors.
+
+Run with: python -m pytest -q
+"""
+
+import decimal
+from fractions import Fraction
+
+import pytest
+
+from calc_engine import FLOAT, FRACTION, ExpressionError, evaluate, get_backend
+
+DECIMAL = get_backend('decimal')
+BACKENDS = [FLOAT, DECIMAL, FRACTION]
+
+# Expressions with exact rational results
+EXACT = [
+    ("1 + 2 * 3", Fraction(7)),
+    ("(1 + 2) * 3", Fraction(9)),
+    ("7 / 2", Fraction(7, 2)),
+    ("10 / 4 / 5", Fraction(1, 2)),
+    ("-3 ^ 2", Fraction(-9)),
+    ("2 ^ 3 ^ 2", Fraction(512)),
+    ("2 ^ -2", Fraction(1, 4)),
+    ("-(4 - 10) / 4", Fraction(3, 2)),
+    ("0.5 * 0.25", Fraction(1, 8)),
+    ("3 − 1 × 2 ÷ 4", Fraction(5, 2)),
+]
+
+
+@pytest.mark.parametrize('text, expected', EXACT)
+def test_backends_agree_on_exact_results(text, expected):
+    assert evaluate(text, backend=FLOAT) == float(expected)
+    assert Fraction(evaluate(text, backend=DECIMAL)) == expected
+    assert evaluate(text, backend=FRACTION) == expected
+
+
+@pytest.mark.parametrize('text, expected', [
+    ("0.1 + 0.2", Fraction(3, 10)),
+    ("1 / 3 * 3", Fraction(1)),
+    ("2 / 3", Fraction(2, 3)),
+])
+def test_backends_agree_within_their_precision(text, expected):
+    assert evaluate(text, backend=FLOAT) == pytest.approx(float(expected), rel=1e-15)
+    assert abs(Fraction(evaluate(text, backend=DECIMAL)) - expected) < Fraction(1, 10 ** 27)
+    assert evaluate(text, backend=FRACTION) == expected
+
+
+def test_decimal_has_no_binary_rounding():
+    assert evaluate("0.1 + 0.2", backend=DECIMAL) == decimal.Decimal("0.3")
+    assert evaluate("0.1 + 0.2", backend=FLOAT) != 0.3
+
+
+def test_decimal_precision_is_applied():
+    assert str(evaluate("1 / 3", backend=get_backend('decimal', 5))) == "0.33333"
+
+
+@pytest.mark.parametrize('text', ["2 ^ 0.5", "8 ^ (1/3)", "2 ^ 0.5 ^ 0.5"])
+def test_fractional_powers(text):
+    assert float(evaluate(text, backend=DECIMAL)) == pytest.approx(evaluate(text, backend=FLOAT),
+                                                                   rel=1e-15)
+    # Fractions stay exact, so roots are refused rather than rounded
+    with pytest.raises(ExpressionError):
+        evaluate(text, backend=FRACTION)
+
+
+@pytest.mark.parametrize('backend', BACKENDS, ids=lambda backend: backend.name)
+def test_variables_convert_to_the_backend(backend):
+    variables = {'x': "1.5", 'y': 4, 'z': Fraction(1, 4), 'w': 0.5}
+    result = evaluate("x * y - z + w", variables, backend)
+    assert Fraction(result) == Fraction(25, 4)
+
+
+@pytest.mark.parametrize('backend', BACKENDS, ids=lambda backend: backend.name)
+@pytest.mark.parametrize('text, error', [
+    ("1 / 0", ZeroDivisionError),
+    ("5 / (2 - 2)", ZeroDivisionError),
+    ("1 +", ExpressionError),
+    ("(1 + 2", ExpressionError),
+    ("y + 1", ExpressionError),
+    ("(-8) ^ (1/3)", ExpressionError),
+])
+def test_backends_raise_the_same_errors(backend, text, error):
+    with pytest.raises(error):
+        evaluate(text, backend=backend)
+
+
+def test_syntax_error_positions_match_across_backends():
+    positions = set()
+    for backend in BACKENDS:
+        with pytest.raises(ExpressionError) as info:
+            evaluate("1 + * 2", backend=backend)
+        positions.add(info.value.position)
+    assert len(positions) == 1
@@ -0,0 +1,60 @@
+"""
+Calculator - Vector Operation Tests
+Checks that the pure-Python backend converts elements to float the way
+NumPy does, handles zero divisors and matches NumPy when it is installed.
+
+Run with: python -m pytest -q
+"""
+
+import math
+from decimal import Decimal
+from fractions import Fraction
+
+import pytest
+
+from vector_ops import HAVE_NUMPY, add, apply, divide, multiply, subtract
+
+
+def test_fallback_converts_elements_to_float():
+    result = add([1, Decimal("2.5"), Fraction(1, 4), "3"], 1, use_numpy=False)
+    assert result == [2.0, 3.5, 1.25, 4.0]
+    assert all(type(value) is float for value in result)
+
+    # Integer operands give float results, as with NumPy
+    assert divide([7, 9], [2, 3], use_numpy=False).values == [3.5, 3.0]
+    assert type(multiply([2], [3], use_numpy=False)[0]) is float
+
+
+def test_fallback_rejects_non_numbers():
+    with pytest.raises(ValueError):
+        subtract(["abc"], [1], use_numpy=False)
+
+
+def test_fallback_division_by_zero_is_masked():
+    result = divide([1, 2, 3], [1, 0, 2], use_numpy=False)
+    assert result.values[0] == 1.0 and result.values[2] == 1.5
+    assert math.isnan(result.values[1])
+    assert result.zero_division == [False, True, False]
+    assert result.error_count() == 1
+
+    result = divide([1, 2], 0, use_numpy=False)
+    assert all(math.isnan(value) for value in result.values)
+    assert result.error_count() == 2
+
+
+def test_length_mismatch_is_reported():
+    with pytest.raises(ValueError, match="different lengths"):
+        add([1, 2], [1], use_numpy=False)
+
+
+@pytest.mark.skipif(not HAVE_NUMPY, reason="NumPy is not installed")
+@pytest.mark.parametrize('symbol', ['+', '−', '×', '÷'])
+def test_backends_agree(symbol):
+    a = [1, 2.5, Decimal("-4"), 8]
+    b = [2, 0, 0.5, Fraction(1, 4)]
+    expected, expected_mask = apply(symbol, a, b, use_numpy=False)
+    values, mask = apply(symbol, a, b, use_numpy=True)
+    # repr() so that NaN compares equal to NaN
+    assert list(map(repr, values.tolist())) == list(map(repr, expected))
+    if expected_mask is not None:
+        assert mask.tolist() == expected_mask
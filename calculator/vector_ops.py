@@ -0,0 +1,304 @@
+"""
+Vectorized calculator arithmetic over whole arrays and CSV columns.
+
+add, subtract, multiply and divide apply the calculator operations to
+every element at once. NumPy is used when it is installed; otherwise a
+pure-Python fallback gives the same results as lists. The second operand
+may be an array of the same length or a single number.
+
+Division never raises on a bad element: it returns the quotients with NaN
+where the divisor is zero, plus a mask of those positions. This is the
+vector form of divide() raising ZeroDivisionError in calculator_cli.py.
+
+Usage (CSV columns):
+    python vector_ops.py data.csv price / quantity --output result.csv
+"""
+
+import argparse
+import csv
+import math
+import operator
+import sys
+from typing import NamedTuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+HAVE_NUMPY = np is not None
+
+DIVIDE_BY_ZERO_MESSAGE = "Cannot divide by zero!"
+
+# Operator symbols (including the GUI ones) -> function name
+SYMBOLS = {'+': 'add', '-': 'subtract', '−': 'subtract', '*': 'multiply', '×': 'multiply',
+           '/': 'divide', '÷': 'divide'}
+
+
+class DivisionResult(NamedTuple):
+    """Quotients (NaN where the divisor is zero) and the zero-divisor mask."""
+    values: object
+    zero_division: object
+
+    def error_count(self):
+        """Return how many elements divided by zero."""
+        return int(sum(self.zero_division))
+
+
+def use_numpy_for(use_numpy):
+    """
+    Decide whether to use NumPy.
+
+    Parameters:
+        use_numpy (bool): True/False to force a backend, None for automatic
+
+    Returns:
+        bool: True if NumPy should be used
+    """
+    if use_numpy and not HAVE_NUMPY:
+        raise ImportError("NumPy is not installed")
+    return HAVE_NUMPY if use_numpy is None else use_numpy
+
+
+def is_scalar(value):
+    """Check whether an operand is a single number."""
+    return isinstance(value, (int, float)) or (HAVE_NUMPY and np.ndim(value) == 0)
+
+
+def prepare(a, b, numpy_backend):
+    """
+    Convert both operands for the chosen backend and check their lengths.
+
+    Returns:
+        tuple: (a, b) as float arrays/lists, or b as a float if it is a scalar
+    """
+    if numpy_backend:
+        a = np.asarray(a, dtype=float)
+        b = float(b) if is_scalar(b) else np.asarray(b, dtype=float)
+    else:
+        # Same element conversion as NumPy's dtype=float (ints, Decimal, numeric strings)
+        a = list(map(float, a))
+        b = float(b) if is_scalar(b) else list(map(float, b))
+    if not isinstance(b, float) and len(a) != len(b):
+        raise ValueError(f"Operands have different lengths ({len(a)} and {len(b)})")
+    return a, b
+
+
+def elementwise(function, a, b):
+    """Apply a binary function element by element (pure-Python backend)."""
+    if isinstance(b, float):
+        return [function(x, b) for x in a]
+    return list(map(function, a, b))
+
+
+def add(a, b, use_numpy=None):
+    """
+    Add two arrays (or an array and a number) element by element.
+
+    Parameters:
+        a (sequence): First operands
+        b (sequence/float): Second operands, or one number for all elements
+        use_numpy (bool): Force (True) or avoid (False) NumPy; None picks automatically
+
+    Returns:
+        numpy.ndarray/list: Sums
+    """
+    numpy_backend = use_numpy_for(use_numpy)
+    a, b = prepare(a, b, numpy_backend)
+    return a + b if numpy_backend else elementwise(operator.add, a, b)
+
+
+def subtract(a, b, use_numpy=None):
+    """
+    Subtract b from a element by element.
+
+    Parameters:
+        a (sequence): First operands
+        b (sequence/float): Second operands, or one number for all elements
+        use_numpy (bool): Force (True) or avoid (False) NumPy; None picks automatically
+
+    Returns:
+        numpy.ndarray/list: Differences
+    """
+    numpy_backend = use_numpy_for(use_numpy)
+    a, b = prepare(a, b, numpy_backend)
+    return a - b if numpy_backend else elementwise(operator.sub, a, b)
+
+
+def multiply(a, b, use_numpy=None):
+    """
+    Multiply two arrays (or an array and a number) element by element.
+
+    Parameters:
+        a (sequence): First operands
+        b (sequence/float): Second operands, or one number for all elements
+        use_numpy (bool): Force (True) or avoid (False) NumPy; None picks automatically
+
+    Returns:
+        numpy.ndarray/list: Products
+    """
+    numpy_backend = use_numpy_for(use_numpy)
+    a, b = prepare(a, b, numpy_backend)
+    return a * b if numpy_backend else elementwise(operator.mul, a, b)
+
+
+def divide(a, b, use_numpy=None):
+    """
+    Divide a by b element by element without stopping at zero divisors.
+
+    Parameters:
+        a (sequence): Dividends
+        b (sequence/float): Divisors, or one number for all elements
+        use_numpy (bool): Force (True) or avoid (False) NumPy; None picks automatically
+
+    Returns:
+        DivisionResult: (quotients with NaN where b is zero, boolean mask of those positions)
+    """
+    numpy_backend = use_numpy_for(use_numpy)
+    a, b = prepare(a, b, numpy_backend)
+    nan = math.nan
+
+    if numpy_backend:
+        zero = np.full(a.shape, b == 0) if isinstance(b, float) else b == 0
+        values = np.full(a.shape, nan)
+        np.divide(a, b, out=values, where=~zero)
+        return DivisionResult(values, zero)
+
+    if isinstance(b, float):
+        if b == 0:
+            return DivisionResult([nan] * len(a), [True] * len(a))
+        return DivisionResult([x / b for x in a], [False] * len(a))
+    values = [x / y if y else nan for x, y in zip(a, b)]
+    return DivisionResult(values, [y == 0 for y in b])
+
+
+def apply(symbol, a, b, use_numpy=None):
+    """
+    Apply an operation given by its symbol.
+
+    Parameters:
+        symbol (str): + - * / (or − × ÷)
+        a (sequence): First operands
+        b (sequence/float): Second operands
+        use_numpy (bool): Backend choice, as for add()
+
+    Returns:
+        tuple: (results, zero-division mask or None for operations that cannot fail)
+    """
+    name = SYMBOLS.get(symbol)
+    if name is None:
+        raise ValueError(f"Unknown operation '{symbol}'")
+    result = globals()[name](a, b, use_numpy)
+    if isinstance(result, DivisionResult):
+        return result.values, result.zero_division
+    return result, None
+
+
+def read_columns(path, names):
+    """
+    Read numeric columns from a CSV file with a header row.
+
+    Parameters:
+        path (str): CSV file
+        names (list): Column names to read
+
+    Returns:
+        tuple: (header, rows, {name: list of floats})
+
+    Raises:
+        ValueError: If a column is missing or holds a non-number
+    """
+    with open(path, newline='', encoding='utf-8') as file:
+        reader = csv.reader(file)
+        header = next(reader, None)
+        if header is None:
+            raise ValueError("CSV file is empty")
+        rows = list(reader)
+
+    columns = {}
+    for name in names:
+        if name not in header:
+            raise ValueError(f"Column '{name}' not found")
+        index = header.index(name)
+        try:
+            columns[name] = [float(row[index]) for row in rows]
+        except (ValueError, IndexError):
+            bad = next(i for i, row in enumerate(rows, start=2)
+                       if len(row) <= index or not is_number(row[index]))
+            raise ValueError(f"Line {bad}: column '{name}' is not a number") from None
+    return header, rows, columns
+
+
+def is_number(text):
+    """Check whether a CSV cell holds a number."""
+    try:
+        float(text)
+        return True
+    except ValueError:
+        return False
+
+
+def apply_to_csv(path, left, symbol, right, output_path, result_name="result", use_numpy=None):
+    """
+    Compute a new CSV column from one column and another column or a number.
+
+    Parameters:
+        path (str): Input CSV file with a header row
+        left (str): Name of the first operand column
+        symbol (str): Operation symbol
+        right (str): Name of the second operand column, or a number
+        output_path (str): CSV file to write (input columns plus the result)
+        result_name (str): Header of the result column
+        use_numpy (bool): Backend choice, as for add()
+
+    Returns:
+        tuple: (rows written, rows that divided by zero)
+    """
+    right_is_column = not is_number(right)
+    names = [left, right] if right_is_column else [left]
+    header, rows, columns = read_columns(path, names)
+    b = columns[right] if right_is_column else float(right)
+
+    values, zero_division = apply(symbol, columns[left], b, use_numpy)
+    errors = 0
+    with open(output_path, 'w', newline='', encoding='utf-8') as file:
+        writer = csv.writer(file)
+        writer.writerow(header + [result_name])
+        for i, row in enumerate(rows):
+            if zero_division is not None and zero_division[i]:
+                # Same message perform_calculation reports for a zero divisor
+                writer.writerow(row + [DIVIDE_BY_ZERO_MESSAGE])
+                errors += 1
+            else:
+                writer.writerow(row + [repr(float(values[i]))])
+    return len(rows), errors
+
+
+def main():
+    """Command-line entry point for CSV column arithmetic."""
+    parser = argparse.ArgumentParser(description="Apply calculator arithmetic to CSV columns.")
+    parser.add_argument('file', help="CSV file with a header row")
+    parser.add_argument('left', help="first operand column")
+    parser.add_argument('operation', choices=sorted(SYMBOLS), help="operation")
+    parser.add_argument('right', help="second operand column, or a number")
+    parser.add_argument('--output', required=True, help="CSV file to write")
+    parser.add_argument('--column', default='result', help="name of the result column")
+    parser.add_argument('--no-numpy', action='store_true', help="use the pure-Python backend")
+    args = parser.parse_args()
+
+    try:
+        count, errors = apply_to_csv(args.file, args.left, args.operation, args.right,
+                                     args.output, args.column,
+                                     use_numpy=False if args.no_numpy else None)
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    backend = "NumPy" if HAVE_NUMPY and not args.no_numpy else "pure Python"
+    print(f"✓ Wrote {count:,} row(s) to {args.output} ({backend})")
+    if errors:
+        print(f"⚠ {errors:,} row(s) divided by zero")
+
+
+if __name__ == "__main__":
+    main()
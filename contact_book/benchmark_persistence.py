@@ -0,0 +1,84 @@
+"""
+Contact Management System - Persistence Benchmark
+Measures how long each add_contact call takes with synchronous saves and
+with the write-behind writer, for an address book that already holds
+many contacts.
+
+Usage:
+    python benchmark_persistence.py [existing_contacts] [mutations]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+
+from contact_manager import ContactManager
+from contact_persistence import atomic_write_json
+
+
+def seed_file(path: str, count: int):
+    """Write an address book with count contacts"""
+    contacts = [{
+        'name': "Seed Contact",
+        'phone': f"97{i:08d}",
+        'email': f"seed.{i}@example.com",
+        'address': "Lakeside, Pokhara"
+    } for i in range(count)]
+    atomic_write_json(path, contacts)
+
+
+def run(path: str, mutations: int, write_behind: bool) -> dict:
+    """Add mutations contacts one by one and time each call"""
+    with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+        manager = ContactManager(path, write_behind=write_behind)
+
+    latencies = []
+    start = time.perf_counter()
+    for i in range(mutations):
+        call = time.perf_counter()
+        manager.add_contact("Bench Contact", f"98{i:08d}", f"bench.{i}@example.com", "Kathmandu")
+        latencies.append(time.perf_counter() - call)
+    mutate_seconds = time.perf_counter() - start
+
+    flush_start = time.perf_counter()
+    manager.close()
+    flush_seconds = time.perf_counter() - flush_start
+
+    latencies.sort()
+    return {
+        'p50': latencies[len(latencies) // 2] * 1000,
+        'p99': latencies[int(len(latencies) * 0.99)] * 1000,
+        'total': mutate_seconds,
+        'flush': flush_seconds,
+    }
+
+
+def main():
+    """Run the benchmark for both modes and print a summary table"""
+    existing = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    mutations = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+
+    print("=" * 70)
+    print(" " * 20 + "CONTACT PERSISTENCE BENCHMARK")
+    print("=" * 70)
+    print(f"Existing contacts: {existing:,}   add_contact calls: {mutations:,}\n")
+    print(f"{'Mode':<14} {'p50 (ms)':>10} {'p99 (ms)':>10} {'Adds (s)':>10} {'Flush (s)':>10}")
+    print("-" * 70)
+
+    with tempfile.TemporaryDirectory() as directory:
+        for label, write_behind in (("synchronous", False), ("write-behind", True)):
+            path = os.path.join(directory, f"{label}.json")
+            seed_file(path, existing)
+            result = run(path, mutations, write_behind)
+            print(f"{label:<14} {result['p50']:>10.2f} {result['p99']:>10.2f} "
+                  f"{result['total']:>10.2f} {result['flush']:>10.2f}")
+
+    print("-" * 70)
+    print("Write-behind coalesces bursts of changes; close() waits for the last write.")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Contact Management System - Search Benchmark
+Compares ContactManager.search_contacts (trigram index) with the original
+linear scan over every contact.
+
+Usage:
+    python benchmark_search.py [contact_count]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+
+from contact_manager import ContactManager
+
+FIRST_NAMES = ["Abina", "Krishna", "Sita", "Ram", "Hari", "Gita", "Maya", "Bikash",
+               "Anjali", "Suman", "Nabin", "Pooja", "Rajesh", "Sarita", "Deepak", "Asha"]
+LAST_NAMES = ["Bhandari", "Sharma", "Thapa", "Gurung", "Karki", "Adhikari", "Shrestha",
+              "Rai", "Tamang", "Poudel", "Khadka", "Magar", "Basnet", "Joshi"]
+SYLLABLES = ["ka", "ri", "ma", "no", "su", "te", "la", "pa", "vi", "do", "ge", "ru",
+             "sha", "bi", "lo", "ne", "ya", "to", "chi", "mu"]
+
+QUERIES = ["bhandari", "abina bha", "ram", "karimano", "sarita shr", "98475", "984-753", "ka", "zzz"]
+
+
+def generate_contacts(count: int) -> list:
+    """Build count contacts with unique phones and emails"""
+    rng = random.Random(42)
+    contacts = []
+    for i in range(count):
+        first = rng.choice(FIRST_NAMES)
+        # Mix common surnames with generated ones so queries have varied selectivity
+        if i % 4 == 0:
+            last = rng.choice(LAST_NAMES)
+        else:
+            last = "".join(rng.choice(SYLLABLES) for _ in range(3)).title()
+        contacts.append({
+            'name': f"{first} {last}",
+            'phone': f"98{rng.randrange(10 ** 8):08d}{i}",
+            'email': f"{first.lower()}.{i}@example.com",
+            'address': "khaireni"
+        })
+    return contacts
+
+
+def linear_search(contacts: list, query: str) -> list:
+    """The original search_contacts: scan every contact"""
+    query = query.strip().lower()
+    results = []
+    for contact in contacts:
+        if (query in contact['name'].lower() or
+                query in contact['phone']):
+            results.append(contact)
+    return results
+
+
+def time_queries(search) -> list:
+    """Run every query a few times and return (query, matches, ms/query) rows"""
+    rows = []
+    for query in QUERIES:
+        repeats = 3
+        start = time.perf_counter()
+        for _ in range(repeats):
+            matches = search(query)
+        rows.append((query, len(matches), (time.perf_counter() - start) / repeats * 1000))
+    return rows
+
+
+def main():
+    """Run the benchmark and print a summary table"""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+
+    print("=" * 70)
+    print(" " * 20 + "CONTACT SEARCH BENCHMARK")
+    print("=" * 70)
+
+    contacts = generate_contacts(count)
+
+    # Start from an empty manager (its file does not exist)
+    with tempfile.TemporaryDirectory() as directory:
+        with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+            manager = ContactManager(os.path.join(directory, "contacts.json"))
+
+    start = time.perf_counter()
+    manager.contacts = contacts
+    manager.rebuild_indexes()
+    manager.get_search_index()
+    build = time.perf_counter() - start
+    print(f"Contacts: {count:,}  (index build: {build:.1f} s, "
+          f"{len(manager.search_index.postings):,} trigrams)\n")
+
+    scan_rows = time_queries(lambda q: linear_search(contacts, q))
+    index_rows = time_queries(manager.search_contacts)
+
+    print(f"{'Query':<14} {'Scan hits':>10} {'Index hits':>11} {'Scan (ms)':>11} {'Index (ms)':>11} {'Speedup':>8}")
+    print("-" * 70)
+    for (query, scan_hits, scan_ms), (_, index_hits, index_ms) in zip(scan_rows, index_rows):
+        print(f"{query!r:<14} {scan_hits:>10,} {index_hits:>11,} {scan_ms:>11.1f} "
+              f"{index_ms:>11.2f} {scan_ms / max(index_ms, 1e-6):>7.0f}x")
+
+    print("-" * 70)
+    print("Phone queries with separators match digits only in the index, so hit")
+    print("counts differ from the scan for '984-753'.")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
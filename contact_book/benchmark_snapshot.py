@@ -0,0 +1,73 @@
+"""
+Contact Management System - Snapshot Format Benchmark
+Compares the indented JSON address book with the binary snapshot format:
+file size, save time and load time.
+
+Usage:
+    python benchmark_snapshot.py [contact_count]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+
+from contact_manager import ContactManager
+from contact_snapshot import write_contacts_file
+
+
+def build_contacts(count: int) -> list:
+    """Build count contacts with unique phones and emails"""
+    return [{
+        'name': "Contact Person",
+        'phone': f"98{i:08d}",
+        'email': f"contact.{i}@example.com",
+        'address': "Lakeside, Pokhara"
+    } for i in range(count)]
+
+
+def measure(path: str, contacts: list) -> dict:
+    """Save contacts to path, then load them with ContactManager"""
+    start = time.perf_counter()
+    write_contacts_file(path, contacts)
+    save_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+        manager = ContactManager(path)
+    load_seconds = time.perf_counter() - start
+
+    assert manager.get_contact_count() == len(contacts)
+    return {'size': os.path.getsize(path), 'save': save_seconds, 'load': load_seconds}
+
+
+def main():
+    """Run the benchmark and print a summary table"""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    contacts = build_contacts(count)
+
+    print("=" * 70)
+    print(" " * 20 + "CONTACT SNAPSHOT FORMAT BENCHMARK")
+    print("=" * 70)
+    print(f"Contacts: {count:,}  (load includes building the phone/email indexes)\n")
+    print(f"{'Format':<20} {'Size (MB)':>12} {'Save (s)':>10} {'Load (s)':>10}")
+    print("-" * 70)
+
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for label, name in (("JSON (indent=4)", "contacts.json"), ("binary snapshot", "contacts.bin")):
+            result = measure(os.path.join(directory, name), contacts)
+            results.append(result)
+            print(f"{label:<20} {result['size'] / 1e6:>12.1f} {result['save']:>10.2f} {result['load']:>10.2f}")
+
+    json_result, binary_result = results
+    print("-" * 70)
+    print(f"Binary is {json_result['size'] / binary_result['size']:.1f}x smaller, saves "
+          f"{json_result['save'] / binary_result['save']:.1f}x and loads "
+          f"{json_result['load'] / binary_result['load']:.1f}x faster.")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
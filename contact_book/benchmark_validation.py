@@ -0,0 +1,117 @@
+"""
+Contact Management System - Validation Benchmark
+Measures the throughput of each contact validator on synthetic records:
+the original raw-pattern re.match/re.sub versions, the precompiled
+validators, and the batch validate_many API.
+
+Usage:
+    python benchmark_validation.py [record_count]
+"""
+
+import random
+import re
+import sys
+import time
+
+import contact_validation
+from contact_validation import validate_many
+
+
+def original_name(name):
+    if not name or not name.strip():
+        return False
+    return bool(re.match(r"^[A-Za-z\s\-']+$", name.strip()))
+
+
+def original_phone(phone):
+    if not phone or not phone.strip():
+        return False
+    cleaned = re.sub(r'[\s\-()]', '', phone)
+    if cleaned.startswith('+'):
+        return bool(re.match(r'^\+\d{10,15}$', cleaned))
+    return bool(re.match(r'^\d{10,15}$', cleaned))
+
+
+def original_email(email):
+    if not email or not email.strip():
+        return False
+    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
+    return bool(re.match(pattern, email.strip()))
+
+
+def original_address(address):
+    return bool(address and address.strip())
+
+
+def generate_records(count: int) -> list:
+    """Build count records, roughly one in ten with an invalid field"""
+    rng = random.Random(7)
+    records = []
+    for i in range(count):
+        record = {
+            'name': rng.choice(["Abina Bhandari", "Krishna O'Neil", "Sita Rai-Thapa", "Ram Karki"]),
+            'phone': rng.choice([f"98{i:08d}", f"+977 98{i:08d}", f"(980) {i:07d}"]),
+            'email': f"user.{i}@example.com",
+            'address': "Lakeside, Pokhara"
+        }
+        if i % 10 == 0:
+            field = rng.choice(contact_validation.FIELDS)
+            record[field] = {'name': "R2-D2", 'phone': "12345", 'email': "no-at-sign",
+                             'address': "   "}[field]
+        records.append(record)
+    return records
+
+
+def throughput(function, values) -> float:
+    """Return values validated per second"""
+    start = time.perf_counter()
+    for value in values:
+        function(value)
+    return len(values) / (time.perf_counter() - start)
+
+
+def main():
+    """Run the benchmark and print records/second per validator"""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    records = generate_records(count)
+
+    print("=" * 70)
+    print(" " * 20 + "CONTACT VALIDATION BENCHMARK")
+    print("=" * 70)
+    print(f"Records: {count:,}\n")
+    print(f"{'Validator':<12} {'re.match (k/s)':>16} {'compiled (k/s)':>16} {'batch (k/s)':>14}")
+    print("-" * 70)
+
+    originals = {'name': original_name, 'phone': original_phone,
+                 'email': original_email, 'address': original_address}
+
+    total = {'original': 0.0, 'compiled': 0.0}
+    for field in contact_validation.FIELDS:
+        values = [record[field] for record in records]
+        compiled = getattr(contact_validation, f"validate_{field}")
+
+        original_rate = throughput(originals[field], values)
+        compiled_rate = throughput(compiled, values)
+
+        start = time.perf_counter()
+        validate_many(records, fields=(field,))
+        batch_rate = count / (time.perf_counter() - start)
+
+        total['original'] += count / original_rate
+        total['compiled'] += count / compiled_rate
+        print(f"{field:<12} {original_rate / 1e3:>16,.0f} {compiled_rate / 1e3:>16,.0f} {batch_rate / 1e3:>14,.0f}")
+
+    start = time.perf_counter()
+    masks = validate_many(records)
+    batch_seconds = time.perf_counter() - start
+    invalid = sum(any(mask[i] for mask in masks.values()) for i in range(count))
+
+    print("-" * 70)
+    print(f"{'all fields':<12} {count / total['original'] / 1e3:>16,.0f} "
+          f"{count / total['compiled'] / 1e3:>16,.0f} {count / batch_seconds / 1e3:>14,.0f}")
+    print(f"\nInvalid records found: {invalid:,}")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
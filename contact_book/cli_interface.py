@@ -1,7 +1,9 @@
 
 
-from contact_manager import ContactManager
+from contact_manager import ContactManager, CONTACTS_FILE
+from contact_mmap import ReadOnlyContactBook
 import os
+import sys
 
 def clear_screen():
     """Clear the console screen"""
@@ -203,8 +205,18 @@ def show_statistics_ui(manager):
 
 def main():
     """Main function to run the CLI application"""
-    # Initialize contact manager
-    manager = ContactManager()
+    # Initialize contact manager (--read-only maps the file for lookups only)
+    if '--read-only' in sys.argv[1:]:
+        try:
+            manager = ReadOnlyContactBook(CONTACTS_FILE)
+        except FileNotFoundError:
+            print(f"✗ {CONTACTS_FILE} does not exist yet. Start without --read-only to add contacts.")
+            sys.exit(1)
+        except (OSError, ValueError) as e:
+            print(f"✗ Could not open {CONTACTS_FILE} read-only: {e}")
+            sys.exit(1)
+    else:
+        manager = ContactManager()
     
     while True:
         clear_screen()
@@ -0,0 +1,228 @@
+"""
+Contact Management System - Bulk Import
+This module imports contacts from CSV and vCard files. Records are streamed
+from the file, validated in chunks (optionally in a process pool), checked
+for duplicates against the existing contacts and within the file, and saved
+with a single write at the end. Rejected records go to a report.
+
+Usage:
+    python contact_import.py FILE [--format csv|vcard] [--workers N]
+                                  [--chunk-size N] [--report REJECTS.csv]
+                                  [--contacts CONTACTS.json]
+"""
+
+import argparse
+import csv
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from contact_manager import CONTACTS_FILE, ContactManager
+from contact_validation import FIELDS, first_errors, validate_many
+
+# (source line number, record with the four contact fields)
+Record = Tuple[int, Dict[str, str]]
+
+
+def read_csv(path: str) -> Iterator[Record]:
+    """
+    Stream records from a CSV file with a header row
+    Header names are matched case-insensitively; missing columns are empty.
+    """
+    with open(path, 'r', newline='', encoding='utf-8-sig') as file:
+        reader = csv.reader(file)
+        header = next(reader, None)
+        if header is None:
+            return
+        columns = [name.strip().lower() for name in header]
+
+        for row in reader:
+            if not any(cell.strip() for cell in row):
+                continue
+            values = dict(zip(columns, row))
+            yield reader.line_num, {field: values.get(field, '') for field in FIELDS}
+
+
+def read_vcard(path: str) -> Iterator[Record]:
+    """
+    Stream records from a vCard (.vcf) file
+    Uses FN, the first TEL and EMAIL, and the first ADR of each card.
+    """
+    def cards(lines):
+        """Group lines per card, unfolding continuation lines"""
+        card, start = None, 0
+        for number, line in enumerate(lines, 1):
+            line = line.rstrip('\r\n')
+            if card and line[:1] in (' ', '\t'):
+                card[-1] += line[1:]
+                continue
+
+            upper = line.strip().upper()
+            if upper == 'BEGIN:VCARD':
+                card, start = [], number
+            elif upper == 'END:VCARD' and card is not None:
+                yield start, card
+                card = None
+            elif card is not None and line:
+                card.append(line)
+
+    with open(path, 'r', encoding='utf-8-sig') as file:
+        for start, lines in cards(file):
+            record = dict.fromkeys(FIELDS, '')
+            for line in lines:
+                key, _, value = line.partition(':')
+                # Drop parameters (TEL;TYPE=CELL) and group prefixes (item1.EMAIL)
+                prop = key.split(';', 1)[0].rsplit('.', 1)[-1].upper()
+
+                if prop == 'FN' and not record['name']:
+                    record['name'] = value
+                elif prop == 'TEL' and not record['phone']:
+                    record['phone'] = value
+                elif prop == 'EMAIL' and not record['email']:
+                    record['email'] = value
+                elif prop == 'ADR' and not record['address']:
+                    parts = [part.strip() for part in value.split(';')]
+                    record['address'] = ', '.join(part for part in parts if part)
+            yield start, record
+
+
+def detect_format(path: str) -> str:
+    """Guess the file format from its extension"""
+    extension = os.path.splitext(path)[1].lower()
+    return 'vcard' if extension in ('.vcf', '.vcard') else 'csv'
+
+
+def validate_chunk(chunk: List[Record]) -> List[Tuple[int, Dict[str, str], Optional[str]]]:
+    """
+    Validate a chunk of records (runs in worker processes when enabled)
+    Returns: (line, record, error message or None) for every record
+    """
+    errors = first_errors(validate_many([record for _, record in chunk]))
+    return [(line, record, error) for (line, record), error in zip(chunk, errors)]
+
+
+def validated_chunks(records: Iterator[Record], chunk_size: int, workers: int):
+    """Yield validated chunks in file order, keeping at most a few chunks in flight"""
+    chunks = iter(lambda: list(islice(records, chunk_size)), [])
+
+    if workers <= 1:
+        for chunk in chunks:
+            yield validate_chunk(chunk)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(validate_chunk, chunk))
+            if len(pending) >= workers * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def import_contacts(manager: ContactManager, path: str, file_format: str = None,
+                    chunk_size: int = 5000, workers: int = 1) -> Tuple[int, List[Dict]]:
+    """
+    Import contacts from a CSV or vCard file into manager
+    Returns: (number imported, list of rejects with 'line' and 'reason' keys)
+             If saving fails nothing is imported and the count is -1.
+    """
+    file_format = file_format or detect_format(path)
+    records = read_vcard(path) if file_format == 'vcard' else read_csv(path)
+
+    accepted = []
+    rejects = []
+    batch_phones = {}
+    batch_emails = {}
+
+    def reject(line, record, reason):
+        rejects.append({'line': line, **record, 'reason': reason.lstrip('✗ ')})
+
+    for chunk in validated_chunks(records, chunk_size, workers):
+        for line, record, error in chunk:
+            if error:
+                reject(line, record, error)
+                continue
+
+            phone = manager.normalize_phone(record['phone'])
+            email = manager.normalize_email(record['email'])
+
+            # Duplicates against the existing contacts, then within the file
+            if phone in manager.phone_index:
+                reject(line, record, f"Contact with phone {record['phone']} already exists")
+            elif email in manager.email_index:
+                reject(line, record, f"Contact with email {record['email']} already exists")
+            elif phone in batch_phones:
+                reject(line, record, f"Duplicate phone (first seen on line {batch_phones[phone]})")
+            elif email in batch_emails:
+                reject(line, record, f"Duplicate email (first seen on line {batch_emails[email]})")
+            else:
+                batch_phones[phone] = line
+                batch_emails[email] = line
+                accepted.append(manager.make_contact(
+                    record['name'], record['phone'], record['email'], record['address']))
+
+    if accepted and not manager.add_contacts(accepted):
+        return -1, rejects
+
+    return len(accepted), rejects
+
+
+def write_reject_report(rejects: List[Dict], path: str) -> bool:
+    """Write rejected records to a CSV report"""
+    try:
+        with open(path, 'w', newline='', encoding='utf-8') as file:
+            writer = csv.DictWriter(file, fieldnames=('line',) + FIELDS + ('reason',))
+            writer.writeheader()
+            writer.writerows(rejects)
+        return True
+    except OSError as e:
+        print(f"✗ Error writing reject report: {e}")
+        return False
+
+
+def main():
+    """Command-line entry point"""
+    parser = argparse.ArgumentParser(description="Import contacts from a CSV or vCard file.")
+    parser.add_argument('file', help="CSV (with a name,phone,email,address header) or .vcf file")
+    parser.add_argument('--format', choices=('csv', 'vcard'), help="file format (default: from extension)")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="validate in N worker processes (default: 1, no pool)")
+    parser.add_argument('--chunk-size', type=int, default=5000, help="records per validation chunk")
+    parser.add_argument('--report', help="write rejected records to this CSV file")
+    parser.add_argument('--contacts', default=CONTACTS_FILE,
+                        help=f"address book to import into (default: {CONTACTS_FILE})")
+    args = parser.parse_args()
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.chunk_size < 1:
+        parser.error("--chunk-size must be at least 1")
+
+    if not os.path.exists(args.file):
+        print(f"✗ File not found: {args.file}")
+        return
+
+    manager = ContactManager(args.contacts)
+    imported, rejects = import_contacts(manager, args.file, args.format,
+                                        args.chunk_size, args.workers)
+
+    if imported < 0:
+        print("✗ Failed to save imported contacts. Nothing was imported.")
+    else:
+        print(f"✓ Imported {imported} contact(s).")
+
+    if rejects:
+        print(f"⚠ Rejected {len(rejects)} record(s).")
+        if args.report and write_reject_report(rejects, args.report):
+            print(f"✓ Reject report written to {args.report}")
+        elif not args.report:
+            for reject in rejects[:10]:
+                print(f"  line {reject['line']}: {reject['reason']}")
+            if len(rejects) > 10:
+                print(f"  ... use --report to see all {len(rejects)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,158 +1,408 @@
 
 
-import json
 import re
 import os
-from typing import List, Dict, Optional
+import threading
+from functools import wraps
+from typing import List, Dict, Optional, Set, Tuple
+from contact_search import TrigramIndex
+import contact_validation
+from contact_validation import FIELD_ERRORS, PHONE_SEPARATORS
+from contact_persistence import WriteBehindWriter
+from contact_snapshot import read_contacts_file, write_contacts_file
 
 # Constants
 CONTACTS_FILE = "contacts.json"
 
+# Search normalization patterns, compiled once
+NON_DIGITS = re.compile(r'\D')
+PHONE_QUERY = re.compile(r'[\d\s\-()+]+')
+
+def synchronized(method):
+    """Run a ContactManager method while holding the manager's lock"""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
 class ContactManager:
     """Main class to manage all contact operations"""
     
-    def __init__(self):
-        """Initialize the ContactManager and load existing contacts"""
-        self.contacts = []
+    def __init__(self, path: str = CONTACTS_FILE, write_behind: bool = False,
+                 verbose: bool = True):
+        """
+        Initialize the ContactManager and load existing contacts
+        path: file holding this address book (JSON, or binary if it ends in .bin)
+        write_behind: save on a background thread instead of in each mutation;
+                      call flush() or close() to wait for the data to reach disk
+        verbose: print status messages; False keeps the manager silent
+        """
+        self.path = path
+        self.verbose = verbose
+        # Contacts by record number, in contact list order. Record numbers
+        # never change, so deleting a contact leaves the indexes of the
+        # others alone; the positional list is rebuilt only when asked for.
+        self.records: Dict[int, Dict] = {}
+        self.next_record = 0
+        self.ordered: Optional[Tuple[List[Dict], Dict[int, int]]] = None
+        # Guards contacts and indexes when searches run on a worker thread
+        self.lock = threading.RLock()
+        # Normalized phone / email -> record number
+        self.phone_index: Dict[str, int] = {}
+        self.email_index: Dict[str, int] = {}
+        # (field, key) pairs that several contacts in the file share
+        self.shared_keys: Set[Tuple[str, str]] = set()
+        # Trigram index over lowercase names and phone digits, keyed by
+        # record number; built on the first search so startup stays fast
+        self.search_index: Optional[TrigramIndex] = None
         self.load_contacts()
+        
+        self.writer = (WriteBehindWriter(path, self.snapshot, write=write_contacts_file)
+                       if write_behind else None)
+    
+    @property
+    def contacts(self) -> List[Dict]:
+        """All contacts as a list, in the order they were added"""
+        return self.contact_order()[0]
+    
+    @contacts.setter
+    def contacts(self, contacts: List[Dict]):
+        """Replace all contacts (call rebuild_indexes afterwards)"""
+        self.records = dict(enumerate(contacts))
+        self.next_record = len(contacts)
+        self.ordered = None
+    
+    def contact_order(self) -> Tuple[List[Dict], Dict[int, int]]:
+        """Return (contact list, record number -> position), rebuilt after deletes"""
+        if self.ordered is None:
+            self.ordered = (list(self.records.values()),
+                            {record: i for i, record in enumerate(self.records)})
+        return self.ordered
+    
+    def log(self, message: str):
+        """Print a status message unless the manager is silent"""
+        if self.verbose:
+            print(message)
     
     def load_contacts(self):
-        """Load contacts from JSON file"""
+        """Load contacts from the JSON or binary snapshot file"""
         try:
-            if os.path.exists(CONTACTS_FILE):
-                with open(CONTACTS_FILE, 'r') as file:
-                    self.contacts = json.load(file)
-                print(f"✓ Loaded {len(self.contacts)} contacts successfully.")
+            if os.path.exists(self.path):
+                self.contacts = read_contacts_file(self.path)
+                self.log(f"✓ Loaded {len(self.contacts)} contacts successfully.")
             else:
-                print("✓ Starting with empty contact list.")
+                self.log("✓ Starting with empty contact list.")
                 self.contacts = []
-        except json.JSONDecodeError:
-            print("⚠ Warning: Corrupted contacts file. Starting fresh.")
+        except ValueError:
+            # Covers json.JSONDecodeError and damaged binary snapshots
+            self.log("⚠ Warning: Corrupted contacts file. Starting fresh.")
             self.contacts = []
         except Exception as e:
-            print(f"⚠ Error loading contacts: {e}")
+            self.log(f"⚠ Error loading contacts: {e}")
             self.contacts = []
+        
+        self.rebuild_indexes()
+    
+    @staticmethod
+    def normalize_phone(phone: str) -> str:
+        """Normalize a phone number for lookups (drop spaces, hyphens, parentheses)"""
+        return PHONE_SEPARATORS.sub('', phone)
+    
+    @staticmethod
+    def normalize_email(email: str) -> str:
+        """Normalize an email address for lookups (trimmed, lowercase)"""
+        return email.strip().lower()
+    
+    @staticmethod
+    def search_texts(contact: Dict) -> tuple:
+        """Return the texts a contact is searchable by (lowercase name, phone digits)"""
+        return contact['name'].lower(), NON_DIGITS.sub('', contact['phone'])
+    
+    def rebuild_indexes(self):
+        """Rebuild the phone and email indexes from the contact list"""
+        phone_index = {}
+        email_index = {}
+        shared_keys = set()
+        normalize_phone = PHONE_SEPARATORS.sub
+        # setdefault keeps the first contact if the file holds duplicates
+        for record, contact in self.records.items():
+            phone = normalize_phone('', contact['phone'])
+            if phone_index.setdefault(phone, record) != record:
+                shared_keys.add(('phone', phone))
+            email = contact['email'].strip().lower()
+            if email_index.setdefault(email, record) != record:
+                shared_keys.add(('email', email))
+        self.phone_index = phone_index
+        self.email_index = email_index
+        self.shared_keys = shared_keys
+        self.search_index = None
+    
+    @synchronized
+    def get_search_index(self) -> TrigramIndex:
+        """Return the search index, building it on first use"""
+        if self.search_index is None:
+            index = TrigramIndex()
+            for record, contact in self.records.items():
+                index.add(record, *self.search_texts(contact))
+            self.search_index = index
+        return self.search_index
+    
+    def release(self, index: Dict[str, int], key: str, record: int, field: str):
+        """
+        Drop an index key held by a record. If the file holds duplicates of
+        the key, the next contact that has it takes it over, like a linear scan.
+        """
+        if index.get(key) != record:
+            return
+        del index[key]
+        
+        if (field, key) in self.shared_keys:
+            normalize = self.normalize_phone if field == 'phone' else self.normalize_email
+            holders = [other for other, contact in self.records.items()
+                       if other != record and normalize(contact[field]) == key]
+            if holders:
+                index[key] = holders[0]
+            if len(holders) < 2:
+                self.shared_keys.discard((field, key))
+    
+    def index_contact(self, contact: Dict, record: int):
+        """Add a contact's phone and email to the indexes"""
+        self.phone_index[self.normalize_phone(contact['phone'])] = record
+        self.email_index[self.normalize_email(contact['email'])] = record
+        if self.search_index is not None:
+            self.search_index.add(record, *self.search_texts(contact))
+    
+    def unindex_contact(self, contact: Dict, record: int):
+        """Remove a contact's phone and email from the indexes"""
+        self.release(self.phone_index, self.normalize_phone(contact['phone']), record, 'phone')
+        self.release(self.email_index, self.normalize_email(contact['email']), record, 'email')
+        if self.search_index is not None:
+            self.search_index.remove(record)
+    
+    def insert_record(self, record: int, contact: Dict):
+        """Put a removed contact back at its old place in the contact order"""
+        self.records[record] = contact
+        if record != max(self.records):
+            self.records = dict(sorted(self.records.items()))
+        self.ordered = None
     
     def save_contacts(self):
-        """Save contacts to JSON file"""
+        """
+        Save contacts to file (atomically: temp file, fsync, rename)
+        With write-behind the save is only scheduled; once the writer is
+        closed it is written synchronously and a failure is reported.
+        """
+        if self.writer is not None:
+            return self.writer.schedule()
+        
         try:
-            with open(CONTACTS_FILE, 'w') as file:
-                json.dump(self.contacts, file, indent=4)
+            write_contacts_file(self.path, self.contacts)
             return True
         except Exception as e:
-            print(f"✗ Error saving contacts: {e}")
+            self.log(f"✗ Error saving contacts: {e}")
             return False
     
-    @staticmethod
-    def validate_name(name: str) -> bool:
-        """Validate contact name (non-empty, alphabetic with spaces)"""
-        if not name or not name.strip():
-            return False
-        # Allow letters, spaces, hyphens, and apostrophes
-        return bool(re.match(r"^[A-Za-z\s\-']+$", name.strip()))
+    @synchronized
+    def snapshot(self) -> List[Dict]:
+        """Return a copy of the contacts that later mutations cannot change"""
+        return [dict(contact) for contact in self.records.values()]
     
-    @staticmethod
-    def validate_phone(phone: str) -> bool:
-        """Validate phone number (10-15 digits, may include +, spaces, hyphens)"""
-        if not phone or not phone.strip():
-            return False
-        # Remove spaces, hyphens, and parentheses for validation
-        cleaned = re.sub(r'[\s\-()]', '', phone)
-        # Check if it starts with + and has 10-15 digits
-        if cleaned.startswith('+'):
-            return bool(re.match(r'^\+\d{10,15}$', cleaned))
-        # Or just 10-15 digits
-        return bool(re.match(r'^\d{10,15}$', cleaned))
+    def flush(self) -> bool:
+        """
+        Make sure every change is on disk
+        Returns: False if a pending write-behind save failed
+        """
+        if self.writer is None:
+            return True
+        return self.writer.flush()
     
-    @staticmethod
-    def validate_email(email: str) -> bool:
-        """Validate email address format"""
-        if not email or not email.strip():
-            return False
-        # Basic email validation pattern
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return bool(re.match(pattern, email.strip()))
+    def close(self) -> bool:
+        """Flush the address book and stop its background writer"""
+        if self.writer is None:
+            return True
+        return self.writer.close()
     
-    @staticmethod
-    def validate_address(address: str) -> bool:
-        """Validate address (just check if not empty)"""
-        return bool(address and address.strip())
+    # Validators live in contact_validation; these stay for existing callers
+    validate_name = staticmethod(contact_validation.validate_name)
+    validate_phone = staticmethod(contact_validation.validate_phone)
+    validate_email = staticmethod(contact_validation.validate_email)
+    validate_address = staticmethod(contact_validation.validate_address)
     
-    def add_contact(self, name: str, phone: str, email: str, address: str) -> tuple:
+    @classmethod
+    def validation_error(cls, name: str, phone: str, email: str, address: str) -> Optional[str]:
         """
-        Add a new contact to the system
-        Returns: (success: bool, message: str)
+        Validate all fields of a new contact
+        Returns: error message for the first invalid field, or None if valid
         """
-        # Validate all fields
-        if not self.validate_name(name):
-            return False, "✗ Invalid name. Use only letters, spaces, hyphens, and apostrophes."
-        
-        if not self.validate_phone(phone):
-            return False, "✗ Invalid phone number. Use 10-15 digits (may include + prefix)."
+        if not cls.validate_name(name):
+            return FIELD_ERRORS['name']
         
-        if not self.validate_email(email):
-            return False, "✗ Invalid email format. Example: user@example.com"
+        if not cls.validate_phone(phone):
+            return FIELD_ERRORS['phone']
         
-        if not self.validate_address(address):
-            return False, "✗ Invalid address. Address cannot be empty."
+        if not cls.validate_email(email):
+            return FIELD_ERRORS['email']
         
-        # Check for duplicate phone or email
-        for contact in self.contacts:
-            if contact['phone'] == phone.strip():
-                return False, f"✗ Contact with phone {phone} already exists!"
-            if contact['email'].lower() == email.strip().lower():
-                return False, f"✗ Contact with email {email} already exists!"
+        if not cls.validate_address(address):
+            return FIELD_ERRORS['address']
         
-        # Create new contact
-        new_contact = {
+        return None
+    
+    @staticmethod
+    def make_contact(name: str, phone: str, email: str, address: str) -> Dict:
+        """Build a contact record from validated fields"""
+        return {
             'name': name.strip().title(),
             'phone': phone.strip(),
             'email': email.strip().lower(),
             'address': address.strip()
         }
+    
+    @synchronized
+    def add_contact(self, name: str, phone: str, email: str, address: str) -> tuple:
+        """
+        Add a new contact to the system
+        Returns: (success: bool, message: str)
+        """
+        # Validate all fields
+        error = self.validation_error(name, phone, email, address)
+        if error:
+            return False, error
         
-        self.contacts.append(new_contact)
+        # Check for duplicate phone or email
+        if self.normalize_phone(phone) in self.phone_index:
+            return False, f"✗ Contact with phone {phone} already exists!"
+        if self.normalize_email(email) in self.email_index:
+            return False, f"✗ Contact with email {email} already exists!"
+        
+        # Create new contact
+        new_contact = self.make_contact(name, phone, email, address)
+        record = self.append_contact(new_contact)
         
         # Save to file
         if self.save_contacts():
             return True, f"✓ Contact '{new_contact['name']}' added successfully!"
         else:
+            # Remove the contact again if save failed
+            self.remove_record(record)
             return False, "✗ Failed to save contact."
     
+    def append_contact(self, contact: Dict) -> int:
+        """Add a contact at the end of the list and index it; returns its record number"""
+        record = self.next_record
+        self.next_record += 1
+        self.records[record] = contact
+        if self.ordered is not None:
+            contacts, positions = self.ordered
+            positions[record] = len(contacts)
+            contacts.append(contact)
+        self.index_contact(contact, record)
+        return record
+    
+    def remove_record(self, record: int) -> Dict:
+        """Remove a contact and its index entries; returns the contact"""
+        contact = self.records.pop(record)
+        self.ordered = None
+        self.unindex_contact(contact, record)
+        return contact
+    
+    @synchronized
+    def add_contacts(self, new_contacts: List[Dict]) -> bool:
+        """
+        Append already validated, duplicate-free contacts and save once
+        Returns: True if saved; on failure the contacts are removed again
+        """
+        records = [self.append_contact(contact) for contact in new_contacts]
+        
+        if self.save_contacts():
+            return True
+        
+        for record in reversed(records):
+            self.remove_record(record)
+        return False
+    
     def view_all_contacts(self) -> List[Dict]:
         """Return all contacts"""
         return self.contacts
     
-    def search_contacts(self, query: str) -> List[Dict]:
+    @synchronized
+    def search_contacts(self, query: str, within: Optional[List[Dict]] = None) -> List[Dict]:
+        """
+        Search contacts by name or phone number (substring match)
+        Phone queries ignore spaces, hyphens, parentheses and the + prefix.
+        within: earlier results to filter instead of searching all contacts;
+                valid when query contains the query that produced them
+        Returns: List of matching contacts, in contact list order
+        """
+        if within is not None:
+            query = query.strip().lower()
+            digits = self.query_digits(query)
+            return [contact for contact in within
+                    if self.matches_query(contact, query, digits)]
+        
+        return [self.records[record] for record in self.search_records(query)]
+    
+    @synchronized
+    def search_records(self, query: str, within: Optional[List[int]] = None) -> List[int]:
         """
-        Search contacts by name or phone number
-        Returns: List of matching contacts
+        Search like search_contacts, but by record number
+        within: record numbers of earlier results to filter (deleted ones are dropped)
+        Returns: record numbers of the matching contacts, in contact list order
         """
         query = query.strip().lower()
-        results = []
+        digits = self.query_digits(query)
+        
+        if within is not None:
+            return [record for record in within if record in self.records
+                    and self.matches_query(self.records[record], query, digits)]
+        
+        if not query:
+            return list(self.records)
         
-        for contact in self.contacts:
-            # Search in name or phone
-            if (query in contact['name'].lower() or 
-                query in contact['phone']):
-                results.append(contact)
+        index = self.get_search_index()
+        records = index.search(query)
+        if digits and digits != query:
+            records |= index.search(digits)
         
-        return results
+        return sorted(records)
+    
+    @staticmethod
+    def query_digits(query: str) -> Optional[str]:
+        """Return the digits of a phone-like query, or None for other queries"""
+        if PHONE_QUERY.fullmatch(query):
+            return NON_DIGITS.sub('', query)
+        return None
     
+    @classmethod
+    def matches_query(cls, contact: Dict, query: str, digits: Optional[str]) -> bool:
+        """Check one contact against a lowercase query (same rules as the index)"""
+        name, phone_digits = cls.search_texts(contact)
+        return (query in name or query in phone_digits or
+                bool(digits) and digits in phone_digits)
+    
+    def find_record(self, identifier: str) -> Optional[int]:
+        """
+        Find a contact's record number by phone or email
+        Returns: record number if found, None otherwise
+        """
+        record = self.phone_index.get(self.normalize_phone(identifier))
+        if record is None:
+            record = self.email_index.get(self.normalize_email(identifier))
+        return record
+    
+    @synchronized
     def find_contact_index(self, identifier: str) -> Optional[int]:
         """
         Find contact index by phone or email
-        Returns: index if found, None otherwise
+        Returns: position in contacts if found, None otherwise
         """
-        identifier = identifier.strip().lower()
-        
-        for i, contact in enumerate(self.contacts):
-            if (contact['phone'] == identifier or 
-                contact['email'].lower() == identifier):
-                return i
-        
-        return None
+        record = self.find_record(identifier)
+        if record is None:
+            return None
+        return self.contact_order()[1][record]
     
+    @synchronized
     def update_contact(self, identifier: str, name: str = None, 
                       phone: str = None, email: str = None, 
                       address: str = None) -> tuple:
@@ -161,68 +411,105 @@ class ContactManager:
         identifier: phone or email to find the contact
         Returns: (success: bool, message: str)
         """
-        index = self.find_contact_index(identifier)
+        record = self.find_record(identifier)
         
-        if index is None:
+        if record is None:
             return False, "✗ Contact not found!"
         
-        contact = self.contacts[index]
+        return self.update_record(record, name, phone, email, address)
+    
+    @synchronized
+    def update_record(self, record: int, name: str = None,
+                      phone: str = None, email: str = None,
+                      address: str = None) -> tuple:
+        """
+        Update the contact with this record number (see update_contact)
+        Returns: (success: bool, message: str)
+        """
+        contact = self.records.get(record)
         
-        # Validate and update fields if provided
-        if name is not None:
-            if not self.validate_name(name):
-                return False, "✗ Invalid name format."
-            contact['name'] = name.strip().title()
+        if contact is None:
+            return False, "✗ Contact not found!"
+        
+        # Validate every provided field before changing anything
+        if name is not None and not self.validate_name(name):
+            return False, "✗ Invalid name format."
         
         if phone is not None:
             if not self.validate_phone(phone):
                 return False, "✗ Invalid phone number format."
             # Check if new phone already exists in another contact
-            for i, c in enumerate(self.contacts):
-                if i != index and c['phone'] == phone.strip():
-                    return False, "✗ Phone number already exists for another contact!"
-            contact['phone'] = phone.strip()
+            if self.phone_index.get(self.normalize_phone(phone), record) != record:
+                return False, "✗ Phone number already exists for another contact!"
         
         if email is not None:
             if not self.validate_email(email):
                 return False, "✗ Invalid email format."
             # Check if new email already exists in another contact
-            for i, c in enumerate(self.contacts):
-                if i != index and c['email'].lower() == email.strip().lower():
-                    return False, "✗ Email already exists for another contact!"
-            contact['email'] = email.strip().lower()
+            if self.email_index.get(self.normalize_email(email), record) != record:
+                return False, "✗ Email already exists for another contact!"
         
+        if address is not None and not self.validate_address(address):
+            return False, "✗ Invalid address."
+        
+        # Apply the changes and move the contact's index entries
+        original = dict(contact)
+        self.unindex_contact(contact, record)
+        
+        if name is not None:
+            contact['name'] = name.strip().title()
+        if phone is not None:
+            contact['phone'] = phone.strip()
+        if email is not None:
+            contact['email'] = email.strip().lower()
         if address is not None:
-            if not self.validate_address(address):
-                return False, "✗ Invalid address."
             contact['address'] = address.strip()
         
+        self.index_contact(contact, record)
+        
         # Save changes
         if self.save_contacts():
             return True, f"✓ Contact '{contact['name']}' updated successfully!"
         else:
+            # Restore the contact if save failed
+            self.unindex_contact(contact, record)
+            contact.update(original)
+            self.index_contact(contact, record)
             return False, "✗ Failed to save changes."
     
+    @synchronized
     def delete_contact(self, identifier: str) -> tuple:
         """
         Delete a contact by phone or email
         Returns: (success: bool, message: str, deleted_contact: dict or None)
         """
-        index = self.find_contact_index(identifier)
+        record = self.find_record(identifier)
         
-        if index is None:
+        if record is None:
+            return False, "✗ Contact not found!", None
+        
+        return self.delete_record(record)
+    
+    @synchronized
+    def delete_record(self, record: int) -> tuple:
+        """
+        Delete the contact with this record number
+        Returns: (success: bool, message: str, deleted_contact: dict or None)
+        """
+        if record not in self.records:
             return False, "✗ Contact not found!", None
         
-        deleted_contact = self.contacts.pop(index)
+        deleted_contact = self.remove_record(record)
         
         # Save changes
         if self.save_contacts():
             return True, f"✓ Contact '{deleted_contact['name']}' deleted successfully!", deleted_contact
         else:
             # Restore the contact if save failed
-            self.contacts.insert(index, deleted_contact)
+            self.insert_record(record, deleted_contact)
+            self.index_contact(deleted_contact, record)
             return False, "✗ Failed to delete contact.", None
     
     def get_contact_count(self) -> int:
         """Return total number of contacts"""
-        return len(self.contacts)
+        return len(self.records)
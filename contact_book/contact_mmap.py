@@ -0,0 +1,370 @@
+"""
+Contact Management System - Read-Only Memory-Mapped Address Books
+This module opens a large JSON address book for lookups without loading
+it. The file is memory-mapped and each contact is decoded only when it is
+accessed. An offset index (record positions, hashed phone and email keys
+and a compact search text) is built on first open and stored next to the
+data file as <file>.idx; it is rebuilt when the data file changes. If the
+index cannot be stored (e.g. in a read-only folder) it is kept in memory
+for that session.
+
+Usage (build the index and optionally search):
+    python contact_mmap.py contacts.json [query]
+The CLI uses this mode when started with --read-only.
+"""
+
+import bisect
+import json
+import mmap
+import os
+import struct
+import sys
+import zlib
+from array import array
+from collections.abc import Sequence
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from contact_manager import ContactManager
+from contact_persistence import atomic_write_bytes
+from contact_snapshot import is_snapshot
+
+INDEX_MAGIC = b'CONTIDX\x00'
+INDEX_VERSION = 1
+INDEX_SUFFIX = '.idx'
+# magic, version, data size, data mtime (ns), contact count, search text size
+INDEX_HEADER = struct.Struct('<8sHQqQQ')
+
+# Bytes of the data file decoded at a time while building the index
+SCAN_WINDOW = 1 << 20
+
+READ_ONLY_MESSAGE = "✗ This address book is open read-only."
+
+
+def key_hash(key: str) -> int:
+    """Hash a normalized phone or email for the sorted key arrays"""
+    return zlib.crc32(key.encode('utf-8'))
+
+
+def scan_records(data) -> Iterator[Tuple[int, int, Dict]]:
+    """
+    Walk the contacts of a JSON array without decoding the whole file
+    data: bytes-like file contents (e.g. an mmap)
+    Yields: (start offset, end offset, contact dict) for every record
+    """
+    decoder = json.JSONDecoder()
+    size = len(data)
+    base, i = 0, 0
+
+    def window(start, length):
+        # latin-1 maps every byte to one character, so string positions are byte offsets
+        return bytes(data[start:start + length]).decode('latin-1')
+
+    text = window(0, SCAN_WINDOW)
+    while i < len(text) and text[i] in ' \t\r\n':
+        i += 1
+    if text[i:i + 1] != '[':
+        raise ValueError("contacts file is not a JSON list")
+    i += 1
+    length = SCAN_WINDOW
+
+    while True:
+        # Skip whitespace and commas, refilling the window when it runs out
+        while True:
+            while i < len(text) and text[i] in ' \t\r\n,':
+                i += 1
+            if i < len(text) or base + i >= size:
+                break
+            base, i = base + i, 0
+            text = window(base, length)
+
+        if base + i >= size:
+            raise ValueError("contacts file ends before the closing bracket")
+        if text[i] == ']':
+            return
+
+        try:
+            record, end = decoder.raw_decode(text, i)
+        except json.JSONDecodeError:
+            if base + len(text) >= size:
+                raise
+            # The record crosses the window edge: restart the window at it
+            base, i = base + i, 0
+            if len(text) == length:
+                length *= 2
+            text = window(base, length)
+            continue
+
+        start, stop = base + i, base + end
+        raw = data[start:stop]
+        if not bytes(raw).isascii():
+            # Re-decode as UTF-8 so non-ASCII text is correct
+            record = json.loads(bytes(raw))
+        yield start, stop, record
+        i = end
+
+
+def build_index(path: str) -> bytes:
+    """Scan a JSON address book and return the encoded offset index"""
+    starts, ends = array('Q'), array('Q')
+    phones, emails = [], []
+    search_text = bytearray()
+    text_offsets = array('Q', [0])
+
+    with open(path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        for row, (start, end, contact) in enumerate(scan_records(data)):
+            starts.append(start)
+            ends.append(end)
+            phones.append((key_hash(ContactManager.normalize_phone(contact['phone'])), row))
+            emails.append((key_hash(ContactManager.normalize_email(contact['email'])), row))
+            name, digits = ContactManager.search_texts(contact)
+            search_text += f"{name}\x00{digits}\n".encode('utf-8')
+            text_offsets.append(len(search_text))
+
+    phones.sort()
+    emails.sort()
+    stat = os.stat(path)
+    parts = [INDEX_HEADER.pack(INDEX_MAGIC, INDEX_VERSION, stat.st_size, stat.st_mtime_ns,
+                               len(starts), len(search_text)),
+             starts.tobytes(), ends.tobytes()]
+    for pairs in (phones, emails):
+        parts.append(array('I', (hash_ for hash_, _ in pairs)).tobytes())
+        parts.append(array('I', (row for _, row in pairs)).tobytes())
+    parts.append(text_offsets.tobytes())
+    parts.append(bytes(search_text))
+    return b''.join(parts)
+
+
+class LazyContacts(Sequence):
+    """Sequence view of a read-only book; contacts are decoded on access"""
+
+    def __init__(self, book: 'ReadOnlyContactBook', rows: Optional[List[int]] = None):
+        self.book = book
+        self.rows = rows
+
+    def __len__(self) -> int:
+        return len(self.rows) if self.rows is not None else self.book.count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            rows = range(len(self))[index]
+            return [self[i] for i in rows]
+        if self.rows is not None:
+            return self.book.get_contact(self.rows[index])
+        if index < 0:
+            index += self.book.count
+        if not 0 <= index < self.book.count:
+            raise IndexError("contact index out of range")
+        return self.book.get_contact(index)
+
+
+class ReadOnlyContactBook:
+    """
+    Read-only address book backed by a memory-mapped JSON file
+
+    Offers the lookup side of ContactManager (view_all_contacts,
+    search_contacts, find_contact_index, get_contact_count); mutating
+    methods refuse with a message.
+    """
+
+    def __init__(self, path: str):
+        """
+        Open the book, building or refreshing its index if needed
+        Raises OSError if the file cannot be read (FileNotFoundError if it
+        does not exist) and ValueError for empty, binary or malformed files.
+        """
+        if is_snapshot(path):
+            raise ValueError("read-only mode needs a JSON address book")
+        if os.path.getsize(path) == 0:
+            raise ValueError(f"{path} is empty")
+
+        self.path = path
+        self.index_path = path + INDEX_SUFFIX
+
+        self.data_file = open(path, 'rb')
+        try:
+            self.data = mmap.mmap(self.data_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+            if self.index_is_current():
+                self.open_index()
+            else:
+                index = build_index(path)
+                try:
+                    atomic_write_bytes(self.index_path, index)
+                except OSError:
+                    # Cannot store it (e.g. read-only folder): use it from memory
+                    self.index_path = None
+                    self.open_index(index)
+                else:
+                    self.open_index()
+        except BaseException:
+            # Release whatever was opened before the failure
+            self.close()
+            raise
+
+    def index_is_current(self) -> bool:
+        """Check that the stored index matches the data file's size and mtime"""
+        try:
+            with open(self.index_path, 'rb') as file:
+                header = file.read(INDEX_HEADER.size)
+        except OSError:
+            return False
+        if len(header) < INDEX_HEADER.size:
+            return False
+
+        magic, version, size, mtime_ns, _, _ = INDEX_HEADER.unpack(header)
+        stat = os.stat(self.path)
+        return (magic == INDEX_MAGIC and version == INDEX_VERSION and
+                size == stat.st_size and mtime_ns == stat.st_mtime_ns)
+
+    def open_index(self, buffer: Optional[bytes] = None):
+        """
+        Slice the index into typed views (no copies)
+        buffer: encoded index to use instead of mapping the index file
+        """
+        if buffer is None:
+            self.index_file = open(self.index_path, 'rb')
+            self.index = mmap.mmap(self.index_file.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            self.index = buffer
+        _, _, _, _, count, text_size = INDEX_HEADER.unpack_from(self.index)
+        self.count = count
+
+        self.index_view = view = memoryview(self.index)
+        position = INDEX_HEADER.size
+
+        def take(typecode, items):
+            nonlocal position
+            size = array(typecode).itemsize * items
+            part = view[position:position + size].cast(typecode)
+            position += size
+            return part
+
+        self.starts = take('Q', count)
+        self.ends = take('Q', count)
+        self.phone_hashes = take('I', count)
+        self.phone_rows = take('I', count)
+        self.email_hashes = take('I', count)
+        self.email_rows = take('I', count)
+        self.text_offsets = take('Q', count + 1)
+        self.search_base = position
+        self.search_text = view[position:position + text_size]
+
+    def close(self) -> bool:
+        """Release the memory maps (also after a partly failed open)"""
+        for name in ('starts', 'ends', 'phone_hashes', 'phone_rows', 'email_hashes',
+                     'email_rows', 'text_offsets', 'search_text', 'index_view'):
+            view = getattr(self, name, None)
+            if view is not None:
+                view.release()
+        for name in ('index', 'index_file', 'data', 'data_file'):
+            resource = getattr(self, name, None)
+            if resource is not None and hasattr(resource, 'close'):
+                resource.close()
+        return True
+
+    def get_contact(self, row: int) -> Dict:
+        """Decode one contact by its position"""
+        return json.loads(self.data[self.starts[row]:self.ends[row]])
+
+    @property
+    def contacts(self) -> LazyContacts:
+        """All contacts, like ContactManager.contacts (decoded on access)"""
+        return LazyContacts(self)
+
+    def view_all_contacts(self) -> LazyContacts:
+        """Return all contacts as a lazily decoded sequence"""
+        return LazyContacts(self)
+
+    def get_contact_count(self) -> int:
+        """Return total number of contacts"""
+        return self.count
+
+    def lookup(self, hashes, rows, key: str, field: str, normalize) -> Optional[int]:
+        """Find the row whose field normalizes to key, using a sorted hash array"""
+        target = key_hash(key)
+        position = bisect.bisect_left(hashes, target)
+        while position < len(hashes) and hashes[position] == target:
+            row = rows[position]
+            if normalize(self.get_contact(row)[field]) == key:
+                return row
+            position += 1
+        return None
+
+    def find_contact_index(self, identifier: str) -> Optional[int]:
+        """
+        Find contact index by phone or email
+        Returns: index if found, None otherwise
+        """
+        index = self.lookup(self.phone_hashes, self.phone_rows,
+                            ContactManager.normalize_phone(identifier), 'phone',
+                            ContactManager.normalize_phone)
+        if index is None:
+            index = self.lookup(self.email_hashes, self.email_rows,
+                                ContactManager.normalize_email(identifier), 'email',
+                                ContactManager.normalize_email)
+        return index
+
+    def search_rows(self, needle: str) -> set:
+        """Find the rows whose search text contains needle"""
+        pattern = needle.encode('utf-8')
+        base = self.search_base
+        end = base + len(self.search_text)
+        rows = set()
+
+        position = self.index.find(pattern, base, end)
+        while position != -1:
+            row = bisect.bisect_right(self.text_offsets, position - base) - 1
+            rows.add(row)
+            # Continue after this record's line
+            position = self.index.find(pattern, base + self.text_offsets[row + 1], end)
+        return rows
+
+    def search_contacts(self, query: str) -> LazyContacts:
+        """
+        Search contacts by name or phone number (substring match)
+        Returns: lazily decoded matches, in file order
+        """
+        query = query.strip().lower()
+        if not query:
+            return self.view_all_contacts()
+
+        rows = self.search_rows(query)
+        digits = ContactManager.query_digits(query)
+        if digits and digits != query:
+            rows |= self.search_rows(digits)
+        return LazyContacts(self, sorted(rows))
+
+    def add_contact(self, *args, **kwargs) -> tuple:
+        return False, READ_ONLY_MESSAGE
+
+    def update_contact(self, *args, **kwargs) -> tuple:
+        return False, READ_ONLY_MESSAGE
+
+    def delete_contact(self, *args, **kwargs) -> tuple:
+        return False, READ_ONLY_MESSAGE, None
+
+
+def main():
+    """Build or validate the index of a JSON address book and optionally search it"""
+    if len(sys.argv) not in (2, 3):
+        print("Usage: python contact_mmap.py <contacts.json> [query]")
+        sys.exit(1)
+
+    try:
+        book = ReadOnlyContactBook(sys.argv[1])
+    except (OSError, ValueError) as e:
+        print(f"✗ Could not open {sys.argv[1]}: {e}")
+        sys.exit(1)
+
+    print(f"✓ Opened {book.get_contact_count()} contacts read-only "
+          f"(index: {book.index_path or 'in memory, could not be stored'})")
+    if len(sys.argv) == 3:
+        results = book.search_contacts(sys.argv[2])
+        print(f"Found {len(results)} contact(s)")
+        for contact in results[:20]:
+            print(f"  {contact['name']:<25} {contact['phone']:<16} {contact['email']}")
+    book.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+"""
+Contact Management System - Persistence
+This module writes address books to disk atomically (temp file, fsync,
+rename) and provides a write-behind writer that saves on a background
+thread, coalescing bursts of changes into a single write.
+"""
+
+import atexit
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Callable, List, Dict
+
+
+def atomic_write_json(path: str, data, indent: int = 4):
+    """
+    Write data as JSON so that path holds either the old or the new content
+    Raises OSError (or TypeError for unserializable data) on failure.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(prefix=".contacts-", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, 'w') as file:
+            json.dump(data, file, indent=indent)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+def atomic_write_bytes(path: str, data: bytes):
+    """Write bytes so that path holds either the old or the new content"""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(prefix=".contacts-", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as file:
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+class WriteBehindWriter:
+    """
+    Saves an address book on a background thread.
+
+    schedule() only marks the book as changed. The writer waits until no
+    new change has arrived for `delay` seconds (but never longer than
+    `max_delay` after the first one), takes one snapshot and writes it.
+    Once the thread has stopped (after close()), schedule() writes
+    synchronously so later changes are not lost.
+    """
+
+    def __init__(self, path: str, snapshot: Callable[[], List[Dict]],
+                 delay: float = 0.05, max_delay: float = 1.0,
+                 write: Callable[[str, List[Dict]], None] = atomic_write_json):
+        """
+        path: file to write
+        snapshot: returns a consistent copy of the contacts to save
+        write: writes the contacts to path atomically (default: JSON)
+        """
+        self.path = path
+        self.snapshot = snapshot
+        self.write = write
+        self.delay = delay
+        self.max_delay = max_delay
+
+        self.condition = threading.Condition()
+        self.requested = 0      # Changes scheduled so far
+        self.written = 0        # Changes covered by the last successful write
+        self.failures = 0       # Failed writes so far
+        self.flush_target = 0   # Changes a waiting flush() needs written
+        self.closing = False
+        self.stopped = False    # Set by the writer thread when it exits
+
+        self.thread = threading.Thread(target=self.run, name="contacts-writer", daemon=True)
+        self.thread.start()
+        # Flush pending changes if the program exits without close()
+        atexit.register(self.close)
+
+    def schedule(self) -> bool:
+        """
+        Record that the contacts changed and need saving
+        Returns: False only if the writer was closed and the synchronous
+                 write failed
+        """
+        with self.condition:
+            if not self.stopped:
+                self.requested += 1
+                self.condition.notify_all()
+                return True
+
+        # No thread left to pick the change up, so write it now
+        try:
+            self.write(self.path, self.snapshot())
+        except Exception as e:
+            print(f"✗ Error saving contacts: {e}")
+            with self.condition:
+                self.failures += 1
+            return False
+        with self.condition:
+            self.written = self.requested
+        return True
+
+    def run(self):
+        """Writer thread: wait for changes, coalesce them, write once"""
+        while True:
+            with self.condition:
+                while self.requested == self.written and not self.closing:
+                    self.condition.wait()
+                if self.requested == self.written:
+                    self.stopped = True
+                    return
+
+                # Coalesce: wait until changes stop arriving (flush and close cut this short)
+                deadline = time.monotonic() + self.max_delay
+                seen = self.requested
+                while not self.closing and self.flush_target <= self.written:
+                    timeout = min(self.delay, deadline - time.monotonic())
+                    if timeout <= 0:
+                        break
+                    self.condition.wait(timeout)
+                    if self.requested == seen:
+                        break
+                    seen = self.requested
+                target = self.requested
+
+            # Snapshot and write outside the condition so schedule() never waits on disk
+            try:
+                self.write(self.path, self.snapshot())
+                failed = False
+            except Exception as e:
+                print(f"✗ Error saving contacts: {e}")
+                failed = True
+
+            with self.condition:
+                if failed:
+                    self.failures += 1
+                else:
+                    self.written = max(self.written, target)
+                self.condition.notify_all()
+                if failed and self.closing:
+                    self.stopped = True
+                    return
+
+            if failed:
+                # Back off before retrying so a full disk does not spin the thread
+                time.sleep(self.max_delay)
+
+    def flush(self, timeout: float = None) -> bool:
+        """
+        Write every change scheduled so far now and wait for it
+        Returns: False if the write failed or timed out
+        """
+        with self.condition:
+            target = self.requested
+            failures = self.failures
+            # Checked by the writer's coalescing loop, so a notify that
+            # arrives while the writer is not waiting is not lost
+            self.flush_target = max(self.flush_target, target)
+            self.condition.notify_all()
+            self.condition.wait_for(
+                lambda: self.written >= target or self.failures > failures or self.stopped,
+                timeout)
+            return self.written >= target
+
+    def close(self) -> bool:
+        """
+        Write any pending changes and stop the writer thread
+        Calling it again retries a final write that failed.
+        """
+        atexit.unregister(self.close)
+        with self.condition:
+            self.closing = True
+            self.condition.notify_all()
+        self.thread.join()
+        with self.condition:
+            if self.written >= self.requested:
+                return True
+        # The thread's last write failed; try once more synchronously
+        return self.schedule()
@@ -0,0 +1,187 @@
+"""
+Contact Management System - Address Book Registry
+This module lets one long-running process serve many address books. Books
+are opened on first use, kept in a least-recently-used cache, and flushed
+and dropped when the cache is full.
+
+Callers check a book out with get() and hand it back with release() (or
+use the checkout() context manager). A checked-out book is never evicted,
+so nobody keeps using a manager the registry has already replaced.
+Opening and closing books happens outside the registry lock. A book whose
+changes cannot be saved when it is closed stays registered, so they are
+not dropped silently.
+"""
+
+import os
+import re
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Tuple
+
+from contact_manager import ContactManager
+
+# Book IDs become file names, so keep them to a safe character set
+BOOK_ID_PATTERN = re.compile(r'^[A-Za-z0-9_.\-]+$')
+
+
+class ContactRegistry:
+    """LRU cache of ContactManager instances, one per address book file"""
+
+    def __init__(self, directory: str, capacity: int = 16, write_behind: bool = True):
+        """
+        directory: folder holding one <book_id>.json file per address book
+        capacity: maximum number of address books kept open; checked-out
+                  books may push the count over it until they are released
+        write_behind: save books on background threads (flushed on eviction)
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.directory = directory
+        self.capacity = capacity
+        self.write_behind = write_behind
+        self.books: "OrderedDict[str, ContactManager]" = OrderedDict()
+        self.pins: Dict[str, int] = {}                  # book ID -> open checkouts
+        self.pending: Dict[str, threading.Event] = {}   # books being opened or closed
+        self.lock = threading.Lock()
+
+    def path_for(self, book_id: str) -> str:
+        """Return the data file of an address book"""
+        if not BOOK_ID_PATTERN.match(book_id) or book_id.startswith('.'):
+            raise ValueError(f"Invalid address book id: {book_id!r}")
+        return os.path.join(self.directory, f"{book_id}.json")
+
+    def get(self, book_id: str) -> ContactManager:
+        """
+        Check out the manager for an address book, opening it if needed
+        The book stays open until release(book_id) is called for every get().
+        """
+        path = self.path_for(book_id)
+        while True:
+            with self.lock:
+                manager = self.books.get(book_id)
+                if manager is not None:
+                    self.books.move_to_end(book_id)
+                    self.pins[book_id] = self.pins.get(book_id, 0) + 1
+                    return manager
+                event = self.pending.get(book_id)
+                if event is None:
+                    event = self.pending[book_id] = threading.Event()
+                    break
+            # Another thread is opening or closing this book; wait for it
+            event.wait()
+
+        try:
+            manager = ContactManager(path, self.write_behind, verbose=False)
+        except BaseException:
+            with self.lock:
+                del self.pending[book_id]
+            event.set()
+            raise
+
+        with self.lock:
+            del self.pending[book_id]
+            self.books[book_id] = manager
+            self.pins[book_id] = 1
+            evicted = self.take_evictions()
+        event.set()
+        self.close_books(evicted)
+        return manager
+
+    def release(self, book_id: str):
+        """Hand back a book checked out with get(); it may be evicted afterwards"""
+        with self.lock:
+            count = self.pins.get(book_id, 0)
+            if count <= 1:
+                self.pins.pop(book_id, None)
+            else:
+                self.pins[book_id] = count - 1
+            evicted = self.take_evictions()
+        self.close_books(evicted)
+
+    @contextmanager
+    def checkout(self, book_id: str) -> Iterator[ContactManager]:
+        """Check out an address book for the duration of a with block"""
+        manager = self.get(book_id)
+        try:
+            yield manager
+        finally:
+            self.release(book_id)
+
+    def take_evictions(self) -> List[Tuple[str, ContactManager, threading.Event]]:
+        """
+        Remove the least recently used books that are not checked out until
+        the cache fits its capacity (call with the lock held)
+        Returns: (book ID, manager, event) for close_books()
+        """
+        evicted = []
+        for book_id in list(self.books):
+            if len(self.books) <= self.capacity:
+                break
+            if book_id in self.pins:
+                continue
+            evicted.append((book_id, self.books.pop(book_id), self.mark_pending(book_id)))
+        return evicted
+
+    def mark_pending(self, book_id: str) -> threading.Event:
+        """Make get() wait for a book until it is closed (call with the lock held)"""
+        event = self.pending[book_id] = threading.Event()
+        return event
+
+    def close_books(self, evicted: List[Tuple[str, ContactManager, threading.Event]]) -> bool:
+        """
+        Flush and close dropped books, then let waiting get() calls reopen them
+        Books that could not be saved go back into the cache as least recently used.
+        Returns: False if any book could not be saved
+        """
+        all_saved = True
+        for book_id, manager, event in evicted:
+            saved = False
+            try:
+                saved = manager.close()
+            finally:
+                with self.lock:
+                    if not saved:
+                        self.books[book_id] = manager
+                        self.books.move_to_end(book_id, last=False)
+                    self.pending.pop(book_id, None)
+                event.set()
+            if not saved:
+                print(f"✗ Could not save address book '{book_id}'; it stays open.")
+                all_saved = False
+        return all_saved
+
+    def evict(self, book_id: str) -> bool:
+        """
+        Flush and drop one address book
+        Returns: False if it was not open, is still checked out or could not be saved
+        """
+        with self.lock:
+            if book_id in self.pins or book_id not in self.books:
+                return False
+            evicted = [(book_id, self.books.pop(book_id), self.mark_pending(book_id))]
+        return self.close_books(evicted)
+
+    def open_books(self) -> List[str]:
+        """Return the IDs of open books, least recently used first"""
+        with self.lock:
+            return list(self.books)
+
+    def close(self) -> bool:
+        """
+        Flush and drop every open address book (at shutdown; managers still
+        checked out keep saving, synchronously)
+        Returns: False if some books could not be saved (they stay open)
+        """
+        with self.lock:
+            evicted = [(book_id, manager, self.mark_pending(book_id))
+                       for book_id, manager in self.books.items()]
+            self.books.clear()
+            self.pins.clear()
+        return self.close_books(evicted)
+
+    def __contains__(self, book_id: str) -> bool:
+        return book_id in self.books
+
+    def __len__(self) -> int:
+        return len(self.books)
@@ -0,0 +1,112 @@
+"""
+Contact Management System - Search Index
+This module provides an in-memory trigram index used by ContactManager to
+answer substring and prefix searches without scanning every contact.
+"""
+
+from typing import Dict, Hashable, Iterable, Set
+
+GRAM_SIZE = 3
+
+# Joins a document's texts so one substring check covers all of them
+SEPARATOR = "\x00"
+
+
+def trigrams(text: str) -> Set[str]:
+    """Return the set of 3-character substrings of text"""
+    return {text[i:i + GRAM_SIZE] for i in range(len(text) - GRAM_SIZE + 1)}
+
+
+class TrigramIndex:
+    """
+    Maps every trigram of the indexed texts to the keys of the documents
+    containing it. A query is answered by intersecting the posting sets of
+    its trigrams and then confirming the candidates with a substring check.
+    Queries shorter than a trigram take the union of the grams containing
+    them instead.
+    """
+
+    def __init__(self):
+        """Initialize an empty index"""
+        self.postings: Dict[str, Set[Hashable]] = {}
+        self.documents: Dict[Hashable, str] = {}
+        # Documents with a text too short to produce any trigram
+        self.short_documents: Set[Hashable] = set()
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def add(self, key: Hashable, *texts: str):
+        """
+        Index a document under key (replacing any document with that key)
+        texts: lowercase strings to search in; grams never span two texts
+        """
+        if key in self.documents:
+            self.remove(key)
+
+        self.documents[key] = SEPARATOR.join(texts)
+        if any(len(text) < GRAM_SIZE for text in texts):
+            self.short_documents.add(key)
+
+        postings = self.postings
+        for gram in self.document_grams(texts):
+            keys = postings.get(gram)
+            if keys is None:
+                postings[gram] = {key}
+            else:
+                keys.add(key)
+
+    def remove(self, key: Hashable):
+        """Remove a document from the index (no-op if it is not indexed)"""
+        document = self.documents.pop(key, None)
+        if document is None:
+            return
+
+        self.short_documents.discard(key)
+        for gram in self.document_grams(document.split(SEPARATOR)):
+            keys = self.postings[gram]
+            keys.discard(key)
+            if not keys:
+                del self.postings[gram]
+
+    @staticmethod
+    def document_grams(texts: Iterable[str]) -> Set[str]:
+        """Return the trigrams of all texts of a document"""
+        return {text[i:i + GRAM_SIZE] for text in texts
+                for i in range(len(text) - GRAM_SIZE + 1)}
+
+    def search(self, query: str) -> Set[Hashable]:
+        """
+        Find the keys of documents with a text containing query
+        query: lowercase string, matched as a substring (prefixes included)
+        Returns: set of matching keys
+        """
+        documents = self.documents
+
+        if len(query) < GRAM_SIZE:
+            matches = {key for key in self.short_documents if query in documents[key]}
+            for gram, keys in self.postings.items():
+                if query in gram:
+                    matches |= keys
+            return matches
+
+        # Intersect from the rarest gram so the candidate set stays small
+        postings = []
+        for gram in trigrams(query):
+            keys = self.postings.get(gram)
+            if keys is None:
+                return set()
+            postings.append(keys)
+        postings.sort(key=len)
+
+        candidates = set(postings[0])
+        for keys in postings[1:]:
+            candidates &= keys
+            if not candidates:
+                return candidates
+
+        # Every gram matching does not guarantee the grams are adjacent
+        if len(query) > GRAM_SIZE:
+            candidates = {key for key in candidates if query in documents[key]}
+
+        return candidates
@@ -0,0 +1,94 @@
+"""
+Contact Management System - Validation
+This module holds the precompiled contact validation patterns, single-value
+validators, and a batch API that validates many records field by field.
+"""
+
+import re
+from typing import Dict, Iterable, List, Mapping, Optional
+
+FIELDS = ('name', 'phone', 'email', 'address')
+
+# Letters, spaces, hyphens, and apostrophes
+NAME_PATTERN = re.compile(r"^[A-Za-z\s\-']+$")
+# Spaces, hyphens, and parentheses are ignored in phone numbers
+PHONE_SEPARATORS = re.compile(r'[\s\-()]')
+# Optional + prefix and 10-15 digits
+PHONE_PATTERN = re.compile(r'^\+?\d{10,15}$')
+EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+# Message for each invalid field, in the order fields are checked
+FIELD_ERRORS = {
+    'name': "✗ Invalid name. Use only letters, spaces, hyphens, and apostrophes.",
+    'phone': "✗ Invalid phone number. Use 10-15 digits (may include + prefix).",
+    'email': "✗ Invalid email format. Example: user@example.com",
+    'address': "✗ Invalid address. Address cannot be empty.",
+}
+
+
+def validate_name(name: str) -> bool:
+    """Validate contact name (non-empty, alphabetic with spaces)"""
+    return bool(name and NAME_PATTERN.match(name.strip()))
+
+
+def validate_phone(phone: str) -> bool:
+    """Validate phone number (10-15 digits, may include +, spaces, hyphens)"""
+    return bool(phone and PHONE_PATTERN.match(PHONE_SEPARATORS.sub('', phone)))
+
+
+def validate_email(email: str) -> bool:
+    """Validate email address format"""
+    return bool(email and EMAIL_PATTERN.match(email.strip()))
+
+
+def validate_address(address: str) -> bool:
+    """Validate address (just check if not empty)"""
+    return bool(address and address.strip())
+
+
+def validate_many(records: Iterable[Mapping[str, str]],
+                  fields: Iterable[str] = FIELDS) -> Dict[str, List[bool]]:
+    """
+    Validate many records at once, one field at a time
+    records: mappings with name, phone, email and address (missing = empty)
+    fields: the fields to check (default: all four)
+    Returns: {field: error mask}; mask[i] is True when record i's field is invalid
+    """
+    records = records if isinstance(records, list) else list(records)
+
+    # Bind the pattern methods once so the loops avoid attribute lookups
+    name_match = NAME_PATTERN.match
+    phone_match = PHONE_PATTERN.match
+    phone_clean = PHONE_SEPARATORS.sub
+    email_match = EMAIL_PATTERN.match
+
+    masks = {}
+    for field in fields:
+        values = [record.get(field) or '' for record in records]
+        if field == 'name':
+            masks[field] = [name_match(name.strip()) is None for name in values]
+        elif field == 'phone':
+            masks[field] = [phone_match(phone_clean('', phone)) is None for phone in values]
+        elif field == 'email':
+            masks[field] = [email_match(email.strip()) is None for email in values]
+        elif field == 'address':
+            masks[field] = [not address.strip() for address in values]
+        else:
+            raise ValueError(f"Unknown contact field: {field}")
+    return masks
+
+
+def first_errors(masks: Dict[str, List[bool]]) -> List[Optional[str]]:
+    """
+    Turn error masks into one message per record
+    Returns: the message for each record's first invalid field, or None if valid
+    """
+    columns = [(masks[field], FIELD_ERRORS[field]) for field in FIELDS]
+    count = len(masks['name'])
+    errors = [None] * count
+    # Check fields last to first so the first invalid field wins
+    for mask, message in reversed(columns):
+        for i in range(count):
+            if mask[i]:
+                errors[i] = message
+    return errors
@@ -3,10 +3,16 @@ Contact Management System - Graphical User Interface
 This module provides a Tkinter-based GUI for managing contacts.
 """
 
+import queue
+import threading
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
 from contact_manager import ContactManager
 
+# Live search timings (milliseconds)
+SEARCH_DELAY_MS = 200
+SEARCH_POLL_MS = 30
+
 class ContactApp:
     """Main GUI Application Class"""
     
@@ -17,8 +23,29 @@ class ContactApp:
         self.root.geometry("900x650")
         self.root.resizable(False, False)
         
-        # Initialize ContactManager
-        self.manager = ContactManager()
+        # Initialize ContactManager; saves happen on a background thread
+        self.manager = ContactManager(write_behind=True)
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        
+        # Tree rows use the contact's record number as item id, so
+        # contacts that share a phone in the file still get a row each.
+        # Rows are created once at startup; after that each change updates
+        # only the row it touched, and searches only reattach rows.
+        self.row_values = {}      # record number -> displayed values
+        self.shown_items = []     # attached item ids, in display order
+        self.showing_all = False  # True while every row is attached
+        
+        # Live search: keystrokes are debounced, queries run on a worker
+        # thread and results are polled back onto the Tk thread. Each new
+        # query bumps the generation so older results are dropped.
+        self.search_after_id = None
+        self.search_polling = False
+        self.search_generation = 0
+        self.pending_generation = None
+        self.last_search = None   # (query, results) of the last shown live search
+        self.search_requests = queue.Queue()
+        self.search_results = queue.Queue()
+        threading.Thread(target=self.search_worker, daemon=True).start()
         
         # Color scheme
         self.bg_color = "#f0f0f0"
@@ -37,6 +64,7 @@ class ContactApp:
         self.create_status_bar()
         
         # Load and display contacts
+        self.load_rows()
         self.refresh_contact_list()
     
     def create_header(self):
@@ -153,6 +181,7 @@ class ContactApp:
         
         self.search_entry = tk.Entry(search_frame, font=("Arial", 11), width=30)
         self.search_entry.pack(side=tk.LEFT, padx=5)
+        self.search_entry.bind("<KeyRelease>", self.on_search_key)
         
         search_btn = tk.Button(
             search_frame,
@@ -221,26 +250,60 @@ class ContactApp:
         )
         self.status_bar.pack(side=tk.BOTTOM, fill=tk.X)
     
+    def load_rows(self):
+        """Create one tree row per contact, in contact list order"""
+        for record in self.manager.records:
+            self.put_row(record)
+        self.showing_all = True
+    
+    def put_row(self, record):
+        """Create the row of a contact, or update it if its values changed"""
+        contact = self.manager.records[record]
+        values = (contact['name'], contact['phone'], contact['email'], contact['address'])
+        old_values = self.row_values.get(record)
+        
+        if old_values is None:
+            # New contacts are appended to the list, so their row goes last
+            item = self.tree.insert("", tk.END, iid=record, values=values)
+            self.shown_items.append(item)
+        elif old_values != values:
+            self.tree.item(record, values=values)
+        self.row_values[record] = values
+    
+    def drop_row(self, record):
+        """Remove the row of a deleted contact"""
+        del self.row_values[record]
+        self.tree.delete(record)
+        item = str(record)
+        if item in self.shown_items:
+            self.shown_items.remove(item)
+    
+    def selected_record(self):
+        """Return the record number of the selected row (None if none is selected)"""
+        selection = self.tree.selection()
+        return int(selection[0]) if selection else None
+    
+    def show_rows(self, records):
+        """Attach exactly the rows of the given records, in order, detaching the rest"""
+        items = [str(record) for record in records]
+        if items != self.shown_items:
+            self.tree.set_children("", *items)
+            self.shown_items = items
+        self.showing_all = False
+    
     def refresh_contact_list(self):
         """Refresh the contact list display"""
-        # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
-        # Get all contacts
-        contacts = self.manager.view_all_contacts()
-        
-        # Add contacts to tree
-        for contact in contacts:
-            self.tree.insert("", tk.END, values=(
-                contact['name'],
-                contact['phone'],
-                contact['email'],
-                contact['address']
-            ))
+        # Drop live search results that were computed before this refresh
+        self.search_generation += 1
+        self.last_search = None
+        
+        # Rows are kept up to date in place; reattach them only after a search
+        if not self.showing_all:
+            self.show_rows(list(self.manager.records))
+            self.showing_all = True
         
         # Update status bar
-        self.status_bar.config(text=f"Total Contacts: {len(contacts)}")
+        self.status_bar.config(text=f"Total Contacts: {self.manager.get_contact_count()}")
     
     def clear_fields(self):
         """Clear all input fields"""
@@ -249,6 +312,9 @@ class ContactApp:
         self.email_entry.delete(0, tk.END)
         self.address_entry.delete(0, tk.END)
         self.search_entry.delete(0, tk.END)
+        if self.search_after_id is not None:
+            self.root.after_cancel(self.search_after_id)
+            self.search_after_id = None
     
     def add_contact(self):
         """Add a new contact"""
@@ -264,6 +330,7 @@ class ContactApp:
         success, message = self.manager.add_contact(name, phone, email, address)
         
         if success:
+            self.put_row(self.manager.find_record(phone))
             messagebox.showinfo("Success", message)
             self.clear_fields()
             self.refresh_contact_list()
@@ -272,10 +339,9 @@ class ContactApp:
     
     def on_contact_select(self, event):
         """Handle contact selection from list"""
-        selection = self.tree.selection()
-        if selection:
-            item = self.tree.item(selection[0])
-            values = item['values']
+        record = self.selected_record()
+        if record is not None:
+            values = self.row_values[record]
             
             # Populate input fields with selected contact
             self.clear_fields()
@@ -286,15 +352,13 @@ class ContactApp:
     
     def update_contact(self):
         """Update selected contact"""
-        selection = self.tree.selection()
-        if not selection:
+        record = self.selected_record()
+        if record is None:
             messagebox.showwarning("No Selection", "Please select a contact to update!")
             return
         
-        # Get current values from tree
-        item = self.tree.item(selection[0])
-        old_values = item['values']
-        old_phone = old_values[1]  # Use phone as identifier
+        # Get current values for the selected row
+        old_values = self.row_values[record]
         
         # Get new values from entries
         new_name = self.name_entry.get().strip()
@@ -312,11 +376,12 @@ class ContactApp:
             messagebox.showinfo("No Changes", "No changes detected!")
             return
         
-        success, message = self.manager.update_contact(
-            old_phone, new_name, new_phone, new_email, new_address
+        success, message = self.manager.update_record(
+            record, new_name, new_phone, new_email, new_address
         )
         
         if success:
+            self.put_row(record)
             messagebox.showinfo("Success", message)
             self.clear_fields()
             self.refresh_contact_list()
@@ -325,14 +390,13 @@ class ContactApp:
     
     def delete_contact(self):
         """Delete selected contact"""
-        selection = self.tree.selection()
-        if not selection:
+        record = self.selected_record()
+        if record is None:
             messagebox.showwarning("No Selection", "Please select a contact to delete!")
             return
         
         # Get contact details
-        item = self.tree.item(selection[0])
-        values = item['values']
+        values = self.row_values[record]
         name = values[0]
         phone = values[1]
         
@@ -343,9 +407,10 @@ class ContactApp:
         )
         
         if confirm:
-            success, message, deleted = self.manager.delete_contact(phone)
+            success, message, deleted = self.manager.delete_record(record)
             
             if success:
+                self.drop_row(record)
                 messagebox.showinfo("Success", message)
                 self.clear_fields()
                 self.refresh_contact_list()
@@ -360,27 +425,100 @@ class ContactApp:
             messagebox.showwarning("Empty Search", "Please enter a search query!")
             return
         
-        # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        # Cancel any live search still running for the search box
+        self.search_generation += 1
         
-        # Search and display results
-        results = self.manager.search_contacts(query)
+        # Search and display results by reattaching the matching rows
+        results = self.manager.search_records(query)
         
         if not results:
             messagebox.showinfo("No Results", f"No contacts found matching '{query}'")
             self.refresh_contact_list()
         else:
-            for contact in results:
-                self.tree.insert("", tk.END, values=(
-                    contact['name'],
-                    contact['phone'],
-                    contact['email'],
-                    contact['address']
-                ))
+            self.show_rows(results)
             
             self.status_bar.config(text=f"Found {len(results)} contact(s)")
 
+    def on_search_key(self, event):
+        """Restart the debounce timer on every keystroke in the search box"""
+        if self.search_after_id is not None:
+            self.root.after_cancel(self.search_after_id)
+        self.search_after_id = self.root.after(SEARCH_DELAY_MS, self.start_live_search)
+    
+    def start_live_search(self):
+        """Hand the current search text to the worker thread"""
+        self.search_after_id = None
+        query = self.search_entry.get().strip()
+        
+        if not query:
+            self.refresh_contact_list()
+            return
+        
+        self.search_generation += 1
+        
+        # A query that extends the previous one can only narrow its results
+        within = None
+        if self.last_search and self.last_search[0].lower() in query.lower():
+            within = self.last_search[1]
+        
+        self.pending_generation = self.search_generation
+        self.search_requests.put((self.search_generation, query, within))
+        if not self.search_polling:
+            self.search_polling = True
+            self.root.after(SEARCH_POLL_MS, self.poll_search_results)
+    
+    def search_worker(self):
+        """Worker thread: run queued searches, skipping superseded ones"""
+        while True:
+            request = self.search_requests.get()
+            # Only the newest waiting request matters
+            while not self.search_requests.empty():
+                request = self.search_requests.get_nowait()
+            
+            generation, query, within = request
+            if generation != self.search_generation:
+                continue
+            
+            # Report failures instead of letting the thread die while the
+            # Tk thread keeps polling for a result
+            try:
+                results, error = self.manager.search_records(query, within), None
+            except Exception as e:
+                results, error = [], e
+            if generation == self.search_generation:
+                self.search_results.put((generation, query, results, error))
+    
+    def poll_search_results(self):
+        """Tk thread: show the latest live search result once it arrives"""
+        latest = None
+        while not self.search_results.empty():
+            latest = self.search_results.get_nowait()
+        
+        if latest is not None and latest[0] == self.search_generation:
+            self.search_polling = False
+            generation, query, results, error = latest
+            if error is None:
+                self.show_live_results(query, results)
+            else:
+                self.status_bar.config(text=f"✗ Search failed: {error}")
+        elif self.pending_generation != self.search_generation:
+            # The pending search was superseded by a refresh or button search
+            self.search_polling = False
+        else:
+            self.root.after(SEARCH_POLL_MS, self.poll_search_results)
+    
+    def show_live_results(self, query, results):
+        """Attach the rows of a live search result (record numbers)"""
+        self.last_search = (query, results)
+        self.show_rows(results)
+        self.status_bar.config(text=f"Found {len(results)} contact(s) for '{query}'")
+
+    def on_close(self):
+        """Write pending changes before the window closes"""
+        if not self.manager.close():
+            messagebox.showerror("Error", "✗ Some changes could not be saved.")
+        self.root.destroy()
+
 def main():
     """Main function to run the GUI application"""
     root = tk.Tk()
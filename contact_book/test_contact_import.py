@@ -0,0 +1,102 @@
+"""
+Contact Management System - Bulk Import Tests
+Covers CSV and vCard imports, rejected records (invalid fields and
+duplicates), a worker pool and the command-line argument checks.
+
+Run with: python -m pytest -q
+"""
+
+import sys
+
+import pytest
+
+import contact_import
+from contact_import import import_contacts
+from contact_manager import ContactManager
+
+CSV = """Name,Phone,Email,Address
+Ram Sharma,9841000001,ram@example.com,Kathmandu
+Sita Rai,9841000002,not-an-email,Pokhara
+Hari Thapa,984-100-0001,hari@example.com,Lalitpur
+
+Gita Ram,9841000004,gita@example.com,Bhaktapur
+"""
+
+VCARD = """BEGIN:VCARD
+VERSION:3.0
+FN:Ram Sharma
+TEL;TYPE=CELL:9841000001
+item1.EMAIL:ram@example.com
+ADR:;;Thamel;Kathmandu;;44600;
+END:VCARD
+BEGIN:VCARD
+FN:Sita Rai
+TEL:9841000002
+EMAIL:sita@exam
+ ple.com
+ADR:;;Lakeside;Pokhara
+END:VCARD
+"""
+
+
+@pytest.fixture
+def manager(tmp_path):
+    return ContactManager(str(tmp_path / "contacts.json"), verbose=False)
+
+
+def test_csv_import_reports_rejects_by_line(manager, tmp_path):
+    path = tmp_path / "people.csv"
+    path.write_text(CSV)
+
+    imported, rejects = import_contacts(manager, str(path), chunk_size=2)
+    assert imported == 2
+    assert [contact['name'] for contact in manager.contacts] == ["Ram Sharma", "Gita Ram"]
+    assert [reject['line'] for reject in rejects] == [3, 4]
+    assert "email" in rejects[0]['reason'].lower()
+    assert rejects[1]['reason'] == "Duplicate phone (first seen on line 2)"
+
+
+def test_existing_contacts_are_not_imported_again(manager, tmp_path):
+    manager.add_contact("Gita Ram", "9841000004", "gita@example.com", "Bhaktapur")
+    path = tmp_path / "people.csv"
+    path.write_text(CSV)
+
+    imported, rejects = import_contacts(manager, str(path))
+    assert imported == 1
+    assert "already exists" in rejects[-1]['reason']
+    assert manager.get_contact_count() == 2
+
+
+def test_vcard_import_unfolds_lines(manager, tmp_path):
+    path = tmp_path / "people.vcf"
+    path.write_text(VCARD)
+
+    imported, rejects = import_contacts(manager, str(path))
+    assert (imported, rejects) == (2, [])
+    assert manager.contacts[0]['address'] == "Thamel, Kathmandu, 44600"
+    assert manager.contacts[1]['email'] == "sita@example.com"
+
+
+def test_worker_pool_gives_the_same_result(manager, tmp_path):
+    path = tmp_path / "people.csv"
+    path.write_text(CSV)
+
+    imported, rejects = import_contacts(manager, str(path), chunk_size=1, workers=2)
+    assert imported == 2
+    assert [reject['line'] for reject in rejects] == [3, 4]
+
+
+@pytest.mark.parametrize('option', ['--chunk-size', '--workers'])
+@pytest.mark.parametrize('value', ['0', '-3'])
+def test_counts_below_one_are_rejected(tmp_path, monkeypatch, capsys, option, value):
+    path = tmp_path / "people.csv"
+    path.write_text(CSV)
+    contacts = tmp_path / "contacts.json"
+    monkeypatch.setattr(sys, 'argv', ['contact_import.py', str(path), option, value,
+                                      '--contacts', str(contacts)])
+
+    with pytest.raises(SystemExit) as exit_info:
+        contact_import.main()
+    assert exit_info.value.code == 2
+    assert f"{option} must be at least 1" in capsys.readouterr().err
+    assert not contacts.exists()
@@ -0,0 +1,152 @@
+"""
+Contact Management System - ContactManager Tests
+Covers the phone, email and search indexes after updates and deletes,
+duplicate keys in the data file, changes by record number and rollback
+when a save fails.
+
+Run with: python -m pytest -q
+"""
+
+import json
+
+import pytest
+
+from contact_manager import ContactManager
+
+PEOPLE = [
+    ("Ram Sharma", "984-100-0001", "ram@example.com"),
+    ("Sita Rai", "9841000002", "sita@example.com"),
+    ("Hari Thapa", "(984) 100-0003", "hari@example.com"),
+    ("Gita Ram", "9841000004", "gita@example.com"),
+]
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """Silent manager with four contacts"""
+    manager = ContactManager(str(tmp_path / "contacts.json"), verbose=False)
+    for name, phone, email in PEOPLE:
+        assert manager.add_contact(name, phone, email, "Kathmandu")[0]
+    return manager
+
+
+def names(contacts) -> list:
+    return [contact['name'] for contact in contacts]
+
+
+def test_lookups_ignore_phone_formatting(manager):
+    assert manager.contacts[manager.find_contact_index("9841000003")]['name'] == "Hari Thapa"
+    assert manager.contacts[manager.find_contact_index(" SITA@example.com ")]['name'] == "Sita Rai"
+    assert manager.find_contact_index("9840000000") is None
+
+
+def test_indexes_follow_delete(manager):
+    assert manager.delete_contact("ram@example.com")[0]
+
+    assert manager.find_contact_index("9841000001") is None
+    assert manager.find_contact_index("ram@example.com") is None
+    # Later contacts are still found, at their new positions
+    for position, (name, phone, email) in enumerate(PEOPLE[1:]):
+        assert manager.find_contact_index(phone) == position
+        assert manager.find_contact_index(email) == position
+        assert manager.contacts[position]['name'] == name
+    assert names(manager.search_contacts("ram")) == ["Gita Ram"]
+    assert manager.get_contact_count() == 3
+
+    # The deleted phone and email can be used again
+    assert manager.add_contact("Ram Sharma", "9841000001", "ram@example.com", "Pokhara")[0]
+    assert names(manager.contacts)[-1] == "Ram Sharma"
+
+
+def test_indexes_follow_update(manager):
+    success, _ = manager.update_contact("9841000002", name="sita k rai",
+                                        phone="9841999999", email="sita.rai@example.com")
+    assert success
+
+    assert manager.find_contact_index("9841000002") is None
+    assert manager.find_contact_index("sita@example.com") is None
+    assert manager.find_contact_index("9841999999") == 1
+    assert manager.find_contact_index("sita.rai@example.com") == 1
+    assert names(manager.search_contacts("sita")) == ["Sita K Rai"]
+    assert names(manager.search_contacts("999 999")) == ["Sita K Rai"]
+    assert manager.search_contacts("1000002") == []
+
+    # The old phone is free, the new one is taken
+    assert manager.add_contact("New Person", "9841000002", "new@example.com", "Lalitpur")[0]
+    assert not manager.add_contact("Other Person", "9841999999", "other@example.com", "Lalitpur")[0]
+
+
+def test_update_rejects_key_of_another_contact(manager):
+    success, message = manager.update_contact("9841000002", phone="9841000003")
+    assert not success
+    assert "already exists" in message
+    assert manager.find_contact_index("9841000002") == 1
+
+
+def test_failed_save_restores_indexes(manager, monkeypatch):
+    monkeypatch.setattr(manager, 'save_contacts', lambda: False)
+
+    assert not manager.delete_contact("9841000002")[0]
+    assert not manager.update_contact("9841000003", phone="9841777777")[0]
+    assert not manager.add_contact("New Person", "9841888888", "new@example.com", "Lalitpur")[0]
+
+    assert names(manager.contacts) == [name for name, _, _ in PEOPLE]
+    for position, (_, phone, email) in enumerate(PEOPLE):
+        assert manager.find_contact_index(phone) == position
+        assert manager.find_contact_index(email) == position
+    assert manager.find_contact_index("9841777777") is None
+    assert manager.find_contact_index("9841888888") is None
+    assert names(manager.search_contacts("sita")) == ["Sita Rai"]
+
+
+def test_duplicate_phones_in_file(tmp_path):
+    path = tmp_path / "contacts.json"
+    contacts = [
+        {'name': "Ram Sharma", 'phone': "9841000001", 'email': "ram@example.com", 'address': "A"},
+        {'name': "Ram Copy", 'phone': "984-100-0001", 'email': "copy@example.com", 'address': "B"},
+    ]
+    path.write_text(json.dumps(contacts))
+    manager = ContactManager(str(path), verbose=False)
+
+    # Both show up in searches; lookups resolve to the first, like a scan
+    assert names(manager.search_contacts("9841000001")) == ["Ram Sharma", "Ram Copy"]
+    assert manager.find_contact_index("9841000001") == 0
+
+    # Deleting the first hands the phone to the duplicate
+    assert manager.delete_contact("ram@example.com")[0]
+    assert manager.contacts[manager.find_contact_index("9841000001")]['name'] == "Ram Copy"
+    assert manager.delete_contact("9841000001")[0]
+    assert manager.get_contact_count() == 0
+
+
+def test_changes_reach_disk(manager):
+    manager.delete_contact("9841000001")
+    manager.update_contact("9841000004", address="Bhaktapur")
+
+    reopened = ContactManager(manager.path, verbose=False)
+    assert names(reopened.contacts) == ["Sita Rai", "Hari Thapa", "Gita Ram"]
+    assert reopened.contacts[reopened.find_contact_index("9841000004")]['address'] == "Bhaktapur"
+
+
+def test_record_methods_reach_duplicates(tmp_path):
+    path = tmp_path / "contacts.json"
+    contacts = [
+        {'name': "Ram Sharma", 'phone': "9841000001", 'email': "ram@example.com", 'address': "A"},
+        {'name': "Ram Copy", 'phone': "984-100-0001", 'email': "copy@example.com", 'address': "B"},
+        {'name': "Sita Rai", 'phone': "9841000002", 'email': "sita@example.com", 'address': "C"},
+    ]
+    path.write_text(json.dumps(contacts))
+    manager = ContactManager(str(path), verbose=False)
+
+    assert manager.search_records("ram") == [0, 1]
+    assert manager.search_records("9841000001", within=[1, 2]) == [1]
+
+    # The second holder of a phone can be changed and deleted directly
+    assert manager.update_record(1, address="Pokhara")[0]
+    assert [contact['address'] for contact in manager.contacts] == ["A", "Pokhara", "C"]
+    assert manager.delete_record(1)[0]
+    assert names(manager.contacts) == ["Ram Sharma", "Sita Rai"]
+    assert manager.search_records("ram", within=[0, 1]) == [0]
+
+    assert not manager.update_record(1, address="Gone")[0]
+    assert not manager.delete_record(1)[0]
@@ -0,0 +1,91 @@
+"""
+Contact Management System - Read-Only Mode Tests
+Covers lookups and searches through the memory-mapped index, rebuilding
+a stale index, keeping the index in memory when it cannot be stored and
+refusing empty or missing files.
+
+Run with: python -m pytest -q
+"""
+
+import json
+import os
+
+import pytest
+
+import contact_mmap
+from contact_manager import ContactManager
+from contact_mmap import INDEX_SUFFIX, ReadOnlyContactBook
+
+
+@pytest.fixture
+def path(tmp_path):
+    """Address book with formatted phones and a non-ASCII name"""
+    path = tmp_path / "contacts.json"
+    contacts = [
+        {'name': "Ram Sharma", 'phone': "984-100-0001", 'email': "ram@example.com", 'address': "A"},
+        {'name': "Sita Rai", 'phone': "9841000002", 'email': "sita@example.com", 'address': "B"},
+        {'name': "Zoë Gurung", 'phone': "(984) 100-0003", 'email': "zoe@example.com", 'address': "C"},
+    ]
+    path.write_text(json.dumps(contacts, indent=2, ensure_ascii=False), encoding='utf-8')
+    return str(path)
+
+
+def names(contacts) -> list:
+    return [contact['name'] for contact in contacts]
+
+
+def test_matches_contact_manager(path):
+    manager = ContactManager(path, verbose=False)
+    book = ReadOnlyContactBook(path)
+    try:
+        assert book.get_contact_count() == 3
+        assert names(book.view_all_contacts()) == names(manager.contacts)
+        for identifier in ("9841000001", "984 100 0003", "SITA@example.com", "9840000000"):
+            assert book.find_contact_index(identifier) == manager.find_contact_index(identifier)
+        for query in ("ra", "zoë", "100 0002", ""):
+            assert names(book.search_contacts(query)) == names(manager.search_contacts(query))
+        assert not book.add_contact("New Person", "9841888888", "new@example.com", "Lalitpur")[0]
+    finally:
+        book.close()
+    assert os.path.exists(path + INDEX_SUFFIX)
+
+
+def test_stale_index_is_rebuilt(path):
+    ReadOnlyContactBook(path).close()
+    with open(path) as file:
+        contacts = json.load(file)
+    contacts.append({'name': "Hari Thapa", 'phone': "9841000004",
+                     'email': "hari@example.com", 'address': "Bhaktapur"})
+    with open(path, 'w') as file:
+        json.dump(contacts, file)
+
+    book = ReadOnlyContactBook(path)
+    try:
+        assert book.get_contact_count() == 4
+        assert book.get_contact(book.find_contact_index("hari@example.com"))['name'] == "Hari Thapa"
+    finally:
+        book.close()
+
+
+def test_index_kept_in_memory_when_it_cannot_be_stored(path, monkeypatch):
+    def read_only(target, data):
+        raise PermissionError(13, "Permission denied", target)
+    monkeypatch.setattr(contact_mmap, 'atomic_write_bytes', read_only)
+
+    book = ReadOnlyContactBook(path)
+    try:
+        assert book.index_path is None
+        assert not os.path.exists(path + INDEX_SUFFIX)
+        assert book.get_contact(book.find_contact_index("9841000003"))['name'] == "Zoë Gurung"
+        assert names(book.search_contacts("rai")) == ["Sita Rai"]
+    finally:
+        book.close()
+
+
+@pytest.mark.parametrize('content', [None, ""])
+def test_missing_or_empty_file_is_refused(tmp_path, content):
+    path = tmp_path / "contacts.json"
+    if content is not None:
+        path.write_text(content)
+    with pytest.raises((OSError, ValueError)):
+        ReadOnlyContactBook(str(path))
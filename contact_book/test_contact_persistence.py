@@ -0,0 +1,85 @@
+"""
+Contact Management System - Write-Behind Tests
+Covers flushing and closing the write-behind writer and saves made after
+it was closed.
+
+Run with: python -m pytest -q
+"""
+
+import json
+import threading
+
+from contact_manager import ContactManager
+from contact_persistence import WriteBehindWriter
+
+
+def read_names(path) -> list:
+    with open(path) as file:
+        return [contact['name'] for contact in json.load(file)]
+
+
+def test_flush_writes_coalesced_changes(tmp_path):
+    path = tmp_path / "contacts.json"
+    writes = []
+
+    def write(target, contacts):
+        writes.append(len(contacts))
+        path.write_text(json.dumps(contacts))
+
+    contacts = []
+    lock = threading.Lock()
+
+    def snapshot():
+        with lock:
+            return list(contacts)
+
+    # A long delay keeps the writer waiting until flush() cuts it short
+    writer = WriteBehindWriter(str(path), snapshot, delay=10, max_delay=10, write=write)
+    for i in range(50):
+        with lock:
+            contacts.append({'name': f"Contact {i}"})
+        assert writer.schedule()
+
+    assert writer.flush(timeout=5)
+    assert writes[-1] == 50
+    assert len(writes) < 50
+    assert writer.close()
+
+
+def test_close_writes_pending_changes(tmp_path):
+    path = tmp_path / "contacts.json"
+    manager = ContactManager(str(path), write_behind=True, verbose=False)
+    manager.add_contact("Ram Sharma", "9841000001", "ram@example.com", "Kathmandu")
+    manager.add_contact("Sita Rai", "9841000002", "sita@example.com", "Pokhara")
+
+    assert manager.close()
+    assert read_names(path) == ["Ram Sharma", "Sita Rai"]
+    assert not manager.writer.thread.is_alive()
+
+
+def test_saves_after_close_are_written_synchronously(tmp_path):
+    path = tmp_path / "contacts.json"
+    manager = ContactManager(str(path), write_behind=True, verbose=False)
+    manager.add_contact("Ram Sharma", "9841000001", "ram@example.com", "Kathmandu")
+    manager.close()
+
+    assert manager.add_contact("Sita Rai", "9841000002", "sita@example.com", "Pokhara")[0]
+    assert read_names(path) == ["Ram Sharma", "Sita Rai"]
+    assert manager.flush()
+
+
+def test_failed_save_after_close_is_reported(tmp_path, capsys):
+    path = tmp_path / "contacts.json"
+    manager = ContactManager(str(path), write_behind=True, verbose=False)
+    manager.add_contact("Ram Sharma", "9841000001", "ram@example.com", "Kathmandu")
+    manager.close()
+
+    def fail(target, contacts):
+        raise OSError("disk full")
+    manager.writer.write = fail
+
+    success, _ = manager.add_contact("Sita Rai", "9841000002", "sita@example.com", "Pokhara")
+    assert not success
+    assert manager.get_contact_count() == 1
+    assert "disk full" in capsys.readouterr().out
+    assert read_names(path) == ["Ram Sharma"]
@@ -0,0 +1,101 @@
+"""
+Contact Management System - Address Book Registry Tests
+Covers checkouts, eviction, reopening evicted books, concurrent use and
+books whose changes cannot be saved on eviction.
+
+Run with: python -m pytest -q
+"""
+
+import json
+import threading
+
+from contact_registry import ContactRegistry
+
+
+def read_names(path) -> list:
+    with open(path) as file:
+        return [contact['name'] for contact in json.load(file)]
+
+
+def test_registry_never_evicts_checked_out_books(tmp_path, capsys):
+    registry = ContactRegistry(str(tmp_path), capacity=1)
+    ram = registry.get("ram")
+    with registry.checkout("sita"):
+        pass
+
+    # "ram" is still checked out, so the cache went over capacity instead
+    assert "ram" in registry
+    assert not registry.evict("ram")
+    assert ram.add_contact("Ram Sharma", "9841000001", "ram@example.com", "Kathmandu")[0]
+
+    registry.release("ram")
+    assert registry.open_books() == ["ram"]
+    assert registry.evict("ram")
+    assert read_names(tmp_path / "ram.json") == ["Ram Sharma"]
+
+    # Reopening reads what the evicted manager wrote
+    with registry.checkout("ram") as book:
+        assert book is not ram
+        assert book.get_contact_count() == 1
+    registry.close()
+    assert len(registry) == 0
+
+
+def test_registry_checkouts_from_many_threads(tmp_path, capsys):
+    registry = ContactRegistry(str(tmp_path), capacity=2)
+    errors = []
+
+    def client(number):
+        try:
+            for round_ in range(10):
+                book_id = f"book{(number + round_) % 4}"
+                with registry.checkout(book_id) as book:
+                    phone = f"98{number:02d}{round_:06d}"
+                    success, message = book.add_contact(
+                        "Test Person", phone, f"p{number}.{round_}@example.com", "Kathmandu")
+                    if not success:
+                        errors.append(message)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=client, args=(number,)) for number in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    registry.close()
+
+    assert errors == []
+    assert registry.pending == {}
+    total = sum(len(read_names(tmp_path / f"book{i}.json")) for i in range(4))
+    assert total == 60
+
+
+def test_book_that_cannot_be_saved_stays_open(tmp_path, capsys):
+    registry = ContactRegistry(str(tmp_path), capacity=4)
+    with registry.checkout("ram") as book:
+        write = book.writer.write
+
+        def fail(target, contacts):
+            raise OSError("disk full")
+        book.writer.write = fail
+        book.writer.max_delay = 0.01
+        assert book.add_contact("Ram Sharma", "9841000001", "ram@example.com", "Kathmandu")[0]
+
+    assert not registry.evict("ram")
+    assert "ram" in registry
+    assert "Could not save address book 'ram'" in capsys.readouterr().out
+
+    # Once the disk recovers, the next eviction saves the pending change
+    book.writer.write = write
+    assert registry.evict("ram")
+    assert "ram" not in registry
+    assert read_names(tmp_path / "ram.json") == ["Ram Sharma"]
+
+
+def test_registry_managers_are_silent(tmp_path, capsys):
+    registry = ContactRegistry(str(tmp_path))
+    with registry.checkout("ram") as book:
+        book.add_contact("Ram Sharma", "9841000001", "ram@example.com", "Kathmandu")
+    assert registry.close()
+    assert capsys.readouterr().out == ""
@@ -0,0 +1,62 @@
+"""
+Contact Management System - Search Index Tests
+Compares TrigramIndex results with a plain substring scan for short and
+long queries, after documents are added, replaced and removed.
+
+Run with: python -m pytest -q
+"""
+
+import random
+
+from contact_search import TrigramIndex
+
+
+def scan(documents: dict, query: str) -> set:
+    """Keys whose texts contain query, by brute force."""
+    return {key for key, texts in documents.items() if any(query in text for text in texts)}
+
+
+def random_text(rng: random.Random) -> str:
+    return ''.join(rng.choice("abcram 98") for _ in range(rng.randint(0, 9)))
+
+
+def test_matches_a_substring_scan():
+    rng = random.Random(2026)
+    index = TrigramIndex()
+    documents = {}
+
+    for step in range(400):
+        key = rng.randrange(60)
+        if rng.random() < 0.25:
+            index.remove(key)
+            documents.pop(key, None)
+        else:
+            texts = (random_text(rng), random_text(rng))
+            index.add(key, *texts)  # Replaces an existing document
+            documents[key] = texts
+        assert len(index) == len(documents)
+
+        if step % 10 == 0:
+            for query in ["", "a", "ra", "ram", "m 9", "98 ", "abcr", "zz", "ram 98"]:
+                assert index.search(query) == scan(documents, query), query
+
+
+def test_grams_never_span_two_texts():
+    index = TrigramIndex()
+    index.add(1, "ram", "984")
+    assert index.search("m9") == set()
+    assert index.search("am9") == set()
+    assert index.search("ram") == {1}
+    assert index.search("98") == {1}
+
+
+def test_removed_documents_leave_no_postings():
+    index = TrigramIndex()
+    index.add(1, "sita rai", "9841000002")
+    index.add(2, "ra", "1")
+    index.remove(1)
+    index.remove(2)
+    index.remove(3)  # Not indexed: no-op
+    assert index.postings == {}
+    assert index.short_documents == set()
+    assert index.search("ra") == set()
@@ -0,0 +1,50 @@
+"""
+Contact Management System - Validation Tests
+Checks that the batch validator (validate_many / first_errors) agrees
+with the single-value validators and ContactManager.validation_error.
+
+Run with: python -m pytest -q
+"""
+
+import pytest
+
+from contact_manager import ContactManager
+from contact_validation import (FIELDS, first_errors, validate_address, validate_email,
+                                validate_many, validate_name, validate_phone)
+
+NAMES = ["Ram Sharma", "O'Neil-Rai", "  Sita  ", "R2D2", "", "   ", "Ram\n", "Zoë"]
+PHONES = ["9841000001", "+977 984-100-0001", "(984) 100 0001", "984100", "+" + "1" * 16,
+          "98410000O1", "", "++9841000001"]
+EMAILS = ["ram@example.com", " RAM@Example.COM ", "ram@example", "ram@@example.com",
+          "ram.sharma+tag@mail.example.np", "", "@example.com", "ram@example.c"]
+ADDRESSES = ["Kathmandu", "  ", "", "Ward 5, Pokhara"]
+
+VALIDATORS = {'name': validate_name, 'phone': validate_phone,
+              'email': validate_email, 'address': validate_address}
+VALUES = {'name': NAMES, 'phone': PHONES, 'email': EMAILS, 'address': ADDRESSES}
+
+
+@pytest.mark.parametrize('field', FIELDS)
+def test_masks_match_single_validators(field):
+    records = [{field: value} for value in VALUES[field]]
+    mask = validate_many(records, fields=[field])[field]
+    assert mask == [not VALIDATORS[field](value) for value in VALUES[field]]
+
+
+def test_missing_fields_count_as_empty():
+    masks = validate_many([{}, {'name': None, 'phone': None, 'email': None, 'address': None}])
+    assert all(masks[field] == [True, True] for field in FIELDS)
+
+
+def test_unknown_field_is_rejected():
+    with pytest.raises(ValueError):
+        validate_many([{'name': "Ram Sharma"}], fields=['nickname'])
+
+
+def test_first_errors_match_validation_error():
+    records = [{'name': name, 'phone': phone, 'email': email, 'address': address}
+               for name in NAMES[::2] for phone in PHONES[::3]
+               for email in EMAILS[::3] for address in ADDRESSES]
+    errors = first_errors(validate_many(records))
+    assert errors == [ContactManager.validation_error(**record) for record in records]
+    assert None in errors
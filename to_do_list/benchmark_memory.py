@@ -0,0 +1,127 @@
+"""
+To-Do List Application - Task Memory Benchmark
+Compares the memory used per task by the original dict-backed Task
+(eager timestamp strings) with the slotted Task (integer timestamps),
+both for new tasks and for tasks loaded from a JSON task file.
+
+Usage:
+    python benchmark_memory.py [task_count]
+
+Author: Professional Python Developer
+Date: 2026-10-17
+"""
+
+import gc
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+from todo_core import Task, format_timestamp
+
+
+class DictTask:
+    """Replica of the original Task layout: per-instance __dict__ and eager timestamp strings."""
+
+    def __init__(self, id, title, completed=False, created_at=None, updated_at=None):
+        self.id = id
+        self.title = title
+        self.completed = completed
+        self.created_at = created_at or datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self.updated_at = updated_at or self.created_at
+
+
+def task_file_text(titles):
+    """
+    Write a task file for the titles and read its text back.
+
+    Every task gets its own timestamp, as in a file built up over time.
+
+    Args:
+        titles (list): Task titles
+
+    Returns:
+        str: Contents of the task file
+    """
+    start = int(time.time()) - len(titles)
+    records = [{'id': i, 'title': title, 'completed': i % 3 == 0,
+                'created_at': format_timestamp(start + i), 'updated_at': format_timestamp(start + i)}
+               for i, title in enumerate(titles, 1)]
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "tasks.json")
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(records, f)
+        with open(path, encoding='utf-8') as f:
+            return f.read()
+
+
+def measure(build):
+    """
+    Build a list of tasks and measure the memory they hold.
+
+    Args:
+        build (callable): Returns the task list; its inputs are prepared
+            beforehand and not counted
+
+    Returns:
+        tuple: (bytes allocated, seconds taken)
+    """
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+
+    tasks = build()
+
+    elapsed = time.perf_counter() - start
+    allocated = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    del tasks
+    return allocated, elapsed
+
+
+def main():
+    """Run the benchmark and print bytes per task for both layouts."""
+    task_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    titles = [f"Benchmark task {i}" for i in range(task_count)]
+
+    print("=" * 70)
+    print(" " * 20 + "TASK MEMORY BENCHMARK")
+    print("=" * 70)
+    print(f"Tasks: {task_count:,} (titles of new tasks are shared and not counted)\n")
+    print(f"{'Layout':<30} {'Total (MB)':>12} {'Bytes/task':>12} {'Build (s)':>10}")
+    print("-" * 70)
+
+    text = task_file_text(titles)
+    cases = (
+        ("New tasks", lambda task_class: [task_class(id=i, title=title)
+                                          for i, title in enumerate(titles, 1)]),
+        # Parsed inside the measurement: only what the tasks keep is counted.
+        # DictTask is built from the dicts the way the original from_dict did.
+        ("Loaded from tasks.json", lambda task_class: [
+            task_class.from_dict(data) if task_class is Task else
+            task_class(data['id'], data['title'], data.get('completed', False),
+                       data.get('created_at'), data.get('updated_at'))
+            for data in json.loads(text)]),
+    )
+
+    for case, build in cases:
+        print(case)
+        results = []
+        for name, task_class in (("dict + string timestamps", DictTask),
+                                 ("__slots__ + int timestamps", Task)):
+            allocated, elapsed = measure(lambda: build(task_class))
+            results.append(allocated)
+            print(f"  {name:<28} {allocated / 1e6:>12.1f} {allocated / task_count:>12.1f} {elapsed:>10.2f}")
+
+        before, after = results
+        print(f"  Saved: {(before - after) / task_count:.1f} bytes/task "
+              f"({(1 - after / before) * 100:.0f}%)\n")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
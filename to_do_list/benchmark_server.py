@@ -0,0 +1,193 @@
+"""
+To-Do List Application - HTTP API Benchmark
+Starts todo_server on a free local port with a seeded task list and
+measures requests per second and latency percentiles for several request
+mixes, with and without connection reuse.
+
+Usage:
+    python benchmark_server.py [requests] [clients] [seed]
+
+Author: Professional Python Developer
+Date: 2026-10-17
+"""
+
+import argparse
+import http.client
+import json
+import os
+import tempfile
+import threading
+import time
+
+from todo_core import Task, TodoManager
+from todo_server import TodoServer
+from todo_storage import JournalStorage
+
+
+def seed_manager(data_file: str, count: int) -> TodoManager:
+    """
+    Create a silent manager holding count tasks.
+
+    Args:
+        data_file (str): Task file to create
+        count (int): Number of tasks to add
+
+    Returns:
+        TodoManager: The seeded manager
+    """
+    storage = JournalStorage(data_file, fsync=False)
+    base = 1_760_000_000
+    storage.commit([Task(i, f"Seeded task {i}", completed=i % 4 == 0, created_at=base + i)
+                    for i in range(1, count + 1)], count + 1)
+    return TodoManager(data_file, storage=storage, verbose=False)
+
+
+class Client:
+    """One benchmark client; reuses its connection unless keep_alive is False."""
+
+    def __init__(self, port: int, keep_alive: bool):
+        self.port = port
+        self.keep_alive = keep_alive
+        self.connection = None
+        self.etag = None
+
+    def request(self, method: str, path: str, body: dict = None, headers: dict = None):
+        """Send one request and return (status, headers, decoded body)."""
+        if self.connection is None:
+            self.connection = http.client.HTTPConnection('127.0.0.1', self.port)
+        headers = dict(headers or {})
+        data = None
+        if body is not None:
+            data = json.dumps(body)
+            headers['Content-Type'] = 'application/json'
+        if not self.keep_alive:
+            headers['Connection'] = 'close'
+
+        self.connection.request(method, path, data, headers)
+        response = self.connection.getresponse()
+        payload = response.read()
+        if not self.keep_alive:
+            self.connection.close()
+            self.connection = None
+        return response.status, response, json.loads(payload) if payload else None
+
+    def close(self):
+        if self.connection is not None:
+            self.connection.close()
+
+
+def list_page(client: Client, number: int):
+    """GET one page of tasks."""
+    status, _, _ = client.request('GET', f"/tasks?offset={number % 20 * 50}&limit=50")
+    assert status == 200, status
+
+
+def revalidate(client: Client, number: int):
+    """GET the first page with If-None-Match (304 once the ETag is known)."""
+    headers = {'If-None-Match': client.etag} if client.etag else None
+    status, response, _ = client.request('GET', "/tasks?limit=50", headers=headers)
+    assert status in (200, 304), status
+    client.etag = response.getheader('ETag')
+
+
+def add_and_toggle(client: Client, number: int):
+    """POST a task, then toggle it (two requests)."""
+    status, _, task = client.request('POST', "/tasks", {'title': f"Benchmark task {number}"})
+    assert status == 201, status
+    status, _, _ = client.request('POST', f"/tasks/{task['id']}/toggle")
+    assert status == 200, status
+
+
+def run_scenario(port: int, operation, requests: int, clients: int, keep_alive: bool) -> dict:
+    """
+    Run an operation from several client threads.
+
+    Args:
+        port (int): Server port
+        operation (callable): Called as operation(client, number) per iteration
+        requests (int): Total operations across all clients
+        clients (int): Number of concurrent client threads
+        keep_alive (bool): Reuse connections between requests
+
+    Returns:
+        dict: operations per second and p50/p99 latency in milliseconds
+    """
+    latencies = [[] for _ in range(clients)]
+
+    def worker(index: int):
+        client = Client(port, keep_alive)
+        for number in range(index, requests, clients):
+            start = time.perf_counter()
+            operation(client, number)
+            latencies[index].append(time.perf_counter() - start)
+        client.close()
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(clients)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    samples = sorted(sample for per_client in latencies for sample in per_client)
+    return {
+        'rate': len(samples) / elapsed,
+        'p50': samples[len(samples) // 2] * 1000,
+        'p99': samples[int(len(samples) * 0.99)] * 1000,
+    }
+
+
+def main():
+    """Run the benchmark and print a summary table."""
+    parser = argparse.ArgumentParser(description="Measure throughput and latency of todo_server.")
+    parser.add_argument('requests', nargs='?', type=int, default=2_000,
+                        help="operations per scenario (default: 2000)")
+    parser.add_argument('clients', nargs='?', type=int, default=8,
+                        help="concurrent client threads (default: 8)")
+    parser.add_argument('seed', nargs='?', type=int, default=10_000,
+                        help="tasks in the list before the run (default: 10000)")
+    args = parser.parse_args()
+    if args.clients < 1:
+        parser.error("clients must be at least 1")
+    if args.requests < args.clients:
+        parser.error("requests must be at least the number of clients")
+    if args.seed < 0:
+        parser.error("seed cannot be negative")
+    requests, clients, seed = args.requests, args.clients, args.seed
+
+    print("=" * 70)
+    print(" " * 20 + "TO-DO HTTP API BENCHMARK")
+    print("=" * 70)
+    print(f"Seeded tasks: {seed:,}   operations per scenario: {requests:,}   "
+          f"clients: {clients}\n")
+    print(f"{'Scenario':<34} {'ops/s':>10} {'p50 (ms)':>10} {'p99 (ms)':>10}")
+    print("-" * 70)
+
+    with tempfile.TemporaryDirectory() as directory:
+        manager = seed_manager(os.path.join(directory, "tasks.json"), seed)
+        server = TodoServer(('127.0.0.1', 0), manager, quiet=True)
+        port = server.server_address[1]
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+
+        scenarios = [
+            ("list page (new connection)", list_page, False),
+            ("list page (keep-alive)", list_page, True),
+            ("list page If-None-Match (304)", revalidate, True),
+            ("add + toggle (keep-alive)", add_and_toggle, True),
+        ]
+        for label, operation, keep_alive in scenarios:
+            result = run_scenario(port, operation, requests, clients, keep_alive)
+            print(f"{label:<34} {result['rate']:>10,.0f} {result['p50']:>10.2f} {result['p99']:>10.2f}")
+
+        server.shutdown()
+        server.server_close()
+        manager.close()
+
+    print("-" * 70)
+    print("Client and server share one process; absolute numbers include client overhead.")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
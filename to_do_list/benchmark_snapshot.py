@@ -0,0 +1,76 @@
+"""
+To-Do List Application - Snapshot Format Benchmark
+Compares the indented JSON task file with the binary snapshot format:
+file size, save time and TodoManager load time.
+
+Usage:
+    python benchmark_snapshot.py [task_count]
+
+Author: Professional Python Developer
+Date: 2026-10-17
+"""
+
+import os
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+
+from todo_core import Task, TodoManager
+from todo_storage import BinarySnapshotStorage, JSONFileStorage
+
+
+def build_tasks(count: int) -> list:
+    """Build count tasks with distinct timestamps."""
+    base = 1_760_000_000
+    return [Task(i, f"Benchmark task number {i} with a longer description",
+                 completed=i % 3 == 0, created_at=base + i, updated_at=base + 2 * i)
+            for i in range(1, count + 1)]
+
+
+def measure(storage, path: str, tasks: list) -> dict:
+    """Save tasks with a storage backend, then load them with TodoManager."""
+    start = time.perf_counter()
+    storage.commit(tasks, len(tasks) + 1)
+    save_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    with open(os.devnull, 'w', encoding='utf-8') as devnull, redirect_stdout(devnull):
+        manager = TodoManager(path, storage=storage)
+    load_seconds = time.perf_counter() - start
+
+    assert manager.get_task_count()['total'] == len(tasks)
+    return {'size': os.path.getsize(path), 'save': save_seconds, 'load': load_seconds}
+
+
+def main():
+    """Run the benchmark and print a summary table."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    tasks = build_tasks(count)
+
+    print("=" * 70)
+    print(" " * 20 + "TASK SNAPSHOT FORMAT BENCHMARK")
+    print("=" * 70)
+    print(f"Tasks: {count:,}\n")
+    print(f"{'Format':<20} {'Size (MB)':>12} {'Save (s)':>10} {'Load (s)':>10}")
+    print("-" * 70)
+
+    with tempfile.TemporaryDirectory() as directory:
+        results = {}
+        for label, storage_class, name in (("JSON (indent=4)", JSONFileStorage, "tasks.json"),
+                                           ("binary snapshot", BinarySnapshotStorage, "tasks.bin")):
+            path = os.path.join(directory, name)
+            result = measure(storage_class(path), path, tasks)
+            results[label] = result
+            print(f"{label:<20} {result['size'] / 1e6:>12.1f} {result['save']:>10.2f} {result['load']:>10.2f}")
+
+    json_result, binary_result = results.values()
+    print("-" * 70)
+    print(f"Binary is {json_result['size'] / binary_result['size']:.1f}x smaller, saves "
+          f"{json_result['save'] / binary_result['save']:.1f}x and loads "
+          f"{json_result['load'] / binary_result['load']:.1f}x faster.")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
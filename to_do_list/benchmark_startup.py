@@ -0,0 +1,145 @@
+"""
+To-Do List Application - Startup Benchmark
+Generates a large tasks.json file and measures how long TodoManager takes
+to deliver the first page of tasks with the streaming loader, compared to
+decoding the whole file with json.load first.
+
+Each measurement runs in its own process so peak memory is reported per
+loader.
+
+Usage:
+    python benchmark_startup.py [size_mb]
+
+Author: Professional Python Developer
+Date: 2026-10-17
+"""
+
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+
+from todo_core import Task, TodoManager
+
+
+def generate_file(path: str, size_mb: int) -> int:
+    """
+    Write a snapshot file of roughly size_mb megabytes.
+
+    Args:
+        path (str): Destination file path
+        size_mb (int): Target size in megabytes
+
+    Returns:
+        int: Number of tasks written
+    """
+    target = size_mb * 1024 * 1024
+    written = 0
+    count = 0
+
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('{\n    "next_id": 1,\n    "tasks": [\n')
+        while written < target:
+            count += 1
+            task = {
+                'id': count,
+                'title': f"Benchmark task number {count} with a longer description",
+                'completed': count % 3 == 0,
+                'created_at': "2026-02-17 20:29:40",
+                'updated_at': "2026-02-17 20:32:16"
+            }
+            text = json.dumps(task, indent=4, ensure_ascii=False)
+            text = ("," if count > 1 else "") + "\n".join("        " + line for line in text.splitlines())
+            f.write(text)
+            written += len(text)
+        f.write('\n    ]\n}')
+
+    return count
+
+
+def peak_memory_mb() -> float:
+    """Return the peak resident set size of this process in megabytes."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and kilobytes elsewhere
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def measure_streaming(path: str) -> dict:
+    """Load with TodoManager's streaming loader."""
+    start = time.perf_counter()
+    first_page = {}
+
+    def on_first_page(tasks):
+        first_page['seconds'] = time.perf_counter() - start
+
+    with open(os.devnull, 'w', encoding='utf-8') as devnull, redirect_stdout(devnull):
+        manager = TodoManager(path, on_first_page=on_first_page)
+
+    return {
+        'first_page': first_page['seconds'],
+        'total': time.perf_counter() - start,
+        'tasks': len(manager.get_all_tasks()),
+        'peak_mb': peak_memory_mb(),
+    }
+
+
+def measure_json_load(path: str) -> dict:
+    """Load the way TodoManager used to: json.load, then build every Task."""
+    start = time.perf_counter()
+
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    tasks = [Task.from_dict(task_data) for task_data in data['tasks']]
+    elapsed = time.perf_counter() - start
+
+    # The first page can only be shown once everything has been built
+    return {
+        'first_page': elapsed,
+        'total': elapsed,
+        'tasks': len(tasks),
+        'peak_mb': peak_memory_mb(),
+    }
+
+
+def run_child(mode: str, path: str) -> dict:
+    """Run one measurement in a fresh interpreter and return its results."""
+    output = subprocess.run([sys.executable, __file__, "--measure", mode, path],
+                            check=True, capture_output=True, text=True).stdout
+    return json.loads(output)
+
+
+def main():
+    """Generate the test file, run both loaders and print a summary."""
+    if len(sys.argv) == 4 and sys.argv[1] == "--measure":
+        measure = measure_streaming if sys.argv[2] == "streaming" else measure_json_load
+        print(json.dumps(measure(sys.argv[3])))
+        return
+
+    size_mb = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+
+    print("=" * 70)
+    print(" " * 20 + "TODO STARTUP BENCHMARK")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "tasks.json")
+        print(f"Generating ~{size_mb} MB task file...")
+        count = generate_file(path, size_mb)
+        print(f"Wrote {count:,} tasks ({os.path.getsize(path) / 1e6:.0f} MB)\n")
+
+        print(f"{'Loader':<20} {'First page (s)':>15} {'Full load (s)':>14} {'Peak RSS (MB)':>14}")
+        print("-" * 70)
+        for label, mode in (("json.load", "json"), ("streaming", "streaming")):
+            result = run_child(mode, path)
+            print(f"{label:<20} {result['first_page']:>15.3f} {result['total']:>14.2f} "
+                  f"{result['peak_mb']:>14.0f}")
+
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""
+To-Do List Application - TodoManager Benchmark
+Times single-task adds and toggles at growing list sizes for each storage
+configuration the apps can run with:
+
+- journal, fsync on: the default backend (open_storage) used by the CLI,
+  GUI and HTTP server
+- journal, fsync off: the journal without durability, for reference
+- SQLite: the SQLiteTodoManager backend (tasks.db)
+- JSON full rewrite (opt-in): the --no-journal configuration
+  (JSONFileStorage), which rewrites and fsyncs the whole file on every
+  change. Its total time grows quadratically, so it only runs with
+  --full-rewrite and has its own, smaller size limit.
+
+Every operation is saved before it returns, exactly as in the apps.
+
+Usage:
+    python benchmark_todo.py [max_tasks] [--full-rewrite MAX]
+
+Author: Professional Python Developer
+Date: 2026-10-17
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from todo_core import TodoManager
+from todo_sqlite import SQLiteTodoManager
+from todo_storage import JournalStorage, JSONFileStorage
+
+
+def journal_manager(path: str) -> TodoManager:
+    """TodoManager on the default storage (journal with fsync)."""
+    return TodoManager(path + ".json", verbose=False)
+
+
+def unsynced_journal_manager(path: str) -> TodoManager:
+    """TodoManager on a journal without fsync."""
+    return TodoManager(path + ".json", storage=JournalStorage(path + ".json", fsync=False),
+                       verbose=False)
+
+
+def sqlite_manager(path: str) -> SQLiteTodoManager:
+    """SQLiteTodoManager on a new database."""
+    return SQLiteTodoManager(path + ".db", verbose=False)
+
+
+def full_rewrite_manager(path: str) -> TodoManager:
+    """TodoManager that rewrites the whole JSON file on every change."""
+    return TodoManager(path + ".json", storage=JSONFileStorage(path + ".json"), verbose=False)
+
+
+# (label, manager factory taking a data file path without extension)
+CONFIGURATIONS = [
+    ("journal, fsync (default)", journal_manager),
+    ("journal, no fsync", unsynced_journal_manager),
+    ("SQLite", sqlite_manager),
+]
+FULL_REWRITE = ("JSON full rewrite", full_rewrite_manager)
+
+
+def run_round(task_count: int, path: str, make_manager):
+    """
+    Add and then toggle task_count tasks in a fresh manager.
+
+    Args:
+        task_count (int): Number of tasks to add and toggle
+        path (str): Data file for this round, without extension
+        make_manager (callable): Opens a silent manager for path
+
+    Returns:
+        tuple: (seconds for all adds, seconds for all toggles)
+    """
+    manager = make_manager(path)
+
+    start = time.perf_counter()
+    for i in range(task_count):
+        manager.add_task(f"Benchmark task {i}")
+    add_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for task_id in range(1, task_count + 1):
+        manager.toggle_task_status(task_id)
+    toggle_seconds = time.perf_counter() - start
+
+    manager.close()
+    return add_seconds, toggle_seconds
+
+
+def main():
+    """Run the benchmark and print a summary table."""
+    parser = argparse.ArgumentParser(description="Time task adds and toggles per storage backend.")
+    parser.add_argument('max_tasks', nargs='?', type=int, default=100_000,
+                        help="largest list size (default: 100000)")
+    parser.add_argument('--full-rewrite', type=int, metavar='MAX',
+                        help="also time the JSON full-rewrite storage, up to MAX tasks "
+                             "(each change rewrites every task; try 2000)")
+    args = parser.parse_args()
+    if args.max_tasks < 4:
+        parser.error("max_tasks must be at least 4")
+    if args.full_rewrite is not None and args.full_rewrite < 4:
+        parser.error("--full-rewrite must be at least 4")
+
+    runs = [(label, make_manager, args.max_tasks) for label, make_manager in CONFIGURATIONS]
+    if args.full_rewrite is not None:
+        runs.append(FULL_REWRITE + (args.full_rewrite,))
+
+    print("=" * 70)
+    print(" " * 20 + "TODO MANAGER BENCHMARK")
+    print("=" * 70)
+    print(f"{'Storage':<26} {'Tasks':>8} {'µs/add':>10} {'µs/toggle':>10} {'Total (s)':>10}")
+    print("-" * 70)
+
+    with tempfile.TemporaryDirectory() as directory:
+        rounds = 0
+        for label, make_manager, max_tasks in runs:
+            for size in (max_tasks // 4, max_tasks // 2, max_tasks):
+                rounds += 1
+                path = os.path.join(directory, str(rounds))
+                add_seconds, toggle_seconds = run_round(size, path, make_manager)
+                print(f"{label:<26} {size:>8} {add_seconds / size * 1e6:>10.1f} "
+                      f"{toggle_seconds / size * 1e6:>10.1f} {add_seconds + toggle_seconds:>10.2f}")
+            print("-" * 70)
+
+    print("Flat µs/op across sizes means total time grows linearly.")
+    if args.full_rewrite is not None:
+        print("The full rewrite grows with the list because every change saves every task.")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+"""
+To-Do List Application - TodoManager Tests
+Covers batch transactions (one save per batch and a full rollback when the
+save fails or the block raises), the running task statistics and
+timestamps of loaded tasks.
+
+Run with:
+    python -m pytest -q
+
+Author: Professional Python Developer
+Date: 2026-10-17
+"""
+
+import pytest
+
+from todo_core import Task, TodoManager
+from todo_storage import JournalStorage
+
+
+class FailingStorage(JournalStorage):
+    """Journal storage whose commits fail while `failing` is set."""
+
+    def __init__(self, path: str):
+        super().__init__(path, fsync=False)
+        self.failing = False
+        self.commits = 0
+
+    def commit(self, tasks, next_id, changes=None):
+        if self.failing:
+            raise OSError("disk full")
+        self.commits += 1
+        super().commit(tasks, next_id, changes)
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """Manager with three tasks, the second one completed."""
+    path = str(tmp_path / "tasks.json")
+    manager = TodoManager(path, storage=FailingStorage(path), verbose=False)
+    for title in ("Write report", "Call Ram", "Buy milk"):
+        manager.add_task(title)
+    manager.toggle_task_status(2)
+    yield manager
+    manager.close()
+
+
+def state(manager: TodoManager) -> list:
+    """Everything a rollback has to restore."""
+    return ([(task.id, task.title, task.completed, task.updated_at)
+             for task in manager.get_all_tasks()],
+            manager.get_next_id(), manager.get_task_count())
+
+
+def test_batch_saves_once(manager):
+    commits = manager.storage.commits
+    with manager.batch() as result:
+        manager.add_task("Plan trip")
+        manager.set_task_status(1, completed=True)
+        manager.delete_task(3)
+    assert result.success
+    assert manager.storage.commits == commits + 1
+    assert manager.get_task_count() == {'total': 3, 'completed': 2, 'pending': 1}
+
+
+def test_failed_save_rolls_back_the_whole_batch(manager):
+    before = state(manager)
+    revision = manager.revision
+    manager.storage.failing = True
+
+    with manager.batch() as result:
+        manager.add_task("Plan trip")
+        manager.update_task(1, "Write the final report")
+        manager.toggle_task_status(2)
+        manager.delete_task(3)
+
+    assert not result.success
+    assert state(manager) == before
+    assert manager.revision == revision
+
+    # The manager keeps working once saving succeeds again
+    manager.storage.failing = False
+    task = manager.add_task("Plan trip")
+    assert task.id == 4
+    assert manager.get_task_by_id(3).title == "Buy milk"
+
+
+def test_exception_in_block_rolls_back(manager):
+    before = state(manager)
+    commits = manager.storage.commits
+
+    with pytest.raises(RuntimeError):
+        with manager.batch():
+            manager.delete_task(1)
+            manager.add_task("Plan trip")
+            raise RuntimeError("caller gave up")
+
+    assert state(manager) == before
+    assert manager.storage.commits == commits
+
+
+def test_single_operation_reports_failed_save(manager):
+    before = state(manager)
+    manager.storage.failing = True
+    assert manager.add_task("Plan trip") is None
+    assert not manager.delete_task(1)
+    assert state(manager) == before
+
+
+def test_loaded_timestamps_are_stored_as_epoch_seconds(tmp_path):
+    data = {'id': 1, 'title': "Write report", 'completed': False,
+            'created_at': "2026-10-17 09:00:00", 'updated_at': "2026-10-17 09:30:15"}
+    task = Task.from_dict(data)
+    assert type(task._created) is int and type(task._updated) is int
+    assert task.updated_ts - task.created_ts == 1815
+    assert task.to_dict() == data
+
+    # The same holds for tasks read back from a task file
+    path = str(tmp_path / "tasks.json")
+    manager = TodoManager(path, storage=JournalStorage(path, fsync=False), verbose=False)
+    manager.add_task("Write report")
+    manager.close()
+    reopened = TodoManager(path, storage=JournalStorage(path, fsync=False), verbose=False)
+    task = reopened.get_task_by_id(1)
+    assert type(task._created) is int and type(task._updated) is int
+    reopened.close()
+
+
+def recount(manager: TodoManager) -> tuple:
+    """Statistics computed from scratch, to compare with the running ones."""
+    tasks = manager.get_all_tasks()
+    completed = [task for task in tasks if task.completed]
+    days = {}
+    for task in completed:
+        days[task.updated_at[:10]] = days.get(task.updated_at[:10], 0) + 1
+    counts = {'total': len(tasks), 'completed': len(completed),
+              'pending': len(tasks) - len(completed)}
+    return counts, dict(sorted(days.items()))
+
+
+def test_running_statistics_follow_every_change(manager):
+    # Build the histogram first so that it is maintained incrementally
+    manager.get_completion_history()
+
+    steps = [
+        lambda: manager.add_tasks(["Plan trip", "", "Pay rent"]),
+        lambda: manager.set_status_many([1, 4, 5, 99], completed=True),
+        lambda: manager.toggle_task_status(4),
+        lambda: manager.set_task_status(2, completed=True),  # Already completed
+        lambda: manager.delete_many([3, 5]),
+        lambda: manager.update_task(1, "Write the final report"),
+        lambda: manager.clear_completed_tasks(),
+        lambda: manager.toggle_task_status(4),
+    ]
+    for step in steps:
+        step()
+        assert (manager.get_task_count(), manager.get_completion_history()) == recount(manager)
+
+    # Failed saves roll the counters back with the tasks
+    manager.storage.failing = True
+    with manager.batch() as result:
+        manager.add_task("Never saved")
+        manager.toggle_task_status(4)
+        manager.delete_task(4)
+    assert not result.success
+    assert (manager.get_task_count(), manager.get_completion_history()) == recount(manager)
+
+
+def test_statistics_of_a_loaded_file(manager):
+    manager.set_status_many([1, 3], completed=True)
+    path = manager.data_file
+    manager.close()
+
+    reopened = TodoManager(path, storage=FailingStorage(path), verbose=False)
+    assert reopened.get_task_count() == {'total': 3, 'completed': 3, 'pending': 0}
+    assert (reopened.get_task_count(), reopened.get_completion_history()) == recount(reopened)
+    reopened.close()
@@ -0,0 +1,110 @@
+"""
+To-Do List Application - HTTP API Tests
+Covers ETag revalidation (304 Not Modified), ETags across server restarts
+and rejection of malformed requests.
+
+Run with:
+    python -m pytest -q
+
+Author: Professional Python Developer
+Date: 2026-10-17
+"""
+
+import http.client
+import json
+import threading
+
+import pytest
+
+from todo_core import TodoManager
+from todo_server import TodoServer
+from todo_storage import JournalStorage
+
+
+def start_server(path: str) -> TodoServer:
+    """Serve a task file on a free port in a background thread."""
+    manager = TodoManager(path, storage=JournalStorage(path, fsync=False), verbose=False)
+    server = TodoServer(('127.0.0.1', 0), manager, quiet=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def stop_server(server: TodoServer):
+    server.shutdown()
+    server.server_close()
+    server.manager.close()
+
+
+@pytest.fixture
+def server(tmp_path):
+    server = start_server(str(tmp_path / "tasks.json"))
+    yield server
+    stop_server(server)
+
+
+def request(server, method: str, path: str, body=None, headers=None):
+    """Send one request; returns (status, headers, decoded JSON or None)."""
+    connection = http.client.HTTPConnection(*server.server_address[:2], timeout=10)
+    try:
+        data = json.dumps(body) if body is not None else None
+        connection.request(method, path, body=data, headers=headers or {})
+        response = connection.getresponse()
+        payload = response.read()
+        return response.status, response.headers, json.loads(payload) if payload else None
+    finally:
+        connection.close()
+
+
+def test_unchanged_list_revalidates_with_304(server):
+    request(server, 'POST', '/tasks', {'title': "Write report"})
+    status, headers, payload = request(server, 'GET', '/tasks')
+    assert status == 200
+    etag = headers['ETag']
+
+    status, headers, payload = request(server, 'GET', '/tasks', headers={'If-None-Match': etag})
+    assert status == 304
+    assert payload is None
+    assert headers['ETag'] == etag
+
+
+def test_change_invalidates_etag(server):
+    _, headers, _ = request(server, 'GET', '/tasks')
+    etag = headers['ETag']
+
+    request(server, 'POST', '/tasks', {'title': "Call Ram"})
+    status, headers, payload = request(server, 'GET', '/tasks', headers={'If-None-Match': etag})
+    assert status == 200
+    assert headers['ETag'] != etag
+    assert [task['title'] for task in payload['tasks']] == ["Call Ram"]
+
+
+def test_etag_from_earlier_server_process_never_matches(tmp_path):
+    path = str(tmp_path / "tasks.json")
+    first = start_server(path)
+    request(first, 'POST', '/tasks', {'title': "Write report"})
+    _, headers, _ = request(first, 'GET', '/tasks')
+    etag = headers['ETag']
+    stop_server(first)
+
+    # Same revision after a reload, but a different task list is possible
+    second = start_server(path)
+    try:
+        status, headers, _ = request(second, 'GET', '/tasks', headers={'If-None-Match': etag})
+        assert status == 200
+        assert headers['ETag'] != etag
+    finally:
+        stop_server(second)
+
+
+@pytest.mark.parametrize('length', ['abc', '-5'])
+def test_bad_content_length_is_a_client_error(server, length):
+    connection = http.client.HTTPConnection(*server.server_address[:2], timeout=10)
+    try:
+        connection.putrequest('POST', '/tasks')
+        connection.putheader('Content-Length', length)
+        connection.endheaders()
+        response = connection.getresponse()
+        assert response.status == 400
+        assert 'Content-Length' in json.loads(response.read())['error']
+    finally:
+        connection.close()
@@ -0,0 +1,84 @@
+"""
+To-Do List Application - SQLite Backend Tests
+Covers status messages, the revision counter, paging and migrating a
+task file into a database.
+
+Run with:
+    python -m pytest -q
+
+Author: Professional Python Developer
+Date: 2026-10-17
+"""
+
+from todo_core import TodoManager
+from todo_sqlite import SQLiteTodoManager, migrate_json_to_sqlite
+from todo_storage import JournalStorage
+
+
+def test_verbose_manager_prints_status_messages(tmp_path, capsys):
+    manager = SQLiteTodoManager(str(tmp_path / "tasks.db"))
+    assert "Loaded 0 tasks" in capsys.readouterr().out
+
+    task = manager.add_task("Write report")
+    assert f"Task added successfully! (ID: {task.id})" in capsys.readouterr().out
+    assert not manager.delete_task(99)
+    assert "Task with ID 99 not found" in capsys.readouterr().out
+    manager.close()
+
+
+def test_silent_manager_prints_nothing(tmp_path, capsys):
+    manager = SQLiteTodoManager(str(tmp_path / "tasks.db"), verbose=False)
+    manager.add_task("Write report")
+    manager.delete_task(99)
+    manager.close()
+    assert capsys.readouterr().out == ""
+
+
+def test_revision_changes_only_with_tasks(tmp_path):
+    manager = SQLiteTodoManager(str(tmp_path / "tasks.db"), verbose=False)
+    revision = manager.revision
+    manager.get_all_tasks()
+    manager.delete_task(99)
+    assert manager.revision == revision
+
+    manager.add_task("Write report")
+    assert manager.revision > revision
+    manager.close()
+
+
+def test_pages_follow_insertion_order(tmp_path):
+    manager = SQLiteTodoManager(str(tmp_path / "tasks.db"), verbose=False)
+    manager.add_tasks([f"Task {i}" for i in range(10)])
+    manager.set_status_many([2, 4, 6], completed=True)
+
+    tasks, total = manager.get_tasks_page(offset=3, limit=4)
+    assert total == 10
+    assert [task.id for task in tasks] == [4, 5, 6, 7]
+
+    tasks, total = manager.get_tasks_page(offset=1, limit=10, completed=True)
+    assert total == 3
+    assert [task.id for task in tasks] == [4, 6]
+    manager.close()
+
+
+def test_migration_keeps_ids_timestamps_and_counter(tmp_path):
+    source = str(tmp_path / "tasks.json")
+    manager = TodoManager(source, storage=JournalStorage(source, fsync=False), verbose=False)
+    for title in ("Write report", "Call Ram", "Buy milk"):
+        manager.add_task(title)
+    manager.toggle_task_status(2)
+    manager.delete_task(3)
+    expected = [(task.id, task.title, task.completed, task.created_ts, task.updated_ts)
+                for task in manager.get_all_tasks()]
+    manager.close()
+
+    target = str(tmp_path / "tasks.db")
+    assert migrate_json_to_sqlite(source, target) == 2
+    migrated = SQLiteTodoManager(target, verbose=False)
+    assert [(task.id, task.title, task.completed, task.created_ts, task.updated_ts)
+            for task in migrated.get_all_tasks()] == expected
+    assert migrated.get_next_id() == 4
+    migrated.close()
+
+    # A second migration into the same database is refused
+    assert migrate_json_to_sqlite(source, target) == -1
@@ -0,0 +1,206 @@
+"""
+To-Do List Application - Storage Tests
+Covers journal replay, recovery from a torn final record, damaged records
+in the middle of the journal, the backend open_storage picks, converting
+between the JSON and binary formats and the streaming snapshot reader.
+
+Run with:
+    python -m pytest -q
+
+Author: Professional Python Developer
+Date: 2026-10-17
+"""
+
+import json
+
+import pytest
+
+from todo_core import TodoManager
+from todo_storage import (BinarySnapshotStorage, JournalStorage, JSONFileStorage,
+                          SnapshotReader, convert_snapshot, open_storage)
+
+
+def make_manager(path, **kwargs) -> TodoManager:
+    """Open a silent TodoManager on a journal without fsync (faster tests)."""
+    return TodoManager(str(path), storage=JournalStorage(str(path), fsync=False, **kwargs),
+                       verbose=False)
+
+
+def put_record(task_id: int, title: str) -> bytes:
+    """Encode a journal put record for a pending task."""
+    task = {'id': task_id, 'title': title, 'completed': False,
+            'created_at': '2026-10-17 09:00:00', 'updated_at': '2026-10-17 09:00:00'}
+    return (json.dumps({'op': 'put', 'task': task}) + "\n").encode('utf-8')
+
+
+def titles(manager: TodoManager) -> list:
+    """Titles of all tasks, in ID order."""
+    return [task.title for task in manager.get_all_tasks()]
+
+
+def test_journal_replays_changes(tmp_path):
+    path = tmp_path / "tasks.json"
+    manager = make_manager(path)
+    manager.add_task("Write report")
+    manager.add_task("Call Ram")
+    manager.add_task("Buy milk")
+    manager.toggle_task_status(2)
+    manager.update_task(3, "Buy oat milk")
+    manager.delete_task(1)
+    manager.close()
+
+    reopened = make_manager(path)
+    assert titles(reopened) == ["Call Ram", "Buy oat milk"]
+    assert reopened.get_task_by_id(2).completed
+    # Deleted IDs are never handed out again
+    assert reopened.get_next_id() == 4
+    reopened.close()
+
+
+def test_compaction_keeps_every_task(tmp_path):
+    path = tmp_path / "tasks.json"
+    manager = make_manager(path, compact_threshold=5)
+    for i in range(12):
+        manager.add_task(f"Task {i}")
+    manager.delete_task(4)
+    manager.close()
+
+    reopened = make_manager(path)
+    assert titles(reopened) == [f"Task {i}" for i in range(12) if i != 3]
+    reopened.close()
+
+
+def test_torn_final_record_is_discarded_and_cut_off(tmp_path):
+    path = tmp_path / "tasks.json"
+    manager = make_manager(path)
+    manager.add_task("Write report")
+    manager.close()
+
+    journal = tmp_path / "tasks.json.journal"
+    intact_size = journal.stat().st_size
+    with open(journal, 'ab') as f:
+        f.write(put_record(2, "Half written")[:30])  # Crash in the middle of an append
+
+    reopened = make_manager(path)
+    assert titles(reopened) == ["Write report"]
+    assert journal.stat().st_size == intact_size
+
+    # New appends start on a clean line and survive the next load
+    reopened.add_task("After the crash")
+    reopened.close()
+    assert titles(make_manager(path)) == ["Write report", "After the crash"]
+
+
+def test_damaged_record_mid_journal_keeps_later_records(tmp_path, capsys):
+    path = tmp_path / "tasks.json"
+    manager = make_manager(path)
+    manager.add_task("Write report")
+    manager.close()
+
+    journal = tmp_path / "tasks.json.journal"
+    with open(journal, 'ab') as f:
+        f.write(b'{"op": "put", "task": {"id": "x"}}\n')
+        f.write(b'not json at all\n')
+        f.write(put_record(2, "Call Ram"))
+    size = journal.stat().st_size
+
+    reopened = make_manager(path)
+    assert titles(reopened) == ["Write report", "Call Ram"]
+    # Damaged records are reported and left on disk, never truncated away
+    assert "Skipped 2 damaged record(s)" in capsys.readouterr().out
+    assert journal.stat().st_size == size
+    reopened.close()
+
+
+def test_open_storage_picks_the_backend(tmp_path):
+    assert isinstance(open_storage(str(tmp_path / "tasks.json")), JournalStorage)
+    assert isinstance(open_storage(str(tmp_path / "tasks.json"), journal=False), JSONFileStorage)
+    assert isinstance(open_storage(str(tmp_path / "tasks.bin")), BinarySnapshotStorage)
+
+
+def test_convert_round_trip_keeps_every_task(tmp_path):
+    path = tmp_path / "tasks.json"
+    manager = make_manager(path)
+    for title in ("Write report", "Call Ram", "Buy milk"):
+        manager.add_task(title)
+    manager.toggle_task_status(2)
+    manager.delete_task(3)
+    expected = [(task.id, task.title, task.completed, task.created_ts, task.updated_ts)
+                for task in manager.get_all_tasks()]
+    manager.close()
+
+    binary = tmp_path / "tasks.bin"
+    back = tmp_path / "copy.json"
+    assert convert_snapshot(str(path), str(binary)) == 2
+    assert binary.exists()
+    assert convert_snapshot(str(binary), str(back)) == 2
+    # Written as a plain JSON snapshot, with no journal next to it
+    assert back.exists()
+    assert not (tmp_path / "copy.json.journal").exists()
+
+    for converted in (binary, back):
+        reopened = TodoManager(str(converted), storage=open_storage(str(converted)),
+                               verbose=False)
+        assert [(task.id, task.title, task.completed, task.created_ts, task.updated_ts)
+                for task in reopened.get_all_tasks()] == expected
+        assert reopened.get_next_id() == 4
+        reopened.close()
+
+
+def snapshot_tasks(count: int) -> list:
+    """Task dicts with escapes and non-ASCII text in the titles."""
+    return [{'id': i * 2, 'title': f"Task \"{i}\" – café {'x' * (i % 50)}",
+             'completed': i % 3 == 0, 'created_at': '2026-10-17 09:00:00',
+             'updated_at': '2026-10-17 09:00:00'} for i in range(1, count + 1)]
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 1 << 16])
+def test_snapshot_reader_matches_json_load(tmp_path, chunk_size):
+    path = tmp_path / "tasks.json"
+    tasks = snapshot_tasks(200)
+    path.write_text(json.dumps({'next_id': 999, 'tasks': tasks}, indent=4, ensure_ascii=False),
+                    encoding='utf-8')
+
+    reader = SnapshotReader(str(path), chunk_size=chunk_size)
+    assert list(reader) == tasks
+    assert reader.next_id == 999
+
+
+def test_snapshot_reader_reads_bare_lists(tmp_path):
+    path = tmp_path / "tasks.json"
+    tasks = snapshot_tasks(5)
+    path.write_text(json.dumps(tasks), encoding='utf-8')
+
+    reader = SnapshotReader(str(path), chunk_size=16)
+    assert list(reader) == tasks
+    # Old files have no counter: continue after the highest ID
+    assert reader.next_id == 11
+
+
+@pytest.mark.parametrize('text', ['', '[{"id": 1}', '{"tasks": [] ]', '[] []', '"tasks"'])
+def test_snapshot_reader_rejects_malformed_files(tmp_path, text):
+    path = tmp_path / "tasks.json"
+    path.write_text(text, encoding='utf-8')
+    with pytest.raises(json.JSONDecodeError):
+        list(SnapshotReader(str(path), chunk_size=4))
+
+
+def test_on_first_page_gets_the_first_tasks(tmp_path):
+    path = tmp_path / "tasks.json"
+    path.write_text(json.dumps({'next_id': 401, 'tasks': snapshot_tasks(200)}), encoding='utf-8')
+    pages = []
+
+    def on_first_page(tasks):
+        pages.append([task.id for task in tasks])
+
+    storage = JSONFileStorage(str(path))
+    manager = TodoManager(str(path), storage=storage, on_first_page=on_first_page,
+                          page_size=20, verbose=False)
+    assert pages == [list(range(2, 41, 2))]
+    assert manager.get_task_count()['total'] == 200
+
+    # With fewer tasks than a page the callback gets all of them
+    pages.clear()
+    TodoManager(str(path), storage=storage, on_first_page=on_first_page,
+                page_size=500, verbose=False)
+    assert len(pages) == 1 and len(pages[0]) == 200
@@ -24,9 +24,21 @@ class TodoCLI:
         print("=" * 60)
         print()
         
-        self.manager = TodoManager()
+        # Large task files take a while to load; show the first tasks
+        # as soon as they have been read
+        self.manager = TodoManager(on_first_page=self.show_first_page)
         self.running = True
     
+    def show_first_page(self, tasks):
+        """
+        Display the first page of tasks while the rest are still loading.
+        
+        Args:
+            tasks (list): The first Task objects read from storage
+        """
+        if tasks:
+            self.display_tasks(tasks, "First Tasks")
+    
     def clear_screen(self):
         """Clear the console screen (works on both Windows and Unix)."""
         import os
@@ -131,14 +143,12 @@ class TodoCLI:
     
     def view_pending_tasks(self):
         """Display only pending tasks."""
-        all_tasks = self.manager.get_all_tasks()
-        pending_tasks = [task for task in all_tasks if not task.completed]
+        pending_tasks = self.manager.get_pending_tasks()
         self.display_tasks(pending_tasks, "Pending Tasks")
     
     def view_completed_tasks(self):
         """Display only completed tasks."""
-        all_tasks = self.manager.get_all_tasks()
-        completed_tasks = [task for task in all_tasks if task.completed]
+        completed_tasks = self.manager.get_completed_tasks()
         self.display_tasks(completed_tasks, "Completed Tasks")
     
     def update_task(self):
@@ -330,6 +340,7 @@ class TodoCLI:
         print(" " * 15 + "TO-DO LIST APPLICATION!")
         print("=" * 60)
         print()
+        self.manager.close()
         self.running = False
 
 
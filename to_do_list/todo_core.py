@@ -1,31 +1,101 @@
-
-
 import json
-import os
+import time
+from contextlib import contextmanager
 from datetime import datetime
-from typing import List, Dict, Optional
+from functools import lru_cache
+from itertools import islice
+from typing import Callable, Iterable, Iterator, List, Dict, Optional, Tuple, Union
+
+from todo_storage import TaskStorage, open_storage
+
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Timestamps are epoch seconds (int) or "YYYY-MM-DD HH:MM:SS" strings
+Timestamp = Union[int, str]
+
+
+def current_timestamp() -> int:
+    """Return the current time as integer epoch seconds."""
+    return int(time.time())
+
+
+def parse_timestamp(value: Timestamp) -> int:
+    """Convert a timestamp string (local time) to integer epoch seconds."""
+    if isinstance(value, int):
+        return value
+    return int(datetime.fromisoformat(value).timestamp())
+
+
+def format_timestamp(value: Timestamp) -> str:
+    """Convert integer epoch seconds to a "YYYY-MM-DD HH:MM:SS" string."""
+    if isinstance(value, str):
+        return value
+    return _format_epoch(value)
+
+
+@lru_cache(maxsize=4096)
+def _format_epoch(value: int) -> str:
+    """Format epoch seconds; cached because bulk changes share timestamps."""
+    return datetime.fromtimestamp(value).strftime(TIMESTAMP_FORMAT)
 
 
 class Task:
     """
     Represents a single task in the to-do list.
     
+    Tasks use __slots__ and keep timestamps as integer epoch seconds, so
+    large task lists stay compact. Timestamp strings (as read from a
+    file) are parsed when they are assigned; the string forms are
+    produced on access for display and serialization.
+    
     Attributes:
         id (int): Unique identifier for the task
         title (str): Task title/description
         completed (bool): Task completion status
         created_at (str): Timestamp when task was created
         updated_at (str): Timestamp when task was last updated
+        created_ts (int): Creation time in epoch seconds
+        updated_ts (int): Last update time in epoch seconds
     """
     
+    __slots__ = ('id', 'title', 'completed', '_created', '_updated')
+    
     def __init__(self, id: int, title: str, completed: bool = False, 
-                 created_at: str = None, updated_at: str = None):
+                 created_at: Timestamp = None, updated_at: Timestamp = None):
         """Initialize a new task."""
         self.id = id
         self.title = title
         self.completed = completed
-        self.created_at = created_at or datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        self.updated_at = updated_at or self.created_at
+        self._created = parse_timestamp(created_at) if created_at else current_timestamp()
+        self._updated = parse_timestamp(updated_at) if updated_at else self._created
+    
+    @property
+    def created_at(self) -> str:
+        """Creation timestamp formatted for display."""
+        return format_timestamp(self._created)
+    
+    @created_at.setter
+    def created_at(self, value: Timestamp) -> None:
+        self._created = parse_timestamp(value)
+    
+    @property
+    def updated_at(self) -> str:
+        """Last update timestamp formatted for display."""
+        return format_timestamp(self._updated)
+    
+    @updated_at.setter
+    def updated_at(self, value: Timestamp) -> None:
+        self._updated = parse_timestamp(value)
+    
+    @property
+    def created_ts(self) -> int:
+        """Creation time in epoch seconds."""
+        return self._created
+    
+    @property
+    def updated_ts(self) -> int:
+        """Last update time in epoch seconds."""
+        return self._updated
     
     def to_dict(self) -> Dict:
         """Convert task to dictionary for JSON serialization."""
@@ -54,6 +124,20 @@ class Task:
         return f"[{status}] {self.id}. {self.title}"
 
 
+class BatchResult:
+    """
+    Outcome of a TodoManager.batch() transaction.
+    
+    Attributes:
+        success (bool): False if the changes could not be saved and were
+            rolled back
+    """
+    
+    def __init__(self):
+        """Initialize a result for a transaction that has not failed."""
+        self.success = True
+
+
 class TodoManager:
     """
     Manages all task operations including CRUD operations and persistence.
@@ -64,59 +148,280 @@ class TodoManager:
     - Updating existing tasks
     - Marking tasks as completed/pending
     - Deleting tasks
-    - Saving and loading tasks from JSON file
+    - Bulk operations and transactions that are saved once
+    - Saving and loading tasks through a pluggable storage backend
     """
     
-    def __init__(self, data_file: str = "tasks.json"):
+    def __init__(self, data_file: str = "tasks.json", storage: Optional[TaskStorage] = None,
+                 on_first_page: Optional[Callable[[List[Task]], None]] = None,
+                 page_size: int = 20, verbose: bool = True):
         """
         Initialize the TodoManager.
         
         Args:
-            data_file (str): Path to the JSON file for storing tasks
+            data_file (str): Path to the file for storing tasks (JSON, or a
+                binary snapshot if it ends in .bin)
+            storage (TaskStorage): Storage backend to use. Defaults to the
+                backend open_storage picks for data_file (an append-only
+                journal next to JSON files).
+            on_first_page (callable): Called with the first page of tasks
+                as soon as it has been loaded (see load_tasks)
+            page_size (int): Number of tasks in the first page
+            verbose (bool): Print status messages; False keeps the manager
+                silent (results are still reported through return values)
         """
         self.data_file = data_file
-        self.tasks: List[Task] = []
-        self.load_tasks()
+        self.verbose = verbose
+        self.storage = storage or open_storage(data_file)
+        self._tasks: Dict[int, Task] = {}  # Tasks by ID, in insertion order
+        self._next_id = 1
+        
+        # Running statistics, updated whenever a batch is committed
+        self._completed_count = 0
+        self._completion_days: Optional[Dict[str, int]] = None  # Built on first use
+        self._revision = 0  # Bumped by every load and committed change
+        # After a failed load the next save replaces the stored data
+        # instead of appending changes to it
+        self._full_save_pending = False
+        
+        # Transaction state: task ID -> (task, saved fields) while a batch is open
+        self._undo: Optional[Dict[int, tuple]] = None
+        self._undo_next_id = 1
+        self._batch_result: Optional[BatchResult] = None
+        
+        self.load_tasks(on_first_page, page_size)
     
-    def load_tasks(self) -> None:
-        """Load tasks from JSON file. Creates empty file if it doesn't exist."""
+    def _log(self, message: str) -> None:
+        """Print a status message unless the manager is silent."""
+        if self.verbose:
+            print(message)
+    
+    @property
+    def tasks(self) -> List[Task]:
+        """List of all tasks in insertion order."""
+        return list(self._tasks.values())
+    
+    @property
+    def revision(self) -> int:
+        """
+        Change counter for caches and ETags.
+        
+        It increases whenever tasks are loaded or a batch that changed
+        tasks is committed, and never otherwise.
+        """
+        return self._revision
+    
+    def load_tasks(self, on_first_page: Optional[Callable[[List[Task]], None]] = None,
+                   page_size: int = 20) -> None:
+        """
+        Load tasks from storage. Creates empty file if it doesn't exist.
+        
+        Tasks are streamed from storage, so on_first_page can display the
+        first tasks while the rest of a large file is still being parsed.
+        
+        Args:
+            on_first_page (callable): Called once with the first page_size
+                tasks (or all tasks, if there are fewer)
+            page_size (int): Number of tasks in the first page
+        """
         try:
-            if os.path.exists(self.data_file):
-                with open(self.data_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    self.tasks = [Task.from_dict(task_data) for task_data in data]
-                print(f"✓ Loaded {len(self.tasks)} tasks from {self.data_file}")
+            if self.storage.exists():
+                reader = self.storage.open_reader()
+                self._reset()
+                for task_data in reader:
+                    task = Task.from_dict(task_data)
+                    self._tasks[task.id] = task
+                    if task.completed:
+                        self._completed_count += 1
+                    if on_first_page and len(self._tasks) == page_size:
+                        on_first_page(list(self._tasks.values()))
+                        on_first_page = None
+                self._next_id = reader.next_id
+                if on_first_page:
+                    on_first_page(list(self._tasks.values()))
+                self._log(f"✓ Loaded {len(self._tasks)} tasks from {self.data_file}")
             else:
-                self.tasks = []
+                self._reset()
                 self.save_tasks()  # Create empty file
-                print(f"✓ Created new task file: {self.data_file}")
+                self._log(f"✓ Created new task file: {self.data_file}")
         except json.JSONDecodeError:
-            print(f"⚠ Warning: Could not parse {self.data_file}. Starting with empty task list.")
-            self.tasks = []
+            self._log(f"⚠ Warning: Could not parse {self.data_file}. Starting with empty task list.")
+            self._reset()
+            self._full_save_pending = True
         except Exception as e:
-            print(f"⚠ Error loading tasks: {e}")
-            self.tasks = []
+            self._log(f"⚠ Error loading tasks: {e}")
+            self._reset()
+            self._full_save_pending = True
+    
+    def _reset(self) -> None:
+        """Clear all in-memory tasks and restart the ID counter."""
+        self._tasks = {}
+        self._next_id = 1
+        self._completed_count = 0
+        self._completion_days = None
+        self._revision += 1
     
     def save_tasks(self) -> bool:
         """
-        Save all tasks to JSON file.
+        Save all tasks to storage.
+        
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        return self._persist(None)
+    
+    def _persist(self, changes: Optional[List] = None) -> bool:
+        """
+        Hand changes to the storage backend.
         
+        Args:
+            changes (list): ('put', task_dict) / ('delete', task_id) tuples,
+                or None to persist the full task list
+            
         Returns:
             bool: True if successful, False otherwise
         """
+        if self._full_save_pending:
+            changes = None
         try:
-            with open(self.data_file, 'w', encoding='utf-8') as f:
-                json.dump([task.to_dict() for task in self.tasks], f, indent=4, ensure_ascii=False)
+            self.storage.commit(self._tasks.values(), self._next_id, changes)
+            self._full_save_pending = False
             return True
         except Exception as e:
-            print(f"✗ Error saving tasks: {e}")
+            self._log(f"✗ Error saving tasks: {e}")
             return False
     
+    def close(self) -> None:
+        """Flush pending background work and release the storage backend."""
+        self.storage.close()
+    
+    @contextmanager
+    def batch(self) -> Iterator[BatchResult]:
+        """
+        Group several changes into one transaction.
+        
+        Changes made inside the block are applied in memory and persisted
+        with a single save when the block exits. If that save fails, or the
+        block raises, every change is rolled back. Nested batches join the
+        outermost one.
+        
+        Example:
+            with manager.batch() as result:
+                manager.add_task("Write report")
+                manager.set_task_status(3, completed=True)
+            if not result.success:
+                ...
+        
+        Yields:
+            BatchResult: Outcome of the transaction, filled in on exit
+        """
+        if self._undo is not None:
+            yield self._batch_result
+            return
+        
+        self._undo = {}
+        self._undo_next_id = self._next_id
+        self._batch_result = BatchResult()
+        try:
+            yield self._batch_result
+        except BaseException:
+            self._rollback()
+            raise
+        else:
+            if self._persist(self._collect_changes()):
+                self._update_statistics()
+            else:
+                self._rollback()
+                self._batch_result.success = False
+        finally:
+            self._undo = None
+    
+    def _track(self, task_id: int) -> None:
+        """
+        Remember a task's state before its first change in the current batch.
+        
+        Args:
+            task_id (int): ID of the task about to change
+        """
+        if task_id in self._undo:
+            return
+        task = self._tasks.get(task_id)
+        state = (task.title, task.completed, task.updated_ts) if task else None
+        self._undo[task_id] = (task, state)
+    
+    def _collect_changes(self) -> List:
+        """Build the storage changes for every task touched in the current batch."""
+        changes = []
+        for task_id, (original, _) in self._undo.items():
+            task = self._tasks.get(task_id)
+            if task is not None:
+                changes.append(('put', task.to_dict()))
+            elif original is not None:
+                changes.append(('delete', task_id))
+        return changes
+    
+    def _update_statistics(self) -> None:
+        """Apply the committed batch to the running counters."""
+        if self._undo:
+            self._revision += 1
+        for task_id, (original, state) in self._undo.items():
+            if original is not None and state[1]:
+                self._count_completion(state[2], -1)
+            task = self._tasks.get(task_id)
+            if task is not None and task.completed:
+                self._count_completion(task.updated_ts, 1)
+    
+    def _count_completion(self, updated_ts: int, delta: int) -> None:
+        """
+        Add or remove one completed task from the running counters.
+        
+        Args:
+            updated_ts (int): The task's last update time (its completion day)
+            delta (int): +1 to count the task, -1 to uncount it
+        """
+        self._completed_count += delta
+        
+        if self._completion_days is not None:
+            day = format_timestamp(updated_ts)[:10]
+            count = self._completion_days.get(day, 0) + delta
+            if count:
+                self._completion_days[day] = count
+            else:
+                del self._completion_days[day]
+    
+    def _rollback(self) -> None:
+        """Restore every task touched in the current batch."""
+        restored_deleted = False
+        for task_id, (task, state) in self._undo.items():
+            if task is None:
+                self._tasks.pop(task_id, None)
+            else:
+                task.title, task.completed, task.updated_at = state
+                if task_id not in self._tasks:
+                    self._tasks[task_id] = task
+                    restored_deleted = True
+        self._next_id = self._undo_next_id
+        
+        if restored_deleted:
+            # IDs are handed out in insertion order, so sorting restores positions
+            self._tasks = dict(sorted(self._tasks.items()))
+    
     def get_next_id(self) -> int:
-        """Get the next available task ID."""
-        if not self.tasks:
-            return 1
-        return max(task.id for task in self.tasks) + 1
+        """
+        Get the next available task ID.
+        
+        IDs come from a persisted counter, so IDs of deleted tasks are
+        never handed out again.
+        """
+        return self._next_id
+    
+    def _create_task(self, title: str, timestamp: int = None) -> Task:
+        """Create a task with the next ID and add it to the current batch."""
+        task = Task(id=self._next_id, title=title, created_at=timestamp)
+        self._track(task.id)
+        self._tasks[task.id] = task
+        self._next_id += 1
+        return task
     
     def add_task(self, title: str) -> Optional[Task]:
         """
@@ -129,18 +434,48 @@ class TodoManager:
             Task: The created task, or None if failed
         """
         if not title or not title.strip():
-            print("✗ Error: Task title cannot be empty!")
+            self._log("✗ Error: Task title cannot be empty!")
             return None
         
-        task = Task(id=self.get_next_id(), title=title.strip())
-        self.tasks.append(task)
+        with self.batch() as result:
+            task = self._create_task(title.strip())
         
-        if self.save_tasks():
-            print(f"✓ Task added successfully! (ID: {task.id})")
-            return task
-        else:
-            self.tasks.pop()  # Remove from list if save failed
+        if not result.success:
             return None
+        
+        self._log(f"✓ Task added successfully! (ID: {task.id})")
+        return task
+    
+    def add_tasks(self, titles: Iterable[str]) -> List[Task]:
+        """
+        Add several tasks with a single save.
+        
+        Empty titles are skipped.
+        
+        Args:
+            titles (Iterable[str]): Task titles/descriptions
+            
+        Returns:
+            List[Task]: The created tasks, or an empty list if saving failed
+        """
+        timestamp = current_timestamp()
+        skipped = 0
+        
+        with self.batch() as result:
+            created = []
+            for title in titles:
+                if not title or not title.strip():
+                    skipped += 1
+                    continue
+                created.append(self._create_task(title.strip(), timestamp))
+        
+        if not result.success:
+            return []
+        
+        if skipped:
+            self._log(f"⚠ Skipped {skipped} empty title(s).")
+        self._log(f"✓ Added {len(created)} task(s)!")
+        return created
     
     def get_all_tasks(self) -> List[Task]:
         """
@@ -149,7 +484,47 @@ class TodoManager:
         Returns:
             List[Task]: List of all tasks
         """
-        return self.tasks.copy()
+        return list(self._tasks.values())
+    
+    def get_pending_tasks(self) -> List[Task]:
+        """
+        Get all tasks that are not completed.
+        
+        Returns:
+            List[Task]: Pending tasks in insertion order
+        """
+        return [task for task in self._tasks.values() if not task.completed]
+    
+    def get_completed_tasks(self) -> List[Task]:
+        """
+        Get all completed tasks.
+        
+        Returns:
+            List[Task]: Completed tasks in insertion order
+        """
+        return [task for task in self._tasks.values() if task.completed]
+    
+    def get_tasks_page(self, offset: int = 0, limit: int = 50,
+                       completed: Optional[bool] = None) -> Tuple[List[Task], int]:
+        """
+        Get one page of tasks in insertion order.
+        
+        Args:
+            offset (int): Number of matching tasks to skip
+            limit (int): Maximum number of tasks to return
+            completed (bool): Only completed (True) or pending (False)
+                tasks; None for all tasks
+            
+        Returns:
+            tuple: (tasks on the page, total number of matching tasks)
+        """
+        if completed is None:
+            total = len(self._tasks)
+            matching = iter(self._tasks.values())
+        else:
+            total = self._completed_count if completed else len(self._tasks) - self._completed_count
+            matching = (task for task in self._tasks.values() if task.completed == completed)
+        return list(islice(matching, offset, offset + limit)), total
     
     def get_task_by_id(self, task_id: int) -> Optional[Task]:
         """
@@ -161,10 +536,7 @@ class TodoManager:
         Returns:
             Task: The task if found, None otherwise
         """
-        for task in self.tasks:
-            if task.id == task_id:
-                return task
-        return None
+        return self._tasks.get(task_id)
     
     def update_task(self, task_id: int, new_title: str) -> bool:
         """
@@ -178,26 +550,28 @@ class TodoManager:
             bool: True if successful, False otherwise
         """
         if not new_title or not new_title.strip():
-            print("✗ Error: Task title cannot be empty!")
+            self._log("✗ Error: Task title cannot be empty!")
             return False
         
         task = self.get_task_by_id(task_id)
         if not task:
-            print(f"✗ Error: Task with ID {task_id} not found!")
+            self._log(f"✗ Error: Task with ID {task_id} not found!")
             return False
         
         old_title = task.title
-        task.title = new_title.strip()
-        task.updated_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         
-        if self.save_tasks():
-            print(f"✓ Task updated successfully!")
-            print(f"  Old: {old_title}")
-            print(f"  New: {task.title}")
-            return True
-        else:
-            task.title = old_title  # Revert on save failure
+        with self.batch() as result:
+            self._track(task_id)
+            task.title = new_title.strip()
+            task.updated_at = current_timestamp()
+        
+        if not result.success:
             return False
+        
+        self._log(f"✓ Task updated successfully!")
+        self._log(f"  Old: {old_title}")
+        self._log(f"  New: {task.title}")
+        return True
     
     def toggle_task_status(self, task_id: int) -> bool:
         """
@@ -211,19 +585,20 @@ class TodoManager:
         """
         task = self.get_task_by_id(task_id)
         if not task:
-            print(f"✗ Error: Task with ID {task_id} not found!")
+            self._log(f"✗ Error: Task with ID {task_id} not found!")
             return False
         
-        task.completed = not task.completed
-        task.updated_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        with self.batch() as result:
+            self._track(task_id)
+            task.completed = not task.completed
+            task.updated_at = current_timestamp()
         
-        if self.save_tasks():
-            status = "completed" if task.completed else "pending"
-            print(f"✓ Task marked as {status}!")
-            return True
-        else:
-            task.completed = not task.completed  # Revert on save failure
+        if not result.success:
             return False
+        
+        status = "completed" if task.completed else "pending"
+        self._log(f"✓ Task marked as {status}!")
+        return True
     
     def set_task_status(self, task_id: int, completed: bool) -> bool:
         """
@@ -238,24 +613,62 @@ class TodoManager:
         """
         task = self.get_task_by_id(task_id)
         if not task:
-            print(f"✗ Error: Task with ID {task_id} not found!")
+            self._log(f"✗ Error: Task with ID {task_id} not found!")
             return False
         
+        status = "completed" if completed else "pending"
+        
         if task.completed == completed:
-            status = "completed" if completed else "pending"
-            print(f"ℹ Task is already {status}!")
+            self._log(f"ℹ Task is already {status}!")
             return True
         
-        task.completed = completed
-        task.updated_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        with self.batch() as result:
+            self._track(task_id)
+            task.completed = completed
+            task.updated_at = current_timestamp()
         
-        if self.save_tasks():
-            status = "completed" if completed else "pending"
-            print(f"✓ Task marked as {status}!")
-            return True
-        else:
-            task.completed = not completed  # Revert on save failure
+        if not result.success:
             return False
+        
+        self._log(f"✓ Task marked as {status}!")
+        return True
+    
+    def set_status_many(self, task_ids: Iterable[int], completed: bool) -> int:
+        """
+        Set the completion status of several tasks with a single save.
+        
+        Args:
+            task_ids (Iterable[int]): IDs of tasks to update
+            completed (bool): New completion status
+            
+        Returns:
+            int: Number of tasks changed (0 if saving failed)
+        """
+        timestamp = current_timestamp()
+        missing = 0
+        
+        with self.batch() as result:
+            changed = 0
+            for task_id in task_ids:
+                task = self._tasks.get(task_id)
+                if task is None:
+                    missing += 1
+                    continue
+                if task.completed == completed:
+                    continue
+                self._track(task_id)
+                task.completed = completed
+                task.updated_at = timestamp
+                changed += 1
+        
+        if not result.success:
+            return 0
+        
+        if missing:
+            self._log(f"⚠ {missing} task(s) not found!")
+        status = "completed" if completed else "pending"
+        self._log(f"✓ Marked {changed} task(s) as {status}!")
+        return changed
     
     def delete_task(self, task_id: int) -> bool:
         """
@@ -269,27 +682,61 @@ class TodoManager:
         """
         task = self.get_task_by_id(task_id)
         if not task:
-            print(f"✗ Error: Task with ID {task_id} not found!")
+            self._log(f"✗ Error: Task with ID {task_id} not found!")
             return False
         
-        self.tasks.remove(task)
+        with self.batch() as result:
+            self._track(task_id)
+            del self._tasks[task_id]
         
-        if self.save_tasks():
-            print(f"✓ Task deleted successfully!")
-            return True
-        else:
-            self.tasks.append(task)  # Restore on save failure
+        if not result.success:
             return False
+        
+        self._log(f"✓ Task deleted successfully!")
+        return True
+    
+    def delete_many(self, task_ids: Iterable[int]) -> int:
+        """
+        Delete several tasks with a single save.
+        
+        Args:
+            task_ids (Iterable[int]): IDs of tasks to delete
+            
+        Returns:
+            int: Number of tasks deleted (0 if saving failed)
+        """
+        missing = 0
+        
+        with self.batch() as result:
+            deleted = 0
+            for task_id in task_ids:
+                if task_id not in self._tasks:
+                    missing += 1
+                    continue
+                self._track(task_id)
+                del self._tasks[task_id]
+                deleted += 1
+        
+        if not result.success:
+            return 0
+        
+        if missing:
+            self._log(f"⚠ {missing} task(s) not found!")
+        self._log(f"✓ Deleted {deleted} task(s)!")
+        return deleted
     
     def get_task_count(self) -> Dict[str, int]:
         """
         Get task statistics.
         
+        The counts are maintained as tasks change, so this is O(1). Changes
+        inside an open batch are counted once the batch is committed.
+        
         Returns:
             dict: Dictionary with total, completed, and pending counts
         """
-        total = len(self.tasks)
-        completed = sum(1 for task in self.tasks if task.completed)
+        total = len(self._tasks)
+        completed = self._completed_count
         pending = total - completed
         
         return {
@@ -298,6 +745,31 @@ class TodoManager:
             'pending': pending
         }
     
+    def get_completion_history(self) -> Dict[str, int]:
+        """
+        Get the number of completed tasks per completion day.
+        
+        A completed task counts on the day it was last updated. The
+        histogram is built on the first call and kept up to date
+        incrementally afterwards.
+        
+        Returns:
+            dict: "YYYY-MM-DD" -> number of completed tasks, sorted by day
+        """
+        days = self._completion_days
+        if days is None:
+            days = {}
+            for task in self._tasks.values():
+                if task.completed:
+                    day = task.updated_at[:10]
+                    days[day] = days.get(day, 0) + 1
+            
+            # Inside an open batch the tasks already hold uncommitted changes
+            if self._undo is None:
+                self._completion_days = days
+        
+        return dict(sorted(days.items()))
+    
     def clear_completed_tasks(self) -> int:
         """
         Remove all completed tasks.
@@ -305,17 +777,22 @@ class TodoManager:
         Returns:
             int: Number of tasks deleted
         """
-        initial_count = len(self.tasks)
-        self.tasks = [task for task in self.tasks if not task.completed]
-        deleted_count = initial_count - len(self.tasks)
+        removed = [task.id for task in self._tasks.values() if task.completed]
         
-        if deleted_count > 0:
-            self.save_tasks()
-            print(f"✓ Deleted {deleted_count} completed task(s)!")
-        else:
-            print("ℹ No completed tasks to delete!")
+        if not removed:
+            self._log("ℹ No completed tasks to delete!")
+            return 0
+        
+        with self.batch() as result:
+            for task_id in removed:
+                self._track(task_id)
+                del self._tasks[task_id]
+        
+        if not result.success:
+            return 0
         
-        return deleted_count
+        self._log(f"✓ Deleted {len(removed)} completed task(s)!")
+        return len(removed)
 
 
 # Example usage and testing
@@ -6,18 +6,26 @@ Author: Professional Python Developer
 Date: 2026-02-17
 """
 
+import bisect
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
 from todo_core import TodoManager
-from typing import Optional
+from typing import List, Optional
 
 
 class TodoGUI:
     """
     Graphical User Interface for the To-Do List application.
     Provides an intuitive interface with buttons, list display, and input fields.
+    
+    The task list is windowed: the Treeview only holds the rows that fit on
+    screen, and a separate scrollbar moves the window over the filtered
+    task IDs. Changing a single task updates just that task's row.
     """
     
+    ROW_HEIGHT = 30
+    HEADING_HEIGHT = 25
+    
     def __init__(self, root):
         """
         Initialize the GUI application.
@@ -26,7 +34,16 @@ class TodoGUI:
             root: Tkinter root window
         """
         self.root = root
-        self.manager = TodoManager()
+        # Set once all tasks are loaded; until then the list shows the
+        # first page, looked up in first_page, and actions are ignored
+        self.manager: Optional[TodoManager] = None
+        self.first_page = {}
+        
+        # Windowed list state
+        self.visible_ids: List[int] = []   # Filtered task IDs, in ID order
+        self.visible_set = set()
+        self.first_row = 0                 # Index of the top row in visible_ids
+        self.selected_task_id: Optional[int] = None
         
         # Configure root window
         self.root.title("To-Do List Application")
@@ -51,11 +68,12 @@ class TodoGUI:
         # Create UI components
         self.create_widgets()
         
-        # Load and display tasks
-        self.refresh_task_list()
+        # Load tasks; the window shows the first page while the rest load
+        self.manager = TodoManager(on_first_page=self.show_first_page)
+        self.first_page = {}
         
-        # Update statistics
-        self.update_statistics()
+        # Display all tasks and update statistics
+        self.refresh_task_list()
     
     def setup_styles(self):
         """Configure ttk styles for widgets."""
@@ -66,7 +84,7 @@ class TodoGUI:
         style.configure("Treeview",
                        background="white",
                        foreground="black",
-                       rowheight=30,
+                       rowheight=self.ROW_HEIGHT,
                        fieldbackground="white",
                        borderwidth=0)
         
@@ -162,16 +180,16 @@ class TodoGUI:
         list_frame = tk.Frame(main_frame, bg="white", relief=tk.SOLID, borderwidth=1)
         list_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
         
-        # Scrollbar
-        scrollbar = ttk.Scrollbar(list_frame, orient=tk.VERTICAL)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        # Scrollbar (moves the row window, not the Treeview itself)
+        self.scrollbar = ttk.Scrollbar(list_frame, orient=tk.VERTICAL,
+                                       command=self.on_scrollbar)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
         # Treeview for task list
         columns = ("ID", "Title", "Status", "Updated")
         self.task_tree = ttk.Treeview(list_frame,
                                       columns=columns,
                                       show="headings",
-                                      yscrollcommand=scrollbar.set,
                                       selectmode="browse")
         
         # Configure columns
@@ -186,11 +204,25 @@ class TodoGUI:
         self.task_tree.column("Updated", width=150, anchor=tk.CENTER)
         
         self.task_tree.pack(fill=tk.BOTH, expand=True)
-        scrollbar.config(command=self.task_tree.yview)
+        
+        # Row colors
+        self.task_tree.tag_configure("completed", foreground="gray")
+        self.task_tree.tag_configure("pending", foreground="black")
         
         # Double-click to toggle status
         self.task_tree.bind("<Double-1>", lambda e: self.toggle_task_status())
         
+        # Window scrolling and selection tracking
+        self.task_tree.bind("<Configure>", lambda e: self.render_window())
+        self.task_tree.bind("<<TreeviewSelect>>", self.on_tree_select)
+        self.task_tree.bind("<MouseWheel>", self.on_mouse_wheel)
+        self.task_tree.bind("<Button-4>", lambda e: self.scroll_rows(-3))
+        self.task_tree.bind("<Button-5>", lambda e: self.scroll_rows(3))
+        self.task_tree.bind("<Up>", lambda e: self.move_selection(-1))
+        self.task_tree.bind("<Down>", lambda e: self.move_selection(1))
+        self.task_tree.bind("<Prior>", lambda e: self.scroll_rows(-self.window_size()))
+        self.task_tree.bind("<Next>", lambda e: self.scroll_rows(self.window_size()))
+        
         # ===== BUTTON PANEL =====
         button_frame = tk.Frame(main_frame, bg=self.bg_color)
         button_frame.pack(fill=tk.X, pady=(0, 10))
@@ -241,6 +273,27 @@ class TodoGUI:
             self.task_entry.insert(0, "Enter a new task...")
             self.task_entry.config(fg="gray")
     
+    def show_first_page(self, tasks):
+        """
+        Display the first page of tasks while the rest are still loading.
+        
+        Args:
+            tasks (list): The first Task objects read from storage
+        """
+        self.first_page = {task.id: task for task in tasks}
+        self.visible_ids = [task.id for task in tasks if self.matches_filter(task)]
+        self.visible_set = set(self.visible_ids)
+        self.render_window()
+        self.stats_label.config(text=f"Loading tasks... (showing the first {len(tasks)})")
+        # Paint the window now instead of after the full load
+        self.root.update()
+    
+    def find_task(self, task_id: int):
+        """Look up a task, also while the task list is still loading."""
+        if self.manager is None:
+            return self.first_page.get(task_id)
+        return self.manager.get_task_by_id(task_id)
+    
     def get_selected_task_id(self) -> Optional[int]:
         """
         Get the ID of the currently selected task.
@@ -248,49 +301,186 @@ class TodoGUI:
         Returns:
             int: Task ID if a task is selected, None otherwise
         """
-        selection = self.task_tree.selection()
-        if not selection:
+        if self.manager is None:
+            return None
+        
+        # The selected row may be scrolled out of the window, so use the tracked ID
+        if self.selected_task_id not in self.visible_set:
             messagebox.showwarning("No Selection", "Please select a task first!")
             return None
         
-        item = self.task_tree.item(selection[0])
-        return int(item['values'][0])
+        return self.selected_task_id
+    
+    def matches_filter(self, task) -> bool:
+        """Check whether a task belongs in the list under the current filter."""
+        filter_value = self.filter_var.get()
+        if filter_value == "pending":
+            return not task.completed
+        if filter_value == "completed":
+            return task.completed
+        return True
     
     def refresh_task_list(self):
-        """Refresh the task list display based on current filter."""
-        # Clear existing items
-        for item in self.task_tree.get_children():
-            self.task_tree.delete(item)
+        """Rebuild the filtered task list and redraw the visible rows."""
+        if self.manager is None:
+            return
         
         # Get tasks based on filter
-        all_tasks = self.manager.get_all_tasks()
         filter_value = self.filter_var.get()
         
         if filter_value == "pending":
-            tasks = [t for t in all_tasks if not t.completed]
+            tasks = self.manager.get_pending_tasks()
         elif filter_value == "completed":
-            tasks = [t for t in all_tasks if t.completed]
+            tasks = self.manager.get_completed_tasks()
         else:
-            tasks = all_tasks
+            tasks = self.manager.get_all_tasks()
         
-        # Add tasks to treeview
-        for task in tasks:
-            status = "✓ Completed" if task.completed else "⏳ Pending"
-            tag = "completed" if task.completed else "pending"
-            
-            self.task_tree.insert("", tk.END,
-                                 values=(task.id, task.title, status, task.updated_at),
-                                 tags=(tag,))
+        self.visible_ids = [task.id for task in tasks]
+        self.visible_set = set(self.visible_ids)
         
-        # Configure row colors
-        self.task_tree.tag_configure("completed", foreground="gray")
-        self.task_tree.tag_configure("pending", foreground="black")
+        # Existing rows may show stale values, so redraw the window from scratch
+        self.task_tree.delete(*self.task_tree.get_children())
+        self.render_window()
         
         # Update statistics
         self.update_statistics()
     
+    def apply_task_change(self, task_id: int):
+        """
+        Update the list after a single task was added, changed or deleted.
+        
+        Only the affected row is inserted, updated or removed; the rest of
+        the window is left alone.
+        
+        Args:
+            task_id (int): ID of the task that changed
+        """
+        task = self.manager.get_task_by_id(task_id)
+        wanted = task is not None and self.matches_filter(task)
+        present = task_id in self.visible_set
+        
+        if wanted and not present:
+            bisect.insort(self.visible_ids, task_id)
+            self.visible_set.add(task_id)
+        elif present and not wanted:
+            del self.visible_ids[bisect.bisect_left(self.visible_ids, task_id)]
+            self.visible_set.discard(task_id)
+        elif wanted and self.task_tree.exists(str(task_id)):
+            values, tag = self.row_values(task)
+            self.task_tree.item(str(task_id), values=values, tags=(tag,))
+        
+        self.render_window()
+        self.update_statistics()
+    
+    def row_values(self, task):
+        """
+        Build the Treeview values and tag for a task.
+        
+        Returns:
+            tuple: (values tuple, tag name)
+        """
+        status = "✓ Completed" if task.completed else "⏳ Pending"
+        tag = "completed" if task.completed else "pending"
+        return (task.id, task.title, status, task.updated_at), tag
+    
+    def window_size(self) -> int:
+        """Number of rows that fit in the Treeview."""
+        height = self.task_tree.winfo_height() - self.HEADING_HEIGHT
+        return max(1, height // self.ROW_HEIGHT)
+    
+    def render_window(self):
+        """Show the rows of visible_ids that fall inside the current window."""
+        rows = self.window_size()
+        max_first = max(0, len(self.visible_ids) - rows)
+        self.first_row = min(max(0, self.first_row), max_first)
+        
+        window = [str(task_id) for task_id in
+                  self.visible_ids[self.first_row:self.first_row + rows]]
+        wanted = set(window)
+        
+        stale = [iid for iid in self.task_tree.get_children() if iid not in wanted]
+        if stale:
+            self.task_tree.delete(*stale)
+        
+        for index, iid in enumerate(window):
+            if self.task_tree.exists(iid):
+                if self.task_tree.index(iid) != index:
+                    self.task_tree.move(iid, "", index)
+            else:
+                values, tag = self.row_values(self.find_task(int(iid)))
+                self.task_tree.insert("", index, iid=iid, values=values, tags=(tag,))
+        
+        # Keep the selection on its task while it is inside the window
+        selected = str(self.selected_task_id)
+        if selected in wanted and self.task_tree.selection() != (selected,):
+            self.task_tree.selection_set(selected)
+        
+        # Update the scrollbar to reflect the window position
+        total = len(self.visible_ids)
+        if total:
+            self.scrollbar.set(self.first_row / total,
+                               min(1.0, (self.first_row + rows) / total))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+    
+    def scroll_rows(self, delta: int):
+        """Move the window by a number of rows."""
+        self.first_row += delta
+        self.render_window()
+        return "break"
+    
+    def scroll_to_task(self, task_id: int):
+        """Move the window so that a task's row is visible."""
+        if task_id not in self.visible_set:
+            return
+        index = bisect.bisect_left(self.visible_ids, task_id)
+        rows = self.window_size()
+        if index < self.first_row:
+            self.first_row = index
+        elif index >= self.first_row + rows:
+            self.first_row = index - rows + 1
+        self.render_window()
+    
+    def on_scrollbar(self, action, amount, unit=None):
+        """Handle scrollbar drags and clicks."""
+        if action == "moveto":
+            self.first_row = int(float(amount) * len(self.visible_ids))
+            self.render_window()
+        elif action == "scroll":
+            step = self.window_size() if unit == "pages" else 1
+            self.scroll_rows(int(amount) * step)
+    
+    def on_mouse_wheel(self, event):
+        """Scroll the window with the mouse wheel (Windows and macOS)."""
+        delta = event.delta // 120 if abs(event.delta) >= 120 else event.delta
+        return self.scroll_rows(-delta * 3)
+    
+    def on_tree_select(self, event):
+        """Remember the selected task so it survives scrolling."""
+        selection = self.task_tree.selection()
+        if selection:
+            self.selected_task_id = int(selection[0])
+    
+    def move_selection(self, delta: int):
+        """Move the selection up or down, scrolling the window at its edges."""
+        if not self.visible_ids:
+            return "break"
+        
+        if self.selected_task_id in self.visible_set:
+            index = bisect.bisect_left(self.visible_ids, self.selected_task_id) + delta
+        else:
+            index = self.first_row
+        index = min(max(0, index), len(self.visible_ids) - 1)
+        
+        self.selected_task_id = self.visible_ids[index]
+        self.scroll_to_task(self.selected_task_id)
+        self.task_tree.focus(str(self.selected_task_id))
+        return "break"
+    
     def update_statistics(self):
         """Update the statistics display."""
+        if self.manager is None:
+            return
         stats = self.manager.get_task_count()
         self.stats_label.config(
             text=f"Total: {stats['total']} | Completed: {stats['completed']} | Pending: {stats['pending']}"
@@ -298,6 +488,9 @@ class TodoGUI:
     
     def add_task(self):
         """Add a new task from the entry field."""
+        if self.manager is None:
+            return
+        
         title = self.task_entry.get()
         
         # Check if placeholder text
@@ -314,8 +507,9 @@ class TodoGUI:
             self.task_entry.insert(0, "Enter a new task...")
             self.task_entry.config(fg="gray")
             
-            # Refresh display
-            self.refresh_task_list()
+            # Show the new row
+            self.apply_task_change(task.id)
+            self.scroll_to_task(task.id)
             
             # Show success message
             messagebox.showinfo("Success", f"Task added successfully!\nID: {task.id}")
@@ -341,7 +535,7 @@ class TodoGUI:
         
         if new_title and new_title.strip():
             if self.manager.update_task(task_id, new_title):
-                self.refresh_task_list()
+                self.apply_task_change(task_id)
                 messagebox.showinfo("Success", "Task updated successfully!")
     
     def toggle_task_status(self):
@@ -351,7 +545,7 @@ class TodoGUI:
             return
         
         if self.manager.toggle_task_status(task_id):
-            self.refresh_task_list()
+            self.apply_task_change(task_id)
     
     def mark_as_completed(self):
         """Mark the selected task as completed."""
@@ -360,7 +554,7 @@ class TodoGUI:
             return
         
         if self.manager.set_task_status(task_id, completed=True):
-            self.refresh_task_list()
+            self.apply_task_change(task_id)
             messagebox.showinfo("Success", "Task marked as completed!")
     
     def mark_as_pending(self):
@@ -370,7 +564,7 @@ class TodoGUI:
             return
         
         if self.manager.set_task_status(task_id, completed=False):
-            self.refresh_task_list()
+            self.apply_task_change(task_id)
             messagebox.showinfo("Success", "Task marked as pending!")
     
     def delete_task(self):
@@ -392,11 +586,14 @@ class TodoGUI:
         
         if confirm:
             if self.manager.delete_task(task_id):
-                self.refresh_task_list()
+                self.apply_task_change(task_id)
                 messagebox.showinfo("Success", "Task deleted successfully!")
     
     def clear_completed(self):
         """Delete all completed tasks."""
+        if self.manager is None:
+            return
+        
         stats = self.manager.get_task_count()
         
         if stats['completed'] == 0:
@@ -417,6 +614,8 @@ class TodoGUI:
     def run(self):
         """Start the GUI application."""
         self.root.mainloop()
+        # Wait for journal compaction and close the data files
+        self.manager.close()
 
 
 def main():
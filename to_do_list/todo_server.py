@@ -0,0 +1,355 @@
+"""
+To-Do List Application - HTTP JSON API Server
+This module serves a TodoManager over a small REST API using only the
+standard library. Connections are kept alive (HTTP/1.1), list and stats
+responses carry an ETag derived from the manager's change counter (and
+a per-process epoch, since the counter restarts with the server) so
+clients can revalidate with If-None-Match, and task lists are paginated.
+
+Endpoints:
+    GET    /tasks?offset=0&limit=50&status=all|pending|completed
+    POST   /tasks                {"title": "..."}
+    GET    /tasks/<id>
+    PATCH  /tasks/<id>           {"title": "...", "completed": true}
+    POST   /tasks/<id>/toggle
+    DELETE /tasks/<id>
+    GET    /stats
+
+Usage:
+    python todo_server.py [--host 127.0.0.1] [--port 8000] [--data-file tasks.json]
+
+A data file ending in .db is served from SQLite (SQLiteTodoManager).
+
+Author: Professional Python Developer
+Date: 2026-10-17
+"""
+
+import argparse
+import json
+import re
+import secrets
+import threading
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from todo_core import TodoManager
+from todo_sqlite import SQLiteTodoManager
+from todo_storage import open_storage
+
+SQLITE_EXTENSION = '.db'
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 1000
+
+# Largest request body accepted (task titles are short)
+MAX_BODY_BYTES = 64 * 1024
+
+TASK_PATH = re.compile(r'^/tasks/(\d+)(/toggle)?$')
+
+STATUS_FILTERS = {'all': None, 'pending': False, 'completed': True}
+
+
+class ApiError(Exception):
+    """Error reported to the client as a JSON body with an HTTP status."""
+
+    def __init__(self, status: HTTPStatus, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class TodoRequestHandler(BaseHTTPRequestHandler):
+    """
+    Request handler for the to-do API.
+
+    One handler instance serves every request on a keep-alive connection.
+    The manager is not thread-safe, so each request holds the server's
+    lock while it reads or changes tasks.
+    """
+
+    protocol_version = "HTTP/1.1"   # Keep connections open between requests
+    disable_nagle_algorithm = True  # Send small responses without delay
+    server_version = "TodoServer/1.0"
+
+    # ----- Dispatch -----
+
+    def do_GET(self):
+        self.dispatch(self.handle_get)
+
+    def do_POST(self):
+        self.dispatch(self.handle_post)
+
+    def do_PATCH(self):
+        self.dispatch(self.handle_patch)
+
+    def do_DELETE(self):
+        self.dispatch(self.handle_delete)
+
+    def dispatch(self, handler):
+        """Run a method handler and turn its result or error into a response."""
+        url = urlsplit(self.path)
+        try:
+            body = self.read_body()
+            with self.server.lock:
+                status, payload, etag = handler(url.path, parse_qs(url.query), body)
+        except ApiError as e:
+            self.send_json(e.status, {'error': e.message})
+            return
+        except Exception as e:
+            self.send_json(HTTPStatus.INTERNAL_SERVER_ERROR, {'error': str(e)})
+            return
+        self.send_json(status, payload, etag)
+
+    def read_body(self) -> Optional[dict]:
+        """
+        Read the JSON request body (always consumed, to keep the connection usable).
+
+        Returns:
+            dict: Parsed body, or None if the request has no body
+        """
+        try:
+            length = int(self.headers.get('Content-Length') or 0)
+        except ValueError:
+            length = -1
+        if length < 0:
+            # The body's end is unknown, so the connection cannot be reused
+            self.close_connection = True
+            raise ApiError(HTTPStatus.BAD_REQUEST, "Content-Length must be a non-negative integer")
+        if length > MAX_BODY_BYTES:
+            self.close_connection = True
+            raise ApiError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "Request body is too large")
+        if not length:
+            return None
+
+        data = self.rfile.read(length)
+        try:
+            body = json.loads(data)
+        except ValueError:
+            raise ApiError(HTTPStatus.BAD_REQUEST, "Request body must be valid JSON")
+        if not isinstance(body, dict):
+            raise ApiError(HTTPStatus.BAD_REQUEST, "Request body must be a JSON object")
+        return body
+
+    def send_json(self, status: HTTPStatus, payload, etag: Optional[str] = None):
+        """Send a JSON response, or 304 if the client already has this ETag."""
+        if etag is not None and etag in self.if_none_match():
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header('ETag', etag)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        data = b'' if payload is None else json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        if data:
+            self.send_header('Content-Type', 'application/json')
+        if etag is not None:
+            self.send_header('ETag', etag)
+            self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def if_none_match(self) -> list:
+        """Return the entity tags listed in the If-None-Match header."""
+        header = self.headers.get('If-None-Match', '')
+        return [tag.strip() for tag in header.split(',') if tag.strip()]
+
+    def log_message(self, format, *args):
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+    # ----- Endpoints -----
+
+    @property
+    def manager(self) -> TodoManager:
+        return self.server.manager
+
+    def etag(self) -> str:
+        """ETag for the current state of the task list."""
+        return f'"{self.server.epoch}-r{self.manager.revision}"'
+
+    def handle_get(self, path: str, query: dict, body) -> Tuple:
+        if path == '/tasks':
+            return self.list_tasks(query)
+        if path == '/stats':
+            stats = self.manager.get_task_count()
+            stats['revision'] = self.manager.revision
+            return HTTPStatus.OK, stats, self.etag()
+
+        task_id, action = self.parse_task_path(path)
+        if action:
+            raise ApiError(HTTPStatus.METHOD_NOT_ALLOWED, "Use POST to toggle a task")
+        return HTTPStatus.OK, self.find_task(task_id).to_dict(), self.etag()
+
+    def handle_post(self, path: str, query: dict, body) -> Tuple:
+        if path == '/tasks':
+            title = self.field(body, 'title', str)
+            if not title.strip():
+                raise ApiError(HTTPStatus.BAD_REQUEST, "Task title cannot be empty")
+            task = self.manager.add_task(title)
+            if task is None:
+                raise ApiError(HTTPStatus.INTERNAL_SERVER_ERROR, "Could not save the task")
+            return HTTPStatus.CREATED, task.to_dict(), None
+
+        task_id, action = self.parse_task_path(path)
+        if not action:
+            raise ApiError(HTTPStatus.METHOD_NOT_ALLOWED, "Use PATCH to change a task")
+        self.find_task(task_id)
+        if not self.manager.toggle_task_status(task_id):
+            raise ApiError(HTTPStatus.INTERNAL_SERVER_ERROR, "Could not save the task")
+        return HTTPStatus.OK, self.find_task(task_id).to_dict(), None
+
+    def handle_patch(self, path: str, query: dict, body) -> Tuple:
+        task_id, action = self.parse_task_path(path)
+        if action:
+            raise ApiError(HTTPStatus.METHOD_NOT_ALLOWED, "Use POST to toggle a task")
+        if not body or not {'title', 'completed'} & body.keys():
+            raise ApiError(HTTPStatus.BAD_REQUEST, "Send a title and/or completed field")
+
+        self.find_task(task_id)
+        title = self.field(body, 'title', str) if 'title' in body else None
+        completed = self.field(body, 'completed', bool) if 'completed' in body else None
+        if title is not None and not title.strip():
+            raise ApiError(HTTPStatus.BAD_REQUEST, "Task title cannot be empty")
+
+        # Apply both fields in one transaction
+        with self.manager.batch() as result:
+            if title is not None:
+                self.manager.update_task(task_id, title)
+            if completed is not None:
+                self.manager.set_task_status(task_id, completed)
+        if not result.success:
+            raise ApiError(HTTPStatus.INTERNAL_SERVER_ERROR, "Could not save the task")
+        return HTTPStatus.OK, self.find_task(task_id).to_dict(), None
+
+    def handle_delete(self, path: str, query: dict, body) -> Tuple:
+        task_id, action = self.parse_task_path(path)
+        if action:
+            raise ApiError(HTTPStatus.METHOD_NOT_ALLOWED, "Use POST to toggle a task")
+        self.find_task(task_id)
+        if not self.manager.delete_task(task_id):
+            raise ApiError(HTTPStatus.INTERNAL_SERVER_ERROR, "Could not delete the task")
+        return HTTPStatus.NO_CONTENT, None, None
+
+    def list_tasks(self, query: dict) -> Tuple:
+        """Return one page of tasks with paging links."""
+        offset = self.query_int(query, 'offset', 0, 0)
+        limit = self.query_int(query, 'limit', DEFAULT_PAGE_SIZE, 1)
+        limit = min(limit, MAX_PAGE_SIZE)
+        status = query.get('status', ['all'])[0]
+        if status not in STATUS_FILTERS:
+            raise ApiError(HTTPStatus.BAD_REQUEST, "status must be all, pending or completed")
+
+        etag = self.etag()
+        if etag in self.if_none_match():
+            # The page cannot have changed; skip building it
+            return HTTPStatus.NOT_MODIFIED, None, etag
+
+        tasks, total = self.manager.get_tasks_page(offset, limit, STATUS_FILTERS[status])
+        next_offset = offset + len(tasks)
+        return HTTPStatus.OK, {
+            'tasks': [task.to_dict() for task in tasks],
+            'total': total,
+            'offset': offset,
+            'limit': limit,
+            'next_offset': next_offset if next_offset < total else None,
+        }, etag
+
+    # ----- Helpers -----
+
+    @staticmethod
+    def parse_task_path(path: str) -> Tuple[int, bool]:
+        """Split /tasks/<id>[/toggle] into (task ID, is toggle)."""
+        match = TASK_PATH.match(path)
+        if not match:
+            raise ApiError(HTTPStatus.NOT_FOUND, f"No such endpoint: {path}")
+        return int(match.group(1)), bool(match.group(2))
+
+    def find_task(self, task_id: int):
+        """Return a task or raise a 404 error."""
+        task = self.manager.get_task_by_id(task_id)
+        if task is None:
+            raise ApiError(HTTPStatus.NOT_FOUND, f"Task with ID {task_id} not found")
+        return task
+
+    @staticmethod
+    def field(body: Optional[dict], name: str, kind: type):
+        """Return a required body field of the given type."""
+        if not body or name not in body:
+            raise ApiError(HTTPStatus.BAD_REQUEST, f"Missing field: {name}")
+        value = body[name]
+        if not isinstance(value, kind):
+            raise ApiError(HTTPStatus.BAD_REQUEST, f"Field {name} must be a {kind.__name__}")
+        return value
+
+    @staticmethod
+    def query_int(query: dict, name: str, default: int, minimum: int) -> int:
+        """Read an integer query parameter."""
+        try:
+            value = int(query.get(name, [default])[0])
+        except ValueError:
+            raise ApiError(HTTPStatus.BAD_REQUEST, f"{name} must be an integer")
+        if value < minimum:
+            raise ApiError(HTTPStatus.BAD_REQUEST, f"{name} must be at least {minimum}")
+        return value
+
+
+class TodoServer(ThreadingHTTPServer):
+    """HTTP server holding the shared TodoManager (one thread per connection)."""
+
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], manager: TodoManager, quiet: bool = False):
+        """
+        Initialize the server.
+
+        Args:
+            address (tuple): (host, port) to listen on; port 0 picks a free port
+            manager (TodoManager): Task list to serve
+            quiet (bool): Don't log each request to stderr
+        """
+        super().__init__(address, TodoRequestHandler)
+        self.manager = manager
+        self.quiet = quiet
+        self.lock = threading.Lock()
+        # Revisions restart at every load, so ETags from an earlier server
+        # process must not match this one's
+        self.epoch = secrets.token_hex(4)
+
+
+def main():
+    """Parse arguments and serve until interrupted."""
+    parser = argparse.ArgumentParser(description="Serve the to-do list as a JSON API.")
+    parser.add_argument('--host', default='127.0.0.1', help="address to listen on")
+    parser.add_argument('--port', type=int, default=8000, help="port to listen on")
+    parser.add_argument('--data-file', default='tasks.json',
+                        help="task file to serve (.json, .bin, or a .db SQLite database)")
+    parser.add_argument('--quiet', action='store_true', help="don't log requests")
+    parser.add_argument('--no-journal', action='store_true',
+                        help="rewrite the whole JSON file on every change instead of journaling")
+    args = parser.parse_args()
+
+    # Results go to clients, not stdout
+    if args.data_file.endswith(SQLITE_EXTENSION):
+        manager = SQLiteTodoManager(args.data_file, verbose=False)
+    else:
+        storage = open_storage(args.data_file, journal=not args.no_journal)
+        manager = TodoManager(args.data_file, storage=storage, verbose=False)
+    server = TodoServer((args.host, args.port), manager, quiet=args.quiet)
+    host, port = server.server_address[:2]
+    print(f"✓ Serving {manager.get_task_count()['total']} tasks from {args.data_file} on http://{host}:{port}/ (Ctrl+C to stop)")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nℹ Shutting down...")
+    finally:
+        server.server_close()
+        manager.close()
+
+
+if __name__ == "__main__":
+    main()
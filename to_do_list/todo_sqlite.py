@@ -0,0 +1,610 @@
+"""
+To-Do List Application - SQLite Backend
+This module provides a TodoManager variant that keeps tasks in a SQLite
+database instead of memory, plus a migrator from the tasks.json format.
+
+Usage (migration from a JSON, journaled JSON or binary task file):
+    python todo_sqlite.py tasks.json tasks.db
+
+Author: Professional Python Developer
+Date: 2026-10-17
+"""
+
+import sqlite3
+import sys
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from todo_core import BatchResult, Task, Timestamp, current_timestamp, parse_timestamp
+from todo_storage import open_storage
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id INTEGER PRIMARY KEY,
+    title TEXT NOT NULL,
+    completed INTEGER NOT NULL DEFAULT 0,
+    created_at INTEGER NOT NULL,
+    updated_at INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_completed ON tasks (completed);
+CREATE INDEX IF NOT EXISTS idx_tasks_updated_at ON tasks (updated_at);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+TASK_COLUMNS = "id, title, completed, created_at, updated_at"
+
+
+def _row_to_task(row) -> Task:
+    """Create a Task from a tasks table row."""
+    return Task(id=row[0], title=row[1], completed=bool(row[2]),
+                created_at=row[3], updated_at=row[4])
+
+
+class SQLiteTodoManager:
+    """
+    TodoManager with the same public API, backed by a SQLite database.
+
+    Tasks live in the database rather than in memory, so startup does not
+    load every task and status filters and statistics run as indexed
+    queries. The CLI and GUI can use it in place of TodoManager.
+
+    Task objects returned by this class are copies of the stored rows;
+    change tasks through the manager methods.
+
+    Like TodoManager it is not thread-safe: callers on several threads
+    (such as todo_server) must serialize access to it.
+    """
+
+    def __init__(self, data_file: str = "tasks.db", verbose: bool = True):
+        """
+        Initialize the manager.
+
+        Args:
+            data_file (str): Path to the SQLite database file
+            verbose (bool): Print status messages; False keeps the manager
+                silent (results are still reported through return values)
+        """
+        self.data_file = data_file
+        self.verbose = verbose
+        # Callers serialize access, so the connection may move between threads
+        self.conn = sqlite3.connect(data_file, check_same_thread=False)
+        self._next_id = 1
+        self._revision = 0
+        self._batch_result: Optional[BatchResult] = None
+        self.load_tasks()
+
+    def _log(self, message: str) -> None:
+        """Print a status message unless the manager is silent."""
+        if self.verbose:
+            print(message)
+
+    @property
+    def tasks(self) -> List[Task]:
+        """List of all tasks in insertion order."""
+        return self.get_all_tasks()
+
+    @property
+    def revision(self) -> int:
+        """
+        Change counter for caches and ETags.
+
+        It increases whenever the database is opened or a batch that
+        changed tasks is committed, and never otherwise.
+        """
+        return self._revision
+
+    def load_tasks(self) -> None:
+        """Open the database, creating the schema if needed."""
+        try:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+            self.conn.executescript(SCHEMA)
+            self._next_id = self._read_next_id()
+            self._revision += 1
+            count = self.conn.execute("SELECT COUNT(*) FROM tasks").fetchone()[0]
+            self._log(f"✓ Loaded {count} tasks from {self.data_file}")
+        except sqlite3.Error as e:
+            self._log(f"⚠ Error loading tasks: {e}")
+
+    def _read_next_id(self) -> int:
+        """Read the persisted ID counter, falling back to the highest ID."""
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'next_id'").fetchone()
+        max_id = self.conn.execute("SELECT COALESCE(MAX(id), 0) FROM tasks").fetchone()[0]
+        return max(row[0] if row else 1, max_id + 1)
+
+    def save_tasks(self) -> bool:
+        """
+        Make sure all changes are on disk.
+
+        Every change is already committed by its own transaction, so this
+        only checkpoints the write-ahead log.
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            self.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            return True
+        except sqlite3.Error as e:
+            self._log(f"✗ Error saving tasks: {e}")
+            return False
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self.conn.close()
+
+    @contextmanager
+    def batch(self) -> Iterator[BatchResult]:
+        """
+        Group several changes into one database transaction.
+
+        Behaves like TodoManager.batch(): changes are committed once when
+        the block exits and rolled back if the block raises or the commit
+        fails. Database errors inside the block are reported and turn
+        into a failed result.
+
+        Yields:
+            BatchResult: Outcome of the transaction, filled in on exit
+        """
+        if self._batch_result is not None:
+            yield self._batch_result
+            return
+
+        self._batch_result = result = BatchResult()
+        saved_next_id = self._next_id
+        changes_before = self.conn.total_changes
+        try:
+            # sqlite3 opens the transaction implicitly on the first write
+            yield result
+            changed = self.conn.total_changes != changes_before
+            self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('next_id', ?)",
+                              (self._next_id,))
+            self.conn.commit()
+            if changed:
+                self._revision += 1
+        except sqlite3.Error as e:
+            self._log(f"✗ Error saving tasks: {e}")
+            self._rollback(saved_next_id)
+            result.success = False
+        except BaseException:
+            self._rollback(saved_next_id)
+            raise
+        finally:
+            self._batch_result = None
+
+    def _rollback(self, saved_next_id: int) -> None:
+        """Roll back the open transaction and restore the ID counter."""
+        self.conn.rollback()
+        self._next_id = saved_next_id
+
+    def get_next_id(self) -> int:
+        """Get the next available task ID."""
+        return self._next_id
+
+    def _insert_task(self, title: str, timestamp: int) -> Task:
+        """Insert a task with the next ID inside the current transaction."""
+        task = Task(id=self._next_id, title=title, created_at=timestamp)
+        self.conn.execute(f"INSERT INTO tasks ({TASK_COLUMNS}) VALUES (?, ?, ?, ?, ?)",
+                          (task.id, task.title, int(task.completed),
+                           task.created_ts, task.updated_ts))
+        self._next_id += 1
+        return task
+
+    def add_task(self, title: str) -> Optional[Task]:
+        """
+        Add a new task.
+
+        Args:
+            title (str): Task title/description
+
+        Returns:
+            Task: The created task, or None if failed
+        """
+        if not title or not title.strip():
+            self._log("✗ Error: Task title cannot be empty!")
+            return None
+
+        timestamp = current_timestamp()
+        with self.batch() as result:
+            task = self._insert_task(title.strip(), timestamp)
+
+        if not result.success:
+            return None
+
+        self._log(f"✓ Task added successfully! (ID: {task.id})")
+        return task
+
+    def add_tasks(self, titles: Iterable[str]) -> List[Task]:
+        """
+        Add several tasks in one transaction.
+
+        Args:
+            titles (Iterable[str]): Task titles/descriptions
+
+        Returns:
+            List[Task]: The created tasks, or an empty list if saving failed
+        """
+        timestamp = current_timestamp()
+        skipped = 0
+
+        with self.batch() as result:
+            created = []
+            for title in titles:
+                if not title or not title.strip():
+                    skipped += 1
+                    continue
+                created.append(self._insert_task(title.strip(), timestamp))
+
+        if not result.success:
+            return []
+
+        if skipped:
+            self._log(f"⚠ Skipped {skipped} empty title(s).")
+        self._log(f"✓ Added {len(created)} task(s)!")
+        return created
+
+    def _select_tasks(self, where: str = "", params: tuple = ()) -> List[Task]:
+        """Run a SELECT over the tasks table and build Task objects."""
+        rows = self.conn.execute(
+            f"SELECT {TASK_COLUMNS} FROM tasks {where} ORDER BY id", params)
+        return [_row_to_task(row) for row in rows]
+
+    def get_all_tasks(self) -> List[Task]:
+        """
+        Get all tasks.
+
+        Returns:
+            List[Task]: List of all tasks
+        """
+        return self._select_tasks()
+
+    def get_pending_tasks(self) -> List[Task]:
+        """Get all tasks that are not completed, using the status index."""
+        return self._select_tasks("WHERE completed = 0")
+
+    def get_completed_tasks(self) -> List[Task]:
+        """Get all completed tasks, using the status index."""
+        return self._select_tasks("WHERE completed = 1")
+
+    def get_tasks_page(self, offset: int = 0, limit: int = 50,
+                       completed: Optional[bool] = None) -> Tuple[List[Task], int]:
+        """
+        Get one page of tasks in insertion order with LIMIT/OFFSET.
+
+        Args:
+            offset (int): Number of matching tasks to skip
+            limit (int): Maximum number of tasks to return
+            completed (bool): Only completed (True) or pending (False)
+                tasks; None for all tasks
+
+        Returns:
+            tuple: (tasks on the page, total number of matching tasks)
+        """
+        where, params = ("", ()) if completed is None else ("WHERE completed = ?", (int(completed),))
+        total = self.conn.execute(f"SELECT COUNT(*) FROM tasks {where}", params).fetchone()[0]
+        rows = self.conn.execute(
+            f"SELECT {TASK_COLUMNS} FROM tasks {where} ORDER BY id LIMIT ? OFFSET ?",
+            params + (limit, offset))
+        return [_row_to_task(row) for row in rows], total
+
+    def get_task_by_id(self, task_id: int) -> Optional[Task]:
+        """
+        Find a task by ID.
+
+        Args:
+            task_id (int): Task ID to search for
+
+        Returns:
+            Task: The task if found, None otherwise
+        """
+        row = self.conn.execute(f"SELECT {TASK_COLUMNS} FROM tasks WHERE id = ?",
+                                (task_id,)).fetchone()
+        return _row_to_task(row) if row else None
+
+    def update_task(self, task_id: int, new_title: str) -> bool:
+        """
+        Update a task's title.
+
+        Args:
+            task_id (int): ID of task to update
+            new_title (str): New title for the task
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        if not new_title or not new_title.strip():
+            self._log("✗ Error: Task title cannot be empty!")
+            return False
+
+        task = self.get_task_by_id(task_id)
+        if not task:
+            self._log(f"✗ Error: Task with ID {task_id} not found!")
+            return False
+
+        timestamp = current_timestamp()
+        with self.batch() as result:
+            self.conn.execute("UPDATE tasks SET title = ?, updated_at = ? WHERE id = ?",
+                              (new_title.strip(), timestamp, task_id))
+
+        if not result.success:
+            return False
+
+        self._log(f"✓ Task updated successfully!")
+        self._log(f"  Old: {task.title}")
+        self._log(f"  New: {new_title.strip()}")
+        return True
+
+    def toggle_task_status(self, task_id: int) -> bool:
+        """
+        Toggle a task's completion status.
+
+        Args:
+            task_id (int): ID of task to toggle
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        task = self.get_task_by_id(task_id)
+        if not task:
+            self._log(f"✗ Error: Task with ID {task_id} not found!")
+            return False
+
+        return self._write_status(task_id, not task.completed)
+
+    def set_task_status(self, task_id: int, completed: bool) -> bool:
+        """
+        Set a task's completion status.
+
+        Args:
+            task_id (int): ID of task to update
+            completed (bool): New completion status
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        task = self.get_task_by_id(task_id)
+        if not task:
+            self._log(f"✗ Error: Task with ID {task_id} not found!")
+            return False
+
+        if task.completed == completed:
+            status = "completed" if completed else "pending"
+            self._log(f"ℹ Task is already {status}!")
+            return True
+
+        return self._write_status(task_id, completed)
+
+    def _write_status(self, task_id: int, completed: bool) -> bool:
+        """Store a new completion status for one task."""
+        timestamp = current_timestamp()
+        with self.batch() as result:
+            self.conn.execute("UPDATE tasks SET completed = ?, updated_at = ? WHERE id = ?",
+                              (int(completed), timestamp, task_id))
+
+        if not result.success:
+            return False
+
+        status = "completed" if completed else "pending"
+        self._log(f"✓ Task marked as {status}!")
+        return True
+
+    def set_status_many(self, task_ids: Iterable[int], completed: bool) -> int:
+        """
+        Set the completion status of several tasks in one transaction.
+
+        Args:
+            task_ids (Iterable[int]): IDs of tasks to update
+            completed (bool): New completion status
+
+        Returns:
+            int: Number of tasks changed (0 if saving failed)
+        """
+        timestamp = current_timestamp()
+        missing = 0
+
+        with self.batch() as result:
+            changed = 0
+            for task_id in task_ids:
+                cursor = self.conn.execute(
+                    "UPDATE tasks SET completed = ?, updated_at = ? WHERE id = ? AND completed <> ?",
+                    (int(completed), timestamp, task_id, int(completed)))
+                if cursor.rowcount:
+                    changed += 1
+                elif not self.conn.execute("SELECT 1 FROM tasks WHERE id = ?", (task_id,)).fetchone():
+                    missing += 1
+
+        if not result.success:
+            return 0
+
+        if missing:
+            self._log(f"⚠ {missing} task(s) not found!")
+        status = "completed" if completed else "pending"
+        self._log(f"✓ Marked {changed} task(s) as {status}!")
+        return changed
+
+    def delete_task(self, task_id: int) -> bool:
+        """
+        Delete a task.
+
+        Args:
+            task_id (int): ID of task to delete
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        with self.batch() as result:
+            deleted = self.conn.execute("DELETE FROM tasks WHERE id = ?", (task_id,)).rowcount
+
+        if not result.success:
+            return False
+
+        if not deleted:
+            self._log(f"✗ Error: Task with ID {task_id} not found!")
+            return False
+
+        self._log(f"✓ Task deleted successfully!")
+        return True
+
+    def delete_many(self, task_ids: Iterable[int]) -> int:
+        """
+        Delete several tasks in one transaction.
+
+        Args:
+            task_ids (Iterable[int]): IDs of tasks to delete
+
+        Returns:
+            int: Number of tasks deleted (0 if saving failed)
+        """
+        task_ids = list(task_ids)
+
+        with self.batch() as result:
+            deleted = self.conn.executemany("DELETE FROM tasks WHERE id = ?",
+                                            ((task_id,) for task_id in task_ids)).rowcount
+
+        if not result.success:
+            return 0
+
+        missing = len(task_ids) - deleted
+        if missing:
+            self._log(f"⚠ {missing} task(s) not found!")
+        self._log(f"✓ Deleted {deleted} task(s)!")
+        return deleted
+
+    def get_task_count(self) -> Dict[str, int]:
+        """
+        Get task statistics with indexed COUNT queries.
+
+        Returns:
+            dict: Dictionary with total, completed, and pending counts
+        """
+        total = self.conn.execute("SELECT COUNT(*) FROM tasks").fetchone()[0]
+        completed = self.conn.execute(
+            "SELECT COUNT(*) FROM tasks WHERE completed = 1").fetchone()[0]
+
+        return {
+            'total': total,
+            'completed': completed,
+            'pending': total - completed
+        }
+
+    def get_completion_history(self) -> Dict[str, int]:
+        """
+        Get the number of completed tasks per completion day.
+
+        Returns:
+            dict: "YYYY-MM-DD" -> number of completed tasks, sorted by day
+        """
+        rows = self.conn.execute(
+            "SELECT date(updated_at, 'unixepoch', 'localtime') AS day, COUNT(*) "
+            "FROM tasks WHERE completed = 1 GROUP BY day ORDER BY day")
+        return dict(rows)
+
+    def get_tasks_updated_since(self, timestamp: Timestamp) -> List[Task]:
+        """
+        Get tasks changed at or after a timestamp, using the updated_at index.
+
+        Args:
+            timestamp: Epoch seconds or a "YYYY-MM-DD HH:MM:SS" string
+
+        Returns:
+            List[Task]: Matching tasks in insertion order
+        """
+        return self._select_tasks("WHERE updated_at >= ?", (parse_timestamp(timestamp),))
+
+    def clear_completed_tasks(self) -> int:
+        """
+        Remove all completed tasks.
+
+        Returns:
+            int: Number of tasks deleted
+        """
+        with self.batch() as result:
+            deleted = self.conn.execute("DELETE FROM tasks WHERE completed = 1").rowcount
+
+        if not result.success:
+            return 0
+
+        if deleted:
+            self._log(f"✓ Deleted {deleted} completed task(s)!")
+        else:
+            self._log("ℹ No completed tasks to delete!")
+        return deleted
+
+
+def _task_row(data: Dict) -> tuple:
+    """
+    Convert a task dictionary to a tasks table row.
+
+    Raises:
+        ValueError: If the task is missing fields or has a bad timestamp
+    """
+    try:
+        task = Task.from_dict(data)
+        return (task.id, task.title, int(task.completed), task.created_ts, task.updated_ts)
+    except (KeyError, TypeError, ValueError) as e:
+        raise ValueError(f"Task {data.get('id', '?')} cannot be migrated: {e}") from None
+
+
+def migrate_json_to_sqlite(json_file: str, db_file: str) -> int:
+    """
+    Copy all tasks from a task file into a new SQLite database.
+
+    The source is read through open_storage, so JSON files (with any
+    pending journal), and binary snapshots are all supported. Task IDs,
+    timestamps and the ID counter are preserved. The target database
+    must not contain any tasks yet; nothing is written if any task
+    cannot be converted.
+
+    Args:
+        json_file (str): Source task file (.json or .bin)
+        db_file (str): Target SQLite database file
+
+    Returns:
+        int: Number of tasks migrated, or -1 if the migration failed
+    """
+    storage = open_storage(json_file)
+    try:
+        if not storage.exists():
+            raise FileNotFoundError(f"No such file: {json_file}")
+        data, next_id = storage.load()
+    except (OSError, ValueError) as e:
+        print(f"✗ Error reading {json_file}: {e}")
+        return -1
+    finally:
+        storage.close()
+
+    conn = sqlite3.connect(db_file, isolation_level=None)
+    try:
+        conn.executescript(SCHEMA)
+        if conn.execute("SELECT COUNT(*) FROM tasks").fetchone()[0]:
+            print(f"✗ Error: {db_file} already contains tasks!")
+            return -1
+
+        conn.execute("BEGIN")
+        conn.executemany(
+            f"INSERT INTO tasks ({TASK_COLUMNS}) VALUES (?, ?, ?, ?, ?)",
+            map(_task_row, data))
+        conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('next_id', ?)",
+                     (next_id,))
+        conn.execute("COMMIT")
+    except (sqlite3.Error, ValueError) as e:
+        if conn.in_transaction:
+            conn.execute("ROLLBACK")
+        print(f"✗ Error migrating tasks: {e}")
+        return -1
+    finally:
+        conn.close()
+
+    print(f"✓ Migrated {len(data)} tasks from {json_file} to {db_file}")
+    return len(data)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print("Usage: python todo_sqlite.py <tasks.json|tasks.bin> <tasks.db>")
+        sys.exit(1)
+
+    sys.exit(0 if migrate_json_to_sqlite(sys.argv[1], sys.argv[2]) >= 0 else 1)
@@ -0,0 +1,792 @@
+"""
+To-Do List Application - Storage Backends
+This module provides pluggable persistence backends for TodoManager.
+
+Usage (convert between JSON and binary snapshots):
+    python todo_storage.py tasks.json tasks.bin
+
+Author: Professional Python Developer
+Date: 2026-10-17
+"""
+
+import json
+import marshal
+import os
+import re
+import struct
+import sys
+import tempfile
+import threading
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+# A change is either ('put', task_dict) or ('delete', task_id)
+Change = Tuple[str, object]
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+# Binary snapshot header: magic bytes and format version
+BINARY_MAGIC = b'TODOSNAP'
+BINARY_VERSION = 1
+_BINARY_HEADER = struct.Struct('<8sH')
+
+# Data files with this extension use the binary snapshot format
+BINARY_EXTENSION = '.bin'
+
+
+class SnapshotReader:
+    """
+    Incremental parser for snapshot files.
+
+    Iterating yields task dictionaries one at a time while the file is
+    read in fixed-size chunks, so memory use does not depend on the file
+    size and callers can use the first tasks before the rest is parsed.
+
+    Snapshots are stored as ``{"next_id": ..., "tasks": [...]}``. Older
+    files are a bare list of tasks. ``next_id`` is final once iteration
+    has finished; for old files it is derived from the highest ID.
+    """
+
+    # Largest single value (in characters) the reader will buffer
+    MAX_VALUE_SIZE = 1 << 24
+
+    def __init__(self, path: str, chunk_size: int = 1 << 16):
+        """
+        Initialize the reader.
+
+        Args:
+            path (str): Path to the snapshot file
+            chunk_size (int): Characters to read from the file at a time
+        """
+        self.path = path
+        self.chunk_size = chunk_size
+        self.next_id = 1
+
+        self._decoder = json.JSONDecoder()
+        self._file = None
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def __iter__(self) -> Iterator[Dict]:
+        """Yield task dictionaries in file order."""
+        with open(self.path, 'r', encoding='utf-8') as f:
+            self._file = f
+            self._buffer, self._pos, self._eof = "", 0, False
+
+            start = self._next_char()
+            if start == '[':
+                yield from self._read_tasks()
+            elif start == '{':
+                yield from self._read_document()
+            else:
+                self._fail("Expected '[' or '{'")
+
+            if self._next_char(required=False):
+                self._fail("Extra data")
+
+    def _read_document(self) -> Iterator[Dict]:
+        """Read the object form, streaming the "tasks" array."""
+        if self._peek_char() == '}':
+            self._pos += 1
+            return
+
+        while True:
+            key = self._read_value()
+            if self._next_char() != ':':
+                self._fail("Expected ':'")
+
+            if key == 'tasks':
+                if self._next_char() != '[':
+                    self._fail("Expected '['")
+                yield from self._read_tasks()
+            else:
+                value = self._read_value()
+                if key == 'next_id':
+                    self.next_id = max(self.next_id, value)
+
+            separator = self._next_char()
+            if separator == '}':
+                return
+            if separator != ',':
+                self._fail("Expected ',' or '}'")
+
+    def _read_tasks(self) -> Iterator[Dict]:
+        """Read the elements of a task array whose '[' was consumed."""
+        if self._peek_char() == ']':
+            self._pos += 1
+            return
+
+        scan = self._decoder.scan_once
+        skip = _WHITESPACE.match
+
+        while True:
+            # Fast path: the task and the separator after it are already buffered
+            buffer = self._buffer
+            start = skip(buffer, self._pos).end()
+            try:
+                task, end = scan(buffer, start)
+                separator_pos = skip(buffer, end).end()
+            except (StopIteration, json.JSONDecodeError):
+                separator_pos = len(buffer)
+
+            if separator_pos < len(buffer):
+                separator = buffer[separator_pos]
+                self._pos = separator_pos + 1
+            else:
+                self._pos = start
+                task = self._read_value()
+                separator = self._next_char()
+
+            if task['id'] >= self.next_id:
+                self.next_id = task['id'] + 1
+            yield task
+
+            if separator == ']':
+                return
+            if separator != ',':
+                self._fail("Expected ',' or ']'")
+
+    def _read_value(self):
+        """Decode one JSON value, reading more of the file as needed."""
+        self._peek_char()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                # Give up on corrupt data instead of reading the whole file
+                if self._eof or len(self._buffer) - self._pos > self.MAX_VALUE_SIZE:
+                    raise
+                self._fill()
+                continue
+
+            # A number that ends at the buffer edge may continue in the next chunk
+            if end == len(self._buffer) and not self._eof:
+                self._fill()
+                continue
+
+            self._pos = end
+            return value
+
+    def _peek_char(self, required: bool = True) -> str:
+        """Skip whitespace and return the next character without consuming it."""
+        while True:
+            self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if self._eof:
+                if required:
+                    self._fail("Unexpected end of file")
+                return ""
+            self._fill()
+
+    def _next_char(self, required: bool = True) -> str:
+        """Skip whitespace and consume the next character."""
+        char = self._peek_char(required)
+        if char:
+            self._pos += 1
+        return char
+
+    def _fill(self) -> None:
+        """Drop consumed input and append the next chunk of the file."""
+        chunk = self._file.read(self.chunk_size)
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+        if not chunk:
+            self._eof = True
+
+    def _fail(self, message: str) -> None:
+        """Raise a JSONDecodeError at the current position."""
+        raise json.JSONDecodeError(message, self._buffer, self._pos)
+
+
+def build_snapshot(tasks: List[Dict], next_id: int) -> Dict:
+    """Build the JSON snapshot document for a list of task dictionaries."""
+    return {'next_id': next_id, 'tasks': tasks}
+
+
+def atomic_write_json(path: str, data, indent: Optional[int] = 4) -> None:
+    """
+    Write JSON data to a file atomically.
+
+    The data is written to a temporary file in the same directory, flushed
+    to disk and then renamed over the target, so readers only ever see the
+    old file or the complete new one.
+
+    Args:
+        path (str): Destination file path
+        data: JSON-serializable data
+        indent (int): Indentation passed to json.dump
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(prefix=".tmp-", dir=directory)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=indent, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+def atomic_write_bytes(path: str, data: bytes) -> None:
+    """Write bytes to a file atomically (see atomic_write_json)."""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(prefix=".tmp-", dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+def is_binary_snapshot(path: str) -> bool:
+    """Return True if the file starts with the binary snapshot magic bytes."""
+    try:
+        with open(path, 'rb') as f:
+            return f.read(len(BINARY_MAGIC)) == BINARY_MAGIC
+    except OSError:
+        return False
+
+
+def encode_binary_snapshot(tasks: Iterable, next_id: int) -> bytes:
+    """
+    Encode Task objects as a binary snapshot.
+
+    The payload is a marshal-encoded tuple of columns (IDs, titles,
+    completed flags, created and updated epoch seconds) after a header
+    holding the magic bytes and the format version.
+
+    Args:
+        tasks (Iterable): Task objects in insertion order
+        next_id (int): Next task ID to hand out
+
+    Returns:
+        bytes: The encoded snapshot
+    """
+    ids, titles, completed, created, updated = [], [], [], [], []
+    for task in tasks:
+        ids.append(task.id)
+        titles.append(task.title)
+        completed.append(task.completed)
+        created.append(task.created_ts)
+        updated.append(task.updated_ts)
+
+    payload = marshal.dumps((next_id, ids, titles, completed, created, updated))
+    return _BINARY_HEADER.pack(BINARY_MAGIC, BINARY_VERSION) + payload
+
+
+class BinarySnapshotReader:
+    """
+    Reader for binary snapshot files.
+
+    The whole file is decoded at once (marshal is far faster than JSON
+    parsing), then task dictionaries are produced on iteration with
+    integer timestamps. ``next_id`` is available right away.
+    """
+
+    def __init__(self, path: str):
+        """
+        Read and decode a binary snapshot.
+
+        Args:
+            path (str): Path to the snapshot file
+
+        Raises:
+            ValueError: If the file is not a supported binary snapshot
+        """
+        with open(path, 'rb') as f:
+            data = f.read()
+
+        if len(data) < _BINARY_HEADER.size:
+            raise ValueError(f"{path} is too short to be a binary task snapshot")
+        magic, version = _BINARY_HEADER.unpack_from(data)
+        if magic != BINARY_MAGIC:
+            raise ValueError(f"{path} is not a binary task snapshot")
+        if version != BINARY_VERSION:
+            raise ValueError(f"{path} uses unsupported snapshot version {version}")
+
+        try:
+            columns = marshal.loads(memoryview(data)[_BINARY_HEADER.size:])
+        except (EOFError, TypeError) as e:
+            raise ValueError(f"{path} holds a damaged binary task snapshot") from e
+        self.next_id, *self._columns = columns
+
+    def __iter__(self) -> Iterator[Dict]:
+        for id, title, completed, created, updated in zip(*self._columns):
+            yield {'id': id, 'title': title, 'completed': completed,
+                   'created_at': created, 'updated_at': updated}
+
+
+class TaskStorage:
+    """
+    Base class for TodoManager storage backends.
+
+    A backend loads the raw task dictionaries and the ID counter at
+    startup and persists changes afterwards. Failures are reported by raising an exception,
+    which TodoManager turns into a failed operation.
+    """
+
+    def exists(self) -> bool:
+        """Return True if there is previously saved data to load."""
+        raise NotImplementedError
+
+    def open_reader(self) -> Iterable[Dict]:
+        """
+        Start reading the saved tasks incrementally.
+
+        Returns:
+            Iterable[Dict]: Yields task dictionaries in insertion order. Its
+                ``next_id`` attribute holds the next task ID once the
+                iteration has finished.
+        """
+        raise NotImplementedError
+
+    def load(self) -> Tuple[List[Dict], int]:
+        """
+        Load all saved tasks at once.
+
+        Returns:
+            tuple: (task dictionaries in insertion order, next task ID)
+        """
+        reader = self.open_reader()
+        tasks = list(reader)
+        return tasks, reader.next_id
+
+    def commit(self, tasks: Iterable, next_id: int,
+               changes: Optional[List[Change]] = None) -> None:
+        """
+        Persist the current state.
+
+        Args:
+            tasks (Iterable): All current Task objects
+            next_id (int): Next task ID to hand out
+            changes (list): Changes since the last commit, or None to
+                persist the full task list
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Release any resources held by the backend."""
+
+
+class JSONFileStorage(TaskStorage):
+    """
+    Stores all tasks in a single JSON file that is rewritten on every commit.
+
+    The file holds the ID counter next to the task list; the original
+    bare-list format is still read. Writes go through a temporary
+    file and an atomic rename, so a crash never leaves a truncated file.
+    """
+
+    def __init__(self, path: str):
+        """
+        Initialize the storage.
+
+        Args:
+            path (str): Path to the JSON file
+        """
+        self.path = path
+
+    def exists(self) -> bool:
+        """Return True if the JSON file exists."""
+        return os.path.exists(self.path)
+
+    def open_reader(self) -> SnapshotReader:
+        """Stream tasks from the JSON file."""
+        return SnapshotReader(self.path)
+
+    def commit(self, tasks: Iterable, next_id: int,
+               changes: Optional[List[Change]] = None) -> None:
+        """Rewrite the whole JSON file with the current tasks."""
+        atomic_write_json(self.path, build_snapshot([task.to_dict() for task in tasks], next_id))
+
+
+class BinarySnapshotStorage(TaskStorage):
+    """
+    Stores all tasks in a compact binary snapshot rewritten on every commit.
+
+    Smaller and faster to load than the indented JSON file. Use
+    convert_snapshot() to move data between the two formats.
+    """
+
+    def __init__(self, path: str):
+        """
+        Initialize the storage.
+
+        Args:
+            path (str): Path to the snapshot file
+        """
+        self.path = path
+
+    def exists(self) -> bool:
+        """Return True if the snapshot file exists."""
+        return os.path.exists(self.path)
+
+    def open_reader(self) -> BinarySnapshotReader:
+        """Decode the snapshot file."""
+        return BinarySnapshotReader(self.path)
+
+    def commit(self, tasks: Iterable, next_id: int,
+               changes: Optional[List[Change]] = None) -> None:
+        """Rewrite the whole snapshot file with the current tasks."""
+        atomic_write_bytes(self.path, encode_binary_snapshot(tasks, next_id))
+
+
+def open_storage(path: str, journal: bool = True) -> TaskStorage:
+    """
+    Pick the storage backend for a data file.
+
+    Files ending in ``.bin`` or starting with the binary magic bytes use
+    BinarySnapshotStorage. JSON files use JournalStorage, which appends
+    each change to ``<path>.journal`` and keeps ``path`` as its snapshot,
+    so existing task files load unchanged.
+
+    Args:
+        path (str): Path to the data file
+        journal (bool): False rewrites the whole JSON file on every
+            change (JSONFileStorage) instead of journaling
+    """
+    if path.endswith(BINARY_EXTENSION) or is_binary_snapshot(path):
+        return BinarySnapshotStorage(path)
+    if journal:
+        return JournalStorage(path)
+    return JSONFileStorage(path)
+
+
+def convert_snapshot(source: str, destination: str) -> int:
+    """
+    Convert a task file between the JSON and binary snapshot formats.
+
+    The format of each file is chosen by open_storage, so converting
+    tasks.json to tasks.bin writes a binary snapshot and vice versa. A
+    JSON destination is written as a plain snapshot, not a journal, so
+    the converted file holds every task.
+
+    Returns:
+        int: Number of tasks converted, or -1 on failure
+    """
+    # Imported here because todo_core imports this module
+    from todo_core import Task
+
+    try:
+        storage = open_storage(source)
+        try:
+            tasks, next_id = storage.load()
+        finally:
+            storage.close()
+        target = open_storage(destination, journal=False)
+        try:
+            target.commit([Task.from_dict(data) for data in tasks], next_id)
+        finally:
+            target.close()
+    except (OSError, ValueError) as e:
+        print(f"✗ Error converting {source}: {e}")
+        return -1
+
+    print(f"✓ Converted {len(tasks)} tasks from {source} to {destination}")
+    return len(tasks)
+
+
+class _JournalOverlay:
+    """Changes read from journal files, applied on top of a snapshot stream."""
+
+    def __init__(self):
+        """Initialize an empty overlay."""
+        self.changes: Dict[int, Optional[Dict]] = {}  # None marks a deletion
+        self.reset = False
+        self.next_id = 1
+
+    def apply(self, record: Dict) -> None:
+        """Apply one journal record (raises ValueError if it is malformed)."""
+        op = record.get('op')
+        if op == 'put':
+            task = record['task']
+            if not isinstance(task.get('id'), int) or not isinstance(task.get('title'), str):
+                raise ValueError("Malformed task record")
+            self.changes[task['id']] = task
+            self.next_id = max(self.next_id, task['id'] + 1)
+        elif op == 'delete':
+            self.changes[record['id']] = None
+        elif op == 'reset':
+            self.changes.clear()
+            self.reset = True
+            self.next_id = record.get('next_id', 1)
+
+    def merge(self, snapshot: Iterable[Dict]) -> Iterator[Dict]:
+        """
+        Yield the snapshot tasks with the journal changes applied.
+
+        Changed tasks keep their snapshot position; tasks that only exist
+        in the journal follow in the order they were first written.
+        """
+        pending = dict(self.changes)
+        if not self.reset:
+            for task in snapshot:
+                if task['id'] in pending:
+                    task = pending.pop(task['id'])
+                    if task is None:
+                        continue
+                yield task
+
+        for task in pending.values():
+            if task is not None:
+                yield task
+
+
+class _MergedReader:
+    """Streams a snapshot with journal changes applied (see open_reader)."""
+
+    def __init__(self, snapshot: Optional[SnapshotReader], overlay: _JournalOverlay):
+        """
+        Initialize the reader.
+
+        Args:
+            snapshot (SnapshotReader): Snapshot to read, or None if absent
+            overlay (_JournalOverlay): Journal changes to apply
+        """
+        self.snapshot = snapshot
+        self.overlay = overlay
+
+    def __iter__(self) -> Iterator[Dict]:
+        """Yield the merged task dictionaries."""
+        return self.overlay.merge(self.snapshot if self.snapshot is not None else ())
+
+    @property
+    def next_id(self) -> int:
+        """Next task ID, final once iteration has finished."""
+        next_id = self.overlay.next_id
+        if self.snapshot is not None and not self.overlay.reset:
+            next_id = max(next_id, self.snapshot.next_id)
+        return next_id
+
+
+class JournalStorage(TaskStorage):
+    """
+    Append-only journal storage.
+
+    Each commit appends its changes as JSON lines to ``<path>.journal``
+    instead of rewriting every task. Once the journal grows past
+    ``compact_threshold`` records it is rotated to ``<path>.journal.old``
+    and a background thread folds it into the snapshot at ``<path>``,
+    which uses the same format as JSONFileStorage.
+
+    Startup replays the snapshot, any rotated segment and the active
+    journal. Journal records describe the full state of a task, so
+    replaying a segment that was already folded into the snapshot (after
+    a crash between the two steps) gives the same result. A torn last
+    line from a crash in the middle of an append is discarded; a damaged
+    record elsewhere is skipped with a warning and left on disk, so the
+    records after it are never lost.
+
+    The ID counter needs no records of its own: replay advances it past
+    every ID that was ever put, and compaction stores it in the snapshot.
+    """
+
+    def __init__(self, path: str, compact_threshold: int = 10000, fsync: bool = True):
+        """
+        Initialize the storage.
+
+        Args:
+            path (str): Path to the snapshot file
+            compact_threshold (int): Journal records that trigger compaction
+            fsync (bool): Whether to fsync the journal after every commit
+        """
+        self.path = path
+        self.journal_path = path + ".journal"
+        self.segment_path = path + ".journal.old"
+        self.compact_threshold = compact_threshold
+        self.fsync = fsync
+
+        self._lock = threading.Lock()
+        self._journal = None
+        self._journal_records = 0
+        self._compactor: Optional[threading.Thread] = None
+
+    def exists(self) -> bool:
+        """Return True if a snapshot or journal exists."""
+        return any(os.path.exists(p) for p in
+                   (self.path, self.segment_path, self.journal_path))
+
+    def open_reader(self) -> _MergedReader:
+        """
+        Stream the snapshot with the journal replayed on top.
+
+        The journal is read first (it is bounded by the compaction
+        threshold); the snapshot itself is then streamed.
+        """
+        self._wait_for_compaction()
+
+        if os.path.exists(self.segment_path):
+            # A previous compaction did not finish; complete it now
+            self._compact()
+
+        overlay = _JournalOverlay()
+        self._journal_records = self._replay(self.journal_path, overlay, repair=True)
+        return _MergedReader(self._snapshot_reader(), overlay)
+
+    def commit(self, tasks: Iterable, next_id: int,
+               changes: Optional[List[Change]] = None) -> None:
+        """Append the changes (or a full reset) to the journal."""
+        if changes is None:
+            records = [{'op': 'reset', 'next_id': next_id}]
+            records.extend({'op': 'put', 'task': task.to_dict()} for task in tasks)
+        else:
+            records = [self._encode_change(change) for change in changes]
+
+        if not records:
+            return
+
+        data = "".join(json.dumps(record, ensure_ascii=False) + "\n"
+                       for record in records).encode('utf-8')
+
+        with self._lock:
+            self._append(data)
+            self._journal_records += len(records)
+
+            if self._journal_records >= self.compact_threshold:
+                self._start_compaction()
+
+    def close(self) -> None:
+        """Wait for a running compaction and close the journal file."""
+        self._wait_for_compaction()
+        with self._lock:
+            if self._journal is not None:
+                self._journal.close()
+                self._journal = None
+
+    @staticmethod
+    def _encode_change(change: Change) -> Dict:
+        """Convert a change tuple to a journal record."""
+        op, value = change
+        if op == 'put':
+            return {'op': 'put', 'task': value}
+        if op == 'delete':
+            return {'op': 'delete', 'id': value}
+        raise ValueError(f"Unknown change type: {op}")
+
+    def _snapshot_reader(self) -> Optional[SnapshotReader]:
+        """Return a reader for the snapshot file, or None if there is none."""
+        if not os.path.exists(self.path):
+            return None
+        return SnapshotReader(self.path)
+
+    def _replay(self, log_path: str, overlay: _JournalOverlay, repair: bool = False) -> int:
+        """
+        Apply the records of a journal file to ``overlay``.
+
+        Only an unterminated last line can come from an interrupted append;
+        it is ignored (and cut off with ``repair``). Any other line that
+        cannot be decoded is skipped without touching the file.
+
+        Args:
+            log_path (str): Journal file to replay
+            overlay (_JournalOverlay): Changes, updated in place
+            repair (bool): Truncate a torn record at the end of the file
+
+        Returns:
+            int: Number of records read, including skipped ones
+        """
+        if not os.path.exists(log_path):
+            return 0
+
+        records = 0
+        damaged = 0
+        complete_length = 0
+        with open(log_path, 'rb') as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # Torn final record
+                complete_length += len(line)
+                records += 1
+                try:
+                    overlay.apply(json.loads(line))
+                except (ValueError, KeyError, TypeError, AttributeError):
+                    damaged += 1
+
+        if damaged:
+            print(f"⚠ Warning: Skipped {damaged} damaged record(s) in {log_path}")
+
+        if repair and complete_length < os.path.getsize(log_path):
+            with open(log_path, 'r+b') as f:
+                f.truncate(complete_length)
+
+        return records
+
+    def _append(self, data: bytes) -> None:
+        """Append raw bytes to the journal, undoing partial writes on failure."""
+        if self._journal is None:
+            self._journal = open(self.journal_path, 'ab')
+
+        offset = self._journal.tell()
+        try:
+            self._journal.write(data)
+            self._journal.flush()
+            if self.fsync:
+                os.fsync(self._journal.fileno())
+        except BaseException:
+            try:
+                self._journal.truncate(offset)
+                self._journal.seek(offset)
+            except OSError:
+                pass
+            raise
+
+    def _start_compaction(self) -> None:
+        """Rotate the journal and fold it into the snapshot in the background."""
+        if self._compactor is not None and self._compactor.is_alive():
+            return
+
+        if not os.path.exists(self.segment_path):
+            if self._journal is not None:
+                self._journal.close()
+                self._journal = None
+            os.replace(self.journal_path, self.segment_path)
+            self._journal_records = 0
+
+        self._compactor = threading.Thread(target=self._run_compaction,
+                                           name="todo-journal-compactor")
+        self._compactor.start()
+
+    def _run_compaction(self) -> None:
+        """Background thread body for compaction."""
+        try:
+            self._compact()
+        except Exception as e:
+            # The segment stays on disk and is retried on the next rotation
+            print(f"⚠ Warning: Journal compaction failed: {e}")
+
+    def _compact(self) -> None:
+        """Fold the rotated journal segment into the snapshot file."""
+        overlay = _JournalOverlay()
+        self._replay(self.segment_path, overlay)
+        reader = _MergedReader(self._snapshot_reader(), overlay)
+        tasks = list(reader)
+        atomic_write_json(self.path, build_snapshot(tasks, reader.next_id))
+        os.remove(self.segment_path)
+
+    def _wait_for_compaction(self) -> None:
+        """Block until a running background compaction has finished."""
+        if self._compactor is not None:
+            self._compactor.join()
+            self._compactor = None
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print("Usage: python todo_storage.py <source> <destination>")
+        print("       (files ending in .bin use the binary snapshot format)")
+        sys.exit(1)
+
+    sys.exit(0 if convert_snapshot(sys.argv[1], sys.argv[2]) >= 0 else 1)